@@ -1,4 +1,19 @@
+from typing import TYPE_CHECKING, Any
+
 from .models import ResultType
-from .run_queries import run_the_query
+
+if TYPE_CHECKING:
+    from .run_queries import run_the_query
+
+
+def __getattr__(name: str) -> Any:
+    # The query runner pulls in the OpenAI client and every format model, so
+    # defer it until it is actually used.
+    if name == "run_the_query":
+        from .run_queries import run_the_query
+
+        return run_the_query
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = ["ResultType", "run_the_query"]
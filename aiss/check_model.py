@@ -3,29 +3,220 @@
 This helper queries the OpenAI responses.parse endpoint using the
 `FindModelRequest` Pydantic model and returns the matching format class
 (one of the movie formats or genre-specific `*ShowInfo` formats) for
-downstream parsing/rendering.
+downstream parsing/rendering. An async variant and a batch helper are
+provided for callers classifying many inputs at once.
+
+Passing ``two_stage=True`` first asks for a plain-text answer and then has a
+smaller model format it into the schema, which avoids decoding the whole
+schema on the slower reasoning model. ``minimal=True`` drops the explanatory
+fields from the requested schema.
+
+With ``cache=True`` results are stored on disk under ``AISS_CACHE_DIR``
+(default ``~/.cache/aiss``) keyed on a hash of the input text together with
+the ``minimal`` and ``two_stage`` flags, so repeated inputs skip the API call.
 """
 
+import asyncio
+import dataclasses
+import hashlib
+import json
+import os
+from collections.abc import Sequence
+from pathlib import Path
 from typing import TYPE_CHECKING
 
+import httpx
 from dotenv import load_dotenv
-from openai import OpenAI, Timeout
+from openai import (
+    DEFAULT_CONNECTION_LIMITS,
+    AsyncOpenAI,
+    DefaultAsyncHttpxClient,
+    DefaultHttpxClient,
+    OpenAI,
+    Timeout,
+)
 from rich.console import Console
 
 # Progress UI is managed by the caller (run_queries); no progress imports here.
-from aiss.models import FindModelRequest, ModelType, ModelTypeResult
+from aiss.models import FindModelMinimalRequest, FindModelRequest, ModelType, ModelTypeResult
 
 if TYPE_CHECKING:
     from openai.types.responses.parsed_response import ParsedResponse
 
 load_dotenv()
 
+# The registry is fixed for the lifetime of the process, so the options list
+# and the instructions built from it only need to be rendered once. Keeping
+# them byte-identical across calls also lets the API reuse its prompt cache.
+_OPTIONS = ModelType.formatted_options()
+_LISTING = ModelType.instruction_listing()
+_INSTRUCTIONS = (
+    "You are an expert at classifying entertainment descriptions. "
+    f"Select the most appropriate format from {_OPTIONS} and respond using the FindModelRequest schema.\n"
+    f"{_LISTING}"
+)
+_INSTRUCTIONS_PLAIN = (
+    "You are an expert at classifying entertainment descriptions. "
+    f"Select the most appropriate format from {_OPTIONS}. Answer in plain text with the exact "
+    "format value, the properly branded title, and a short reason.\n"
+    f"{_LISTING}"
+)
+_INPUT_PREFIX = f"Find whether the following text is about a {_OPTIONS}:\n\n`"
+_PROMPT_CACHE_KEY = "aiss-find-model"
+_FORMAT_INSTRUCTIONS = "Extract the classification described in the text into the requested schema. Do not change the chosen format value."
+_FORMAT_MODEL = "gpt-4.1-mini"
+# The SDK's pool sizes already exceed what a batch needs; keep them and only
+# hold idle connections longer so gaps between batches don't force new TLS
+# handshakes.
+_CLIENT_LIMITS = httpx.Limits(
+    max_connections=DEFAULT_CONNECTION_LIMITS.max_connections,
+    max_keepalive_connections=DEFAULT_CONNECTION_LIMITS.max_keepalive_connections,
+    keepalive_expiry=30.0,
+)
+_CLIENT_TIMEOUT = Timeout(4000, connect=6.0)
+# The formatting stage only restructures a short answer, so it gets a tight budget.
+_FORMAT_TIMEOUT = Timeout(60, connect=6.0)
+_CACHE_DIR = Path(os.environ.get("AISS_CACHE_DIR", "~/.cache/aiss")).expanduser()
+
+
+def _text_format(minimal: bool) -> type[FindModelMinimalRequest]:
+    return FindModelMinimalRequest if minimal else FindModelRequest
+
+
+def _request_input(input_text: str) -> str:
+    return _INPUT_PREFIX + input_text + "`"
+
+
+def _request_kwargs(input_text: str, minimal: bool = False) -> dict:
+    """Build the keyword arguments shared by the sync and async parse calls."""
+
+    return {
+        "model": "gpt-5-mini",
+        "input": _request_input(input_text),
+        "instructions": _INSTRUCTIONS,
+        "text_format": _text_format(minimal),
+        "prompt_cache_key": _PROMPT_CACHE_KEY,
+        "timeout": _CLIENT_TIMEOUT,
+    }
+
+
+def _plain_request_kwargs(input_text: str) -> dict:
+    """Build the stage-one free-text classification request."""
+
+    return {
+        "model": "gpt-5-mini",
+        "input": _request_input(input_text),
+        "instructions": _INSTRUCTIONS_PLAIN,
+        "prompt_cache_key": _PROMPT_CACHE_KEY + "-plain",
+        "timeout": _CLIENT_TIMEOUT,
+    }
+
+
+def _format_request_kwargs(plain_text: str, minimal: bool = False) -> dict:
+    """Build the stage-two request that formats free text into the schema."""
+
+    return {
+        "model": _FORMAT_MODEL,
+        "input": plain_text,
+        "instructions": _FORMAT_INSTRUCTIONS,
+        "text_format": _text_format(minimal),
+        "timeout": _FORMAT_TIMEOUT,
+    }
+
+
+# MARK: Clients
+def make_classification_client() -> OpenAI:
+    """
+    Create an OpenAI client with a connection pool sized for classification.
+
+    Keep-alive connections are reused across calls so each request does not
+    pay for a new TLS handshake.
+
+    :return: Configured OpenAI client
+    :rtype: OpenAI
+    """
+
+    return OpenAI(http_client=DefaultHttpxClient(limits=_CLIENT_LIMITS, timeout=_CLIENT_TIMEOUT))
+
+
+def make_async_classification_client() -> AsyncOpenAI:
+    """
+    Create an AsyncOpenAI client for :func:`find_models_batch`.
+
+    Idle pooled connections are kept warm between gathered batches so
+    follow-up requests skip reconnecting.
+
+    :return: Configured AsyncOpenAI client
+    :rtype: AsyncOpenAI
+    """
+
+    return AsyncOpenAI(http_client=DefaultAsyncHttpxClient(limits=_CLIENT_LIMITS, timeout=_CLIENT_TIMEOUT))
+
+
+def _cache_key(input_text: str, minimal: bool, two_stage: bool) -> str:
+    prefix = ("two-stage:" if two_stage else "") + ("minimal:" if minimal else "")
+    return hashlib.blake2b(f"{prefix}{input_text}".encode(), digest_size=16).hexdigest()
+
+
+def _load_cached(key: str) -> ModelTypeResult:
+    """Read a cached result from disk, building a fresh result for every caller."""
+
+    data = json.loads((_CACHE_DIR / f"{key}.json").read_bytes())
+    return ModelTypeResult(
+        model_type=ModelType(data["model_type"]),
+        description=data.get("description", ""),
+        formatted_name=data.get("formatted_name", ""),
+        additional_info=data.get("additional_info"),
+    )
+
+
+def _cached_result(input_text: str, minimal: bool, two_stage: bool, console: Console) -> ModelTypeResult | None:
+    """Return the cached classification for ``input_text`` if one exists."""
+
+    try:
+        result = _load_cached(_cache_key(input_text, minimal, two_stage))
+    except (OSError, ValueError, KeyError):
+        return None
+    console.rule(f"[bold cyan]Model Type: {result.model_type}")
+    console.print("\n")
+    return result
+
+
+def _store_result(input_text: str, minimal: bool, two_stage: bool, result: ModelTypeResult | None) -> None:
+    """Persist a successful classification so later runs can reuse it."""
+
+    if result is None:
+        return
+    try:
+        _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        path = _CACHE_DIR / f"{_cache_key(input_text, minimal, two_stage)}.json"
+        path.write_text(json.dumps(dataclasses.asdict(result)), encoding="utf-8")
+    except OSError:
+        pass
+
+
+def _to_model_type_result(find_model_response: FindModelMinimalRequest | None, console: Console) -> ModelTypeResult | None:
+    """Convert the parsed classification into a :class:`ModelTypeResult`."""
+
+    if find_model_response is None:
+        console.print("[red]Failed to parse model type from input[/red]")
+        return None
+
+    console.rule(f"[bold cyan]Model Type: {find_model_response.find_model}")
+    console.print("\n")
+
+    return ModelTypeResult.from_find_request(find_model_response)
+
 
 # MARK: Model Finder
 def find_model_from_input(
     input_text: str,
     client: OpenAI,
     console: Console,
+    *,
+    two_stage: bool = False,
+    minimal: bool = False,
+    cache: bool = False,
 ) -> ModelTypeResult:
     """
 
@@ -37,36 +228,120 @@ def find_model_from_input(
     :type client: OpenAI
     :param console: Rich Console to render output to
     :type console: Console
+    :param two_stage: Classify in plain text first, then format with a smaller model
+    :type two_stage: bool
+    :param minimal: Request only the format and title fields
+    :type minimal: bool
+    :param cache: Reuse and store results in the on-disk classification cache
+    :type cache: bool
 
     :return : The determined model type class
     :rtype : ModelType
 
     """
 
-    options = ModelType.formatted_options()
-    instructions = f"""You are an expert at classifying entertainment descriptions. 
-        Select the most appropriate format from {options} and respond using the FindModelRequest schema.
-        {ModelType.instruction_listing()}"""
-
-    response: ParsedResponse[FindModelRequest] = client.responses.parse(
-        model="gpt-5-mini",
-        input=f"Find whether the following text is about a {options}:\n\n`{input_text}`",
-        instructions=instructions,
-        text_format=FindModelRequest,
-        timeout=Timeout(4000, connect=6.0),
-    )
+    if cache and (cached := _cached_result(input_text, minimal, two_stage, console)) is not None:
+        return cached
 
-    find_model_response: FindModelRequest = response.output_parsed
-    if find_model_response is None:
-        console.print("[red]Failed to parse model type from input[/red]")
-        return
+    if two_stage:
+        plain = client.responses.create(**_plain_request_kwargs(input_text))
+        response: ParsedResponse[FindModelRequest] = client.responses.parse(**_format_request_kwargs(plain.output_text, minimal))
+    else:
+        response = client.responses.parse(**_request_kwargs(input_text, minimal))
+    result = _to_model_type_result(response.output_parsed, console)
+    if cache:
+        _store_result(input_text, minimal, two_stage, result)
+    return result
 
-    console.rule(f"[bold cyan]Model Type: {find_model_response.find_model}")
-    console.print("\n")
 
-    return ModelTypeResult(
-        model_type=ModelType(find_model_response.find_model),
-        description=find_model_response.description,
-        formatted_name=find_model_response.formatted_name,
-        additional_info=find_model_response.additional_info,
+# MARK: Async Model Finder
+async def find_model_from_input_async(
+    input_text: str,
+    client: AsyncOpenAI,
+    console: Console,
+    sem: asyncio.Semaphore,
+    *,
+    two_stage: bool = False,
+    minimal: bool = False,
+    cache: bool = False,
+) -> ModelTypeResult | None:
+    """
+    Async counterpart of :func:`find_model_from_input`.
+
+    :param input_text: Input text to analyze for model type
+    :type input_text: str
+    :param client: AsyncOpenAI client instance shared across the batch
+    :type client: AsyncOpenAI
+    :param console: Rich Console to render output to
+    :type console: Console
+    :param sem: Semaphore bounding the number of in-flight requests
+    :type sem: asyncio.Semaphore
+    :param two_stage: Classify in plain text first, then format with a smaller model
+    :type two_stage: bool
+    :param minimal: Request only the format and title fields
+    :type minimal: bool
+    :param cache: Reuse and store results in the on-disk classification cache
+    :type cache: bool
+
+    :return: The determined model type result, or None when parsing failed
+    :rtype: ModelTypeResult | None
+    """
+
+    if cache and (cached := _cached_result(input_text, minimal, two_stage, console)) is not None:
+        return cached
+
+    async with sem:
+        if two_stage:
+            plain = await client.responses.create(**_plain_request_kwargs(input_text))
+            response: ParsedResponse[FindModelRequest] = await client.responses.parse(**_format_request_kwargs(plain.output_text, minimal))
+        else:
+            response = await client.responses.parse(**_request_kwargs(input_text, minimal))
+    result = _to_model_type_result(response.output_parsed, console)
+    if cache:
+        _store_result(input_text, minimal, two_stage, result)
+    return result
+
+
+async def find_models_batch(
+    texts: Sequence[str],
+    client: AsyncOpenAI,
+    console: Console,
+    concurrency: int = 20,
+    *,
+    two_stage: bool = False,
+    minimal: bool = False,
+    cache: bool = False,
+) -> list[ModelTypeResult | None | BaseException]:
+    """
+    Classify many inputs concurrently using a single AsyncOpenAI client.
+
+    Results are returned in input order. Failed requests are returned as
+    the raised exception rather than aborting the whole batch.
+
+    :param texts: Input texts to classify
+    :type texts: Sequence[str]
+    :param client: AsyncOpenAI client instance
+    :type client: AsyncOpenAI
+    :param console: Rich Console to render output to
+    :type console: Console
+    :param concurrency: Maximum number of concurrent requests (default: 20)
+    :type concurrency: int
+    :param two_stage: Classify in plain text first, then format with a smaller model
+    :type two_stage: bool
+    :param minimal: Request only the format and title fields
+    :type minimal: bool
+    :param cache: Reuse and store results in the on-disk classification cache
+    :type cache: bool
+
+    :return: One result (or exception) per input text
+    :rtype: list[ModelTypeResult | None | BaseException]
+    """
+
+    sem = asyncio.Semaphore(concurrency)
+    return await asyncio.gather(
+        *(
+            find_model_from_input_async(text, client, console, sem, two_stage=two_stage, minimal=minimal, cache=cache)
+            for text in texts
+        ),
+        return_exceptions=True,
     )
@@ -1,13 +1,100 @@
-"""Aggregated exports for film, television, and game models."""
+"""Aggregated exports for film, television, and game models.
+
+Only the lightweight shared types are imported eagerly. The format
+packages and the classification request models build Pydantic models on
+import, so their exports are resolved on first attribute access (PEP 562).
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
 
-from .find_model import FindModelRequest
-from .games import *  # noqa: F401,F403
-from .games import __all__ as _games_all
-from .movies import *  # noqa: F401,F403
-from .movies import __all__ as _movies_all
 from .shared import ModelType, ModelTypeResult, ResultType, TableSchema
-from .shows import *  # noqa: F401,F403
-from .shows import __all__ as _shows_all
+
+if TYPE_CHECKING:
+    from .find_model import FindModelMinimalRequest, FindModelRequest
+    from .games import *  # noqa: F401,F403
+    from .movies import *  # noqa: F401,F403
+    from .shows import *  # noqa: F401,F403
+
+_games_all = [
+    "ActionAdventureGameInfo",
+    "ShooterGameInfo",
+    "PuzzleStrategyGameInfo",
+    "RolePlayingGameInfo",
+    "SimulationSandboxGameInfo",
+    "SportsRacingGameInfo",
+    "HorrorSurvivalGameInfo",
+    "MmoOnlineGameInfo",
+]
+_movies_all = [
+    "ActionAdventureMovieInfo",
+    "ComedyMovieInfo",
+    "DocumentaryBiographicalMovieInfo",
+    "DramaMovieInfo",
+    "FantasyScienceFictionMovieInfo",
+    "HorrorMovieInfo",
+    "RomanceMovieInfo",
+    "ThrillerMysteryCrimeMovieInfo",
+    "DEFAULT_MOVIE_MODEL",
+    "BaseMovieInfo",
+    "CastMemberInfo",
+    "CrewMemberInfo",
+    "ProductionCompanyInfo",
+    "BoxOfficeInfo",
+    "DistributionInfo",
+    "CharacterArcInfo",
+    "ActionSetPieceInfo",
+    "HumorBeatInfo",
+    "InvestigationThreadInfo",
+    "RomanticBeatInfo",
+    "FearMomentInfo",
+    "SubjectFocusInfo",
+]
+_shows_all = [
+    "ActionAdventureFantasyShowInfo",
+    "ComedyShowInfo",
+    "DocumentaryFactualShowInfo",
+    "DramaShowInfo",
+    "FamilyAnimationKidsShowInfo",
+    "NewsInformationalShowInfo",
+    "RealityCompetitionLifestyleShowInfo",
+    "ScienceFictionShowInfo",
+    "SportsShowInfo",
+    "ThrillerShowInfo",
+    "DEFAULT_SHOW_MODEL",
+    "JsonModel",
+    "ShowFormatBase",
+    "CharInfoInfo",
+    "ProductionCompanyInfo",
+    "BroadcastInfo",
+    "DistributionInfo",
+    "AudienceEngagement",
+    "CriticalResponse",
+    "BoxOfficeInfo",
+]
+
+# Later packages win for shared names, matching the previous star-import order.
+_LAZY: dict[str, str] = {
+    **dict.fromkeys(("FindModelRequest", "FindModelMinimalRequest"), ".find_model"),
+    **dict.fromkeys(_games_all, ".games"),
+    **dict.fromkeys(_movies_all, ".movies"),
+    **dict.fromkeys(_shows_all, ".shows"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = (
     list(_movies_all)
@@ -18,6 +105,7 @@ __all__ = (
         "ModelType",
         "ModelTypeResult",
         "FindModelRequest",
+        "FindModelMinimalRequest",
         "TableSchema",
     ]
 )
@@ -5,15 +5,24 @@ This module contains the `FindModelRequest` model used by the
 available `ModelType` values (show, movie, drama, comedy, etc.).
 """
 
+import copy
+from functools import cache
+from typing import Any
+
 from pydantic import BaseModel, Field
 
 from .shared import ModelType
 
 
 # MARK: FindModelRequest
-class FindModelRequest(BaseModel):
+# Field descriptions are part of the schema sent with every request, so they
+# stay terse; the valid labels are listed once in the classification instructions.
+class FindModelMinimalRequest(BaseModel):
     """
-    Pydantic request model that captures the LLM's classification result.
+    Reduced classification schema carrying only the format and title.
+
+    Used when callers do not need the explanatory fields, so the model has
+    fewer schema tokens to emit.
 
     :param find_model: One of the values enumerated in :class:`ModelType`
     :type find_model: str
@@ -21,14 +30,47 @@ class FindModelRequest(BaseModel):
 
     find_model: str = Field(
         ModelType.SHOW.value,
-        description="The type of model to find. Valid options: " + ", ".join(f"'{model.value}'" for model in ModelType) + ".",
+        description="Classifier label; see instructions.",
     )
-    formatted_name: str = Field("", description="The name of the show, movie or game found formatted in the correct way as it was branded by the studio.")
+    formatted_name: str = Field("", description="Title as officially branded.")
+
+    @classmethod
+    def model_json_schema(cls, *args: Any, **kwargs: Any) -> dict[str, Any]:
+        """Return the JSON schema, reusing a cached copy for the default arguments.
+
+        The OpenAI SDK rebuilds the schema from ``text_format`` on every
+        ``responses.parse`` call and mutates the result, so a deep copy of the
+        cached schema is handed out instead of regenerating it.
+        """
+
+        if args or kwargs:
+            return super().model_json_schema(*args, **kwargs)
+        return copy.deepcopy(_default_json_schema(cls))
+
+
+@cache
+def _default_json_schema(model_cls: type[FindModelMinimalRequest]) -> dict[str, Any]:
+    return super(FindModelMinimalRequest, model_cls).model_json_schema()
+
+
+class FindModelRequest(FindModelMinimalRequest):
+    """
+    Pydantic request model that captures the LLM's classification result.
+
+    :param find_model: One of the values enumerated in :class:`ModelType`
+    :type find_model: str
+    """
+
     description: str = Field(
         "",
-        description="A brief description of why this model was chosen based on the input text (less than 30 characters).",
+        description="Why this label fits (under 30 characters).",
     )
     additional_info: list[str] = Field(
         default_factory=list,
-        description="Any additional information about the found model that may be useful to identify it from the input text or found about it.",
+        description="Extra identifying facts.",
     )
+
+
+# Warm the schema cache at import so the first classification call skips it.
+for _model_cls in (FindModelMinimalRequest, FindModelRequest):
+    _default_json_schema(_model_cls)
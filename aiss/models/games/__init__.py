@@ -1,13 +1,47 @@
-"""Exports for video game format models."""
-
-from .action_adventure_model import ActionAdventureGameInfo
-from .horror_survival_model import HorrorSurvivalGameInfo
-from .mmo_online_model import MmoOnlineGameInfo
-from .puzzle_strategy_model import PuzzleStrategyGameInfo
-from .role_playing_model import RolePlayingGameInfo
-from .shooter_model import ShooterGameInfo
-from .simulation_sandbox_model import SimulationSandboxGameInfo
-from .sports_racing_model import SportsRacingGameInfo
+"""Exports for video game format models.
+
+Each format module is imported on first access so that loading one game
+format does not build every other game model.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .action_adventure_model import ActionAdventureGameInfo
+    from .horror_survival_model import HorrorSurvivalGameInfo
+    from .mmo_online_model import MmoOnlineGameInfo
+    from .puzzle_strategy_model import PuzzleStrategyGameInfo
+    from .role_playing_model import RolePlayingGameInfo
+    from .shooter_model import ShooterGameInfo
+    from .simulation_sandbox_model import SimulationSandboxGameInfo
+    from .sports_racing_model import SportsRacingGameInfo
+
+_LAZY: dict[str, str] = {
+    "ActionAdventureGameInfo": ".action_adventure_model",
+    "ShooterGameInfo": ".shooter_model",
+    "PuzzleStrategyGameInfo": ".puzzle_strategy_model",
+    "RolePlayingGameInfo": ".role_playing_model",
+    "SimulationSandboxGameInfo": ".simulation_sandbox_model",
+    "SportsRacingGameInfo": ".sports_racing_model",
+    "HorrorSurvivalGameInfo": ".horror_survival_model",
+    "MmoOnlineGameInfo": ".mmo_online_model",
+}
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = [
     "ActionAdventureGameInfo",
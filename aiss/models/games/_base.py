@@ -8,54 +8,161 @@ lightweight data classes defined here for consistent table rendering.
 
 from __future__ import annotations
 
-import json
+from operator import attrgetter
 from pathlib import Path
-from typing import Any, ClassVar, List, Sequence, TypeVar
+from typing import Any, Callable, ClassVar, List, Self, Sequence
 
-from pydantic import BaseModel, Field
-from rich.console import Console
+import pydantic_core
+from pydantic import BaseModel, ConfigDict, Field
+from rich.console import Console, Group, RenderableType
 from rich.panel import Panel
 
 from aiss.utils import (
+    build_table_from_schema,
     format_money,
     format_number,
     format_runtime_minutes,
-    render_table_from_schema,
 )
 
-from ..shared import TableSchema
+from ..shared import TableSchema, TableSchemaMixin, json_keys_instructions, nested_model_fields
 
-T = TypeVar("T", bound="GameJsonModel")
 
+class GameJsonModel(TableSchemaMixin, BaseModel):
+    """Extend Pydantic with JSON convenience helpers for game data.
 
-def _dump_model(instance: BaseModel) -> dict[str, Any]:  # pragma: no cover - simple helper
-    try:
-        return instance.model_dump()
-    except AttributeError:
-        return instance.dict()  # type: ignore[call-arg]
+    JSON file helpers go straight through pydantic-core's serializer and
+    parser so no intermediate Python dict is built on either side.
+    """
 
-
-class GameJsonModel(BaseModel):
-    """Extend Pydantic with JSON convenience helpers for game data."""
+    # Game payloads are static DTOs: nested row instances are reused as-is
+    # when building a parent model and attribute writes are not re-validated.
+    # Unknown keys from model output are dropped rather than rejected.
+    # Validators are built on first use so importing a format stays cheap.
+    model_config = ConfigDict(
+        revalidate_instances="never",
+        validate_assignment=False,
+        extra="ignore",
+        defer_build=True,
+    )
 
     def to_dict(self) -> dict[str, Any]:
-        return _dump_model(self)
+        return self.model_dump(mode="python")
 
-    def to_json(self, json_file_path: Path | str) -> None:
+    def to_json(self, json_file_path: Path | str, *, indent: int | None = None) -> None:
+        """Write the model as JSON; compact unless an ``indent`` is given."""
         path = Path(json_file_path)
-        with path.open("w", encoding="utf-8") as handle:
-            json.dump(self.to_dict(), handle, ensure_ascii=False, indent=2)
+        path.write_text(self.model_dump_json(indent=indent), encoding="utf-8")
+
+    def to_json_pretty(self, json_file_path: Path | str) -> None:
+        """Write the model as human-readable JSON indented by two spaces."""
+        self.to_json(json_file_path, indent=2)
 
     @classmethod
-    def from_dict(cls: type[T], data: dict[str, Any]) -> T:
+    def from_dict(cls, data: dict[str, Any]) -> Self:
         return cls(**data)
 
     @classmethod
-    def from_json(cls: type[T], json_file_path: Path | str) -> T:
+    def from_json(cls, json_file_path: Path | str) -> Self:
+        path = Path(json_file_path)
+        return cls.model_validate_json(path.read_bytes())
+
+    # NOTE: ``model_construct`` skips validation entirely, so these helpers are
+    # only for payloads we wrote ourselves (e.g. the on-disk cache). In Pydantic
+    # v2 it can be slower than validation for flat models, but it wins clearly
+    # for the nested multi-table game schemas where validation recurses into
+    # every studio, platform and mechanic row.
+    @classmethod
+    def from_dict_trusted(cls, data: dict[str, Any]) -> Self:
+        """Build an instance from trusted data without running validation.
+
+        Also suitable for structured-output payloads the API already checked
+        against this model's JSON schema; anything else should use :meth:`from_dict`.
+
+        :param data: Mapping previously produced by :meth:`to_dict` or schema-validated upstream.
+        :return: The constructed model, with nested game models rebuilt recursively.
+        """
+        nested = nested_model_fields(cls, GameJsonModel)
+        if not nested:
+            # Leaf rows: ``model_construct`` already drops unknown keys.
+            return cls.model_construct(**data)
+        built = dict(data)
+        for name, model_type, is_list in nested:
+            value = built.get(name)
+            if value is None:
+                continue
+            if is_list:
+                built[name] = [
+                    model_type.from_dict_trusted(item) if isinstance(item, dict) else item for item in value
+                ]
+            elif isinstance(value, dict):
+                built[name] = model_type.from_dict_trusted(value)
+        return cls.model_construct(**built)
+
+    @classmethod
+    def from_json_trusted(cls, json_file_path: Path | str) -> Self:
+        """Load a trusted JSON file written by :meth:`to_json` without validation."""
         path = Path(json_file_path)
-        with path.open("r", encoding="utf-8") as handle:
-            data = json.load(handle)
-        return cls.from_dict(data)
+        return cls.from_dict_trusted(pydantic_core.from_json(path.read_bytes()))
+
+
+class GameRowModel(GameJsonModel):
+    """Immutable base for the table row value objects nested inside game formats."""
+
+    # Rows are never mutated after parsing; freezing them lets instances be
+    # shared safely (e.g. between cached payloads) and keeps accidental writes out.
+    model_config = ConfigDict(frozen=True)
+
+
+# MARK: Render steps
+# Each handler turns one section payload into renderables appended to ``items``.
+def _add_summary(model: GameFormatBase, payload: tuple[str, Sequence[str], str], items: list[RenderableType]) -> None:
+    summary_title, summary_lines, summary_style = payload
+    summary_parts = [line for line in summary_lines if line and not line.isspace()]
+    summary_body = "\n\n".join(summary_parts) if summary_parts else "(no summary provided)"
+    items.append(Panel(summary_body, title=summary_title, expand=False, style=summary_style))
+
+
+def _add_wikipedia(model: GameFormatBase, payload: Panel | None, items: list[RenderableType]) -> None:
+    if payload is not None:
+        items.append(payload)
+
+
+def _add_facts(model: GameFormatBase, payload: Sequence[tuple[str, str]], items: list[RenderableType]) -> None:
+    if payload:
+        facts_text = ", ".join(f"{label}: {value}" for label, value in payload)
+        items.append(Panel(facts_text, title=model.facts_panel_title, expand=False, style=model.facts_panel_style))
+
+
+def _add_tables(
+    model: GameFormatBase,
+    payload: Sequence[tuple[str, Sequence[TableSchema], Sequence[GameJsonModel]]],
+    items: list[RenderableType],
+) -> None:
+    for title, schema, rows in payload:
+        if rows:
+            items.append(build_table_from_schema(title, schema, list(rows)))
+
+
+def _add_extras(model: GameFormatBase, payload: Sequence[tuple[str, str, str]], items: list[RenderableType]) -> None:
+    for panel_title, body, style in payload:
+        if body:
+            items.append(Panel(body, title=panel_title, expand=False, style=style or "cyan"))
+
+
+_RENDER_DISPATCH: dict[str, Callable[[Any, Any, list[RenderableType]], None]] = {
+    "summary": _add_summary,
+    "wiki": _add_wikipedia,
+    "facts": _add_facts,
+    "tables": _add_tables,
+    "extras": _add_extras,
+}
+_RENDER_SECTIONS: tuple[tuple[str, str], ...] = (
+    ("summary", "_summary_panel"),
+    ("wiki", "_wikipedia_panel"),
+    ("facts", "_fact_pairs"),
+    ("tables", "_table_sections"),
+    ("extras", "_extra_panels"),
+)
 
 
 class GameFormatBase(GameJsonModel):
@@ -66,6 +173,16 @@ class GameFormatBase(GameJsonModel):
     summary_attributes: ClassVar[Sequence[str]] = ("core_loop", "game_summary", "elevator_pitch")
     facts_panel_title: ClassVar[str] = "Game Snapshot"
     facts_panel_style: ClassVar[str] = "blue"
+    # (section title, attribute name, row model) rendered in order when the attribute is non-empty.
+    table_specs: ClassVar[tuple[tuple[str, str, type[GameJsonModel]], ...]] = ()
+    # (panel title, style) paired in order with the bodies from ``_extra_panel_bodies``.
+    extra_panel_specs: ClassVar[tuple[tuple[str, str], ...]] = ()
+    # Per panel, the (label, attribute) lines shown as ``label: value`` when the attribute is set.
+    extra_panel_fields: ClassVar[tuple[tuple[tuple[str, str], ...], ...]] = ()
+    _summary_getters: ClassVar[tuple[Callable[[Any], Any], ...]] = ()
+    _render_steps: ClassVar[tuple[tuple[Callable[..., None], Callable[[Any], Any]], ...]] = ()
+    _summary_fallback: ClassVar[Callable[[Any], Any] | None] = None
+    _json_format_text: ClassVar[str] = ""
 
     wikipedia_summary: str = Field(
         "",
@@ -73,22 +190,55 @@ class GameFormatBase(GameJsonModel):
         description="Runtime-only hint populated after parsing for richer rendering.",
     )
 
-    def render_wikipedia_summary(self, console: Console) -> None:
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        # Resolve summary attribute lookups once per class rather than per render.
+        cls._summary_getters = tuple(
+            attrgetter(name) for name in cls.summary_attributes if name in cls.model_fields or hasattr(cls, name)
+        )
+        # ``game_summary`` is the fallback line; skip it when it was already tried above.
+        has_summary = "game_summary" in cls.model_fields or hasattr(cls, "game_summary")
+        cls._summary_fallback = (
+            attrgetter("game_summary") if has_summary and "game_summary" not in cls.summary_attributes else None
+        )
+        cls._build_render_steps()
+        get_instructions = getattr(cls, "get_instructions", None)
+        if get_instructions is not None:
+            cls._json_format_text = json_keys_instructions(get_instructions(), cls)
+
+    @classmethod
+    def json_format_instructions(cls) -> str:
+        return cls._json_format_text
+
+    @classmethod
+    def _build_render_steps(cls) -> None:
+        # Bind each section's handler and (possibly overridden) payload method once per class.
+        cls._render_steps = tuple((_RENDER_DISPATCH[kind], getattr(cls, method)) for kind, method in _RENDER_SECTIONS)
+
+    def _wikipedia_panel(self) -> Panel | None:
         hint_text = self.wikipedia_summary.strip()
         if not hint_text:
-            return
-        console.print(Panel(hint_text, title="Context", expand=False, style="yellow"))
+            return None
+        return Panel(hint_text, title="Context", expand=False, style="yellow")
+
+    def render_wikipedia_summary(self, console: Console) -> None:
+        panel = self._wikipedia_panel()
+        if panel is not None:
+            console.print(panel)
 
     def _summary_panel(self) -> tuple[str, Sequence[str], str]:
         title_value = getattr(self, "title", "") or self.summary_title_fallback
         lines: list[str] = []
-        for attribute in self.summary_attributes:
-            value = getattr(self, attribute, None)
-            if isinstance(value, str) and value.strip():
+        # Getters may resolve to properties, so keep the type check; ``isspace`` tests
+        # blank values without allocating and only real text is stripped.
+        for get in self._summary_getters:
+            value = get(self)
+            if value and isinstance(value, str) and not value.isspace():
                 lines.append(value.strip())
-        if not lines:
-            fallback = getattr(self, "game_summary", None)
-            if isinstance(fallback, str) and fallback.strip():
+        if not lines and self._summary_fallback is not None:
+            fallback = self._summary_fallback(self)
+            if fallback and isinstance(fallback, str) and not fallback.isspace():
                 lines.append(fallback.strip())
         if not lines:
             lines.append("(no summary provided)")
@@ -97,36 +247,39 @@ class GameFormatBase(GameJsonModel):
     def _fact_pairs(self) -> Sequence[tuple[str, str]]:
         return []
 
-    def _table_sections(self) -> Sequence[tuple[str, List[TableSchema], Sequence[GameJsonModel]]]:
-        return []
+    def _table_sections(self) -> Sequence[tuple[str, Sequence[TableSchema], Sequence[GameJsonModel]]]:
+        return [
+            (label, row_model.table_schema_shared(), rows)
+            for label, attribute, row_model in self.table_specs
+            if (rows := getattr(self, attribute))
+        ]
+
+    def _extra_panel_bodies(self) -> Sequence[str]:
+        return tuple(
+            "\n".join(f"{label}: {value}" for label, attribute in fields if (value := getattr(self, attribute)))
+            for fields in self.extra_panel_fields
+        )
 
     def _extra_panels(self) -> Sequence[tuple[str, str, str]]:
-        return []
+        # Blank bodies are dropped here so sparse models hand no empty panels downstream.
+        return [
+            (title, body, style)
+            for (title, style), body in zip(self.extra_panel_specs, self._extra_panel_bodies())
+            if body
+        ]
 
     def render(self, console: Console) -> None:
-        summary_title, summary_lines, summary_style = self._summary_panel()
-        summary_body = "\n\n".join(line for line in summary_lines if line.strip())
-        if not summary_body.strip():
-            summary_body = "(no summary provided)"
-        console.print(Panel(summary_body, title=summary_title, expand=False, style=summary_style))
-
-        self.render_wikipedia_summary(console)
-
-        fact_pairs = list(self._fact_pairs())
-        if fact_pairs:
-            facts_text = ", ".join(f"{label}: {value}" for label, value in fact_pairs)
-            console.print(Panel(facts_text, title=self.facts_panel_title, expand=False, style=self.facts_panel_style))
+        # Collect every section and print once: one lock, width measurement and write.
+        items: list[RenderableType] = []
+        for handler, step in self._render_steps:
+            handler(self, step(self), items)
+        console.print(Group(*items))
 
-        for title, schema, rows in self._table_sections():
-            if rows:
-                render_table_from_schema(title, schema, list(rows), console)
 
-        for panel_title, body, style in self._extra_panels():
-            if body:
-                console.print(Panel(body, title=panel_title, expand=False, style=style or "cyan"))
+GameFormatBase._build_render_steps()
 
 
-class StudioProfile(GameJsonModel):
+class StudioProfile(GameRowModel):
     """Developer or publishing studio contribution."""
 
     name: str = Field("", description="Studio name")
@@ -137,7 +290,7 @@ class StudioProfile(GameJsonModel):
     technology_stack: list[str] = Field(default_factory=list, description="Key tools, engines, or pipelines used")
 
     @classmethod
-    def table_schema(cls) -> List[TableSchema]:
+    def _build_table_schema(cls) -> List[TableSchema]:
         return [
             TableSchema(name="name", header="Studio", style="magenta", no_wrap=True),
             TableSchema(name="role", header="Role", style="cyan"),
@@ -147,7 +300,7 @@ class StudioProfile(GameJsonModel):
         ]
 
 
-class PlatformReleaseInfo(GameJsonModel):
+class PlatformReleaseInfo(GameRowModel):
     """Platform-specific release details."""
 
     platform: str = Field("", description="Platform name (console, PC storefront, cloud)")
@@ -158,7 +311,7 @@ class PlatformReleaseInfo(GameJsonModel):
     platform_features: list[str] = Field(default_factory=list, description="Unique platform features supported")
 
     @classmethod
-    def table_schema(cls) -> List[TableSchema]:
+    def _build_table_schema(cls) -> List[TableSchema]:
         return [
             TableSchema(name="platform", header="Platform", style="magenta", no_wrap=True),
             TableSchema(name="release_date", header="Release", style="cyan"),
@@ -168,7 +321,7 @@ class PlatformReleaseInfo(GameJsonModel):
         ]
 
 
-class GameplayMechanicHighlight(GameJsonModel):
+class GameplayMechanicHighlight(GameRowModel):
     """Signature gameplay mechanic or system."""
 
     mechanic: str = Field("", description="Mechanic or system name")
@@ -178,7 +331,7 @@ class GameplayMechanicHighlight(GameJsonModel):
     mastery_curve: str = Field("", description="Skill depth or learning curve")
 
     @classmethod
-    def table_schema(cls) -> List[TableSchema]:
+    def _build_table_schema(cls) -> List[TableSchema]:
         return [
             TableSchema(name="mechanic", header="Mechanic", style="magenta", no_wrap=True),
             TableSchema(name="category", header="Category", style="cyan"),
@@ -187,7 +340,7 @@ class GameplayMechanicHighlight(GameJsonModel):
         ]
 
 
-class MultiplayerModeInfo(GameJsonModel):
+class MultiplayerModeInfo(GameRowModel):
     """Multiplayer mode descriptor."""
 
     mode_name: str = Field("", description="Mode name")
@@ -198,7 +351,7 @@ class MultiplayerModeInfo(GameJsonModel):
     description: str = Field("", description="Summary of objectives or flow")
 
     @classmethod
-    def table_schema(cls) -> List[TableSchema]:
+    def _build_table_schema(cls) -> List[TableSchema]:
         return [
             TableSchema(name="mode_name", header="Mode", style="magenta", no_wrap=True),
             TableSchema(name="mode_type", header="Type", style="cyan"),
@@ -208,7 +361,7 @@ class MultiplayerModeInfo(GameJsonModel):
         ]
 
 
-class LiveServiceEventInfo(GameJsonModel):
+class LiveServiceEventInfo(GameRowModel):
     """Live operations or seasonal event entry."""
 
     event_name: str = Field("", description="Event name")
@@ -218,7 +371,7 @@ class LiveServiceEventInfo(GameJsonModel):
     retention_goal: str = Field("", description="Player behaviour the event targets")
 
     @classmethod
-    def table_schema(cls) -> List[TableSchema]:
+    def _build_table_schema(cls) -> List[TableSchema]:
         return [
             TableSchema(name="event_name", header="Event", style="magenta"),
             TableSchema(name="cadence", header="Cadence", style="cyan"),
@@ -227,7 +380,7 @@ class LiveServiceEventInfo(GameJsonModel):
         ]
 
 
-class AccessibilityFeatureInfo(GameJsonModel):
+class AccessibilityFeatureInfo(GameRowModel):
     """Accessibility option support."""
 
     feature: str = Field("", description="Feature name")
@@ -236,7 +389,7 @@ class AccessibilityFeatureInfo(GameJsonModel):
     platform_support: list[str] = Field(default_factory=list, description="Platforms where the feature ships")
 
     @classmethod
-    def table_schema(cls) -> List[TableSchema]:
+    def _build_table_schema(cls) -> List[TableSchema]:
         return [
             TableSchema(name="feature", header="Feature", style="magenta"),
             TableSchema(name="status", header="Status", style="cyan"),
@@ -244,7 +397,7 @@ class AccessibilityFeatureInfo(GameJsonModel):
         ]
 
 
-class ProgressionTrackInfo(GameJsonModel):
+class ProgressionTrackInfo(GameRowModel):
     """Progression layer or upgrade path."""
 
     track_name: str = Field("", description="Track or system name")
@@ -254,7 +407,7 @@ class ProgressionTrackInfo(GameJsonModel):
     hard_cap: int | None = Field(None, description="Level or score cap if applicable")
 
     @classmethod
-    def table_schema(cls) -> List[TableSchema]:
+    def _build_table_schema(cls) -> List[TableSchema]:
         return [
             TableSchema(name="track_name", header="Track", style="magenta"),
             TableSchema(name="track_type", header="Type", style="cyan"),
@@ -263,7 +416,7 @@ class ProgressionTrackInfo(GameJsonModel):
         ]
 
 
-class NarrativeBeatInfo(GameJsonModel):
+class NarrativeBeatInfo(GameRowModel):
     """Narrative beat or quest milestone."""
 
     beat_name: str = Field("", description="Beat name")
@@ -272,7 +425,7 @@ class NarrativeBeatInfo(GameJsonModel):
     emotional_tone: str = Field("", description="Tone or mood")
 
     @classmethod
-    def table_schema(cls) -> List[TableSchema]:
+    def _build_table_schema(cls) -> List[TableSchema]:
         return [
             TableSchema(name="beat_name", header="Beat", style="magenta"),
             TableSchema(name="synopsis", header="Synopsis", style="cyan"),
@@ -281,7 +434,7 @@ class NarrativeBeatInfo(GameJsonModel):
         ]
 
 
-class AudioDesignCue(GameJsonModel):
+class AudioDesignCue(GameRowModel):
     """Audio design highlight."""
 
     cue_name: str = Field("", description="Cue title or track")
@@ -290,7 +443,7 @@ class AudioDesignCue(GameJsonModel):
     gameplay_trigger: str = Field("", description="When/why the cue plays")
 
     @classmethod
-    def table_schema(cls) -> List[TableSchema]:
+    def _build_table_schema(cls) -> List[TableSchema]:
         return [
             TableSchema(name="cue_name", header="Cue", style="magenta"),
             TableSchema(name="composer", header="Composer", style="cyan"),
@@ -299,7 +452,7 @@ class AudioDesignCue(GameJsonModel):
         ]
 
 
-class EconomyModelInfo(GameJsonModel):
+class EconomyModelInfo(GameRowModel):
     """In-game economy or monetisation model."""
 
     currency: str = Field("", description="Currency name")
@@ -309,7 +462,7 @@ class EconomyModelInfo(GameJsonModel):
     average_spend: int | None = Field(None, description="Average spend or price point in cents")
 
     @classmethod
-    def table_schema(cls) -> List[TableSchema]:
+    def _build_table_schema(cls) -> List[TableSchema]:
         return [
             TableSchema(name="currency", header="Currency", style="magenta"),
             TableSchema(name="monetisation_type", header="Type", style="cyan"),
@@ -318,7 +471,7 @@ class EconomyModelInfo(GameJsonModel):
         ]
 
 
-class EconomyLoopInfo(GameJsonModel):
+class EconomyLoopInfo(GameRowModel):
     """Loop describing currency flow or resource economy."""
 
     loop_name: str = Field("", description="Loop or system name")
@@ -329,7 +482,7 @@ class EconomyLoopInfo(GameJsonModel):
     retention_goal: str = Field("", description="Retention or behavioural goal")
 
     @classmethod
-    def table_schema(cls) -> List[TableSchema]:
+    def _build_table_schema(cls) -> List[TableSchema]:
         return [
             TableSchema(name="loop_name", header="Loop", style="magenta"),
             TableSchema(name="loop_type", header="Type", style="cyan"),
@@ -338,7 +491,7 @@ class EconomyLoopInfo(GameJsonModel):
         ]
 
 
-class TechnicalBenchmarkInfo(GameJsonModel):
+class TechnicalBenchmarkInfo(GameRowModel):
     """Technical benchmark or performance target."""
 
     scenario: str = Field("", description="Scenario or location")
@@ -348,7 +501,7 @@ class TechnicalBenchmarkInfo(GameJsonModel):
     optimisation_notes: str = Field("", description="Key optimisation notes")
 
     @classmethod
-    def table_schema(cls) -> List[TableSchema]:
+    def _build_table_schema(cls) -> List[TableSchema]:
         return [
             TableSchema(name="scenario", header="Scenario", style="magenta"),
             TableSchema(name="hardware_profile", header="Hardware", style="cyan"),
@@ -357,7 +510,7 @@ class TechnicalBenchmarkInfo(GameJsonModel):
         ]
 
 
-class EsportsEventInfo(GameJsonModel):
+class EsportsEventInfo(GameRowModel):
     """Esports ecosystem entry."""
 
     event_name: str = Field("", description="Event or league name")
@@ -368,7 +521,7 @@ class EsportsEventInfo(GameJsonModel):
     format_notes: str = Field("", description="Notable format or rule set details")
 
     @classmethod
-    def table_schema(cls) -> List[TableSchema]:
+    def _build_table_schema(cls) -> List[TableSchema]:
         return [
             TableSchema(name="event_name", header="Event", style="magenta"),
             TableSchema(name="tier", header="Tier", style="cyan"),
@@ -377,7 +530,7 @@ class EsportsEventInfo(GameJsonModel):
         ]
 
 
-class SessionProfileInfo(GameJsonModel):
+class SessionProfileInfo(GameRowModel):
     """Average play session characteristics."""
 
     activity: str = Field("", description="Activity focus for the session")
@@ -386,7 +539,7 @@ class SessionProfileInfo(GameJsonModel):
     engagement_metric: str = Field("", description="Metric tracked (DAU, retention)")
 
     @classmethod
-    def table_schema(cls) -> List[TableSchema]:
+    def _build_table_schema(cls) -> List[TableSchema]:
         return [
             TableSchema(name="activity", header="Activity", style="magenta"),
             TableSchema(
@@ -401,7 +554,7 @@ class SessionProfileInfo(GameJsonModel):
         ]
 
 
-class SocialFeatureInfo(GameJsonModel):
+class SocialFeatureInfo(GameRowModel):
     """Social system descriptor for persistent games."""
 
     feature_name: str = Field("", description="Feature or system name")
@@ -411,7 +564,7 @@ class SocialFeatureInfo(GameJsonModel):
     retention_role: str = Field("", description="How the feature supports retention")
 
     @classmethod
-    def table_schema(cls) -> List[TableSchema]:
+    def _build_table_schema(cls) -> List[TableSchema]:
         return [
             TableSchema(name="feature_name", header="Feature", style="magenta"),
             TableSchema(name="surface_area", header="Surface", style="cyan"),
@@ -420,9 +573,32 @@ class SocialFeatureInfo(GameJsonModel):
         ]
 
 
+# Warm the schema cache at import so the first render doesn't pay for it.
+for _row_cls in (
+    StudioProfile,
+    PlatformReleaseInfo,
+    GameplayMechanicHighlight,
+    MultiplayerModeInfo,
+    LiveServiceEventInfo,
+    AccessibilityFeatureInfo,
+    ProgressionTrackInfo,
+    NarrativeBeatInfo,
+    AudioDesignCue,
+    EconomyModelInfo,
+    EconomyLoopInfo,
+    TechnicalBenchmarkInfo,
+    EsportsEventInfo,
+    SessionProfileInfo,
+    SocialFeatureInfo,
+):
+    _row_cls.table_schema_shared()
+del _row_cls
+
+
 __all__ = [
     "GameFormatBase",
     "GameJsonModel",
+    "GameRowModel",
     "StudioProfile",
     "PlatformReleaseInfo",
     "GameplayMechanicHighlight",
@@ -2,18 +2,19 @@
 
 from __future__ import annotations
 
-from typing import ClassVar, List, Sequence
+from typing import ClassVar, Final, Sequence
 
 from pydantic import Field
 
-from aiss.utils import format_number, format_year
+from aiss.utils import format_list, format_number, format_year
 
-from ..shared import TableSchema, compose_instructions
+from ..shared import compose_instructions
 from ._base import (
     AccessibilityFeatureInfo,
     AudioDesignCue,
     GameFormatBase,
     GameplayMechanicHighlight,
+    GameRowModel,
     LiveServiceEventInfo,
     NarrativeBeatInfo,
     PlatformReleaseInfo,
@@ -22,7 +23,7 @@ from ._base import (
     TechnicalBenchmarkInfo,
 )
 
-instructions = (
+instructions: Final[str] = (
     "Act as a franchise creative director compiling an executive briefing for an action-adventure video game. "
     "Detail the playable hero, world exploration structure, combat pillars, puzzle cadence, and how progression layers sustain player agency. "
     "Highlight signature mechanics, quest arcs, platform release nuances, accessibility support, and technical performance notes so the project feels production-ready."
@@ -38,6 +39,22 @@ class ActionAdventureGameInfo(GameFormatBase):
 
     summary_title_fallback: ClassVar[str] = "Action / Adventure Game"
     summary_attributes: ClassVar[Sequence[str]] = ("core_loop", "game_summary")
+    table_specs: ClassVar[tuple[tuple[str, str, type[GameRowModel]], ...]] = (
+        ("Developers", "developers", StudioProfile),
+        ("Publishers", "publishers", StudioProfile),
+        ("Platform Releases", "platform_releases", PlatformReleaseInfo),
+        ("Signature Mechanics", "signature_mechanics", GameplayMechanicHighlight),
+        ("Progression Tracks", "progression_tracks", ProgressionTrackInfo),
+        ("Narrative Beats", "narrative_beats", NarrativeBeatInfo),
+        ("Live Content", "live_events", LiveServiceEventInfo),
+        ("Accessibility", "accessibility_features", AccessibilityFeatureInfo),
+        ("Technical Benchmarks", "technical_benchmarks", TechnicalBenchmarkInfo),
+        ("Audio Design", "audio_design", AudioDesignCue),
+    )
+    extra_panel_specs: ClassVar[tuple[tuple[str, str], ...]] = (
+        ("World & Protagonist", "cyan"),
+        ("Endgame Loop", "magenta"),
+    )
 
     title: str = Field("", description="Game title")
     game_summary: str = Field("", description="Expanded overview of the campaign and player fantasy")
@@ -74,69 +91,21 @@ class ActionAdventureGameInfo(GameFormatBase):
 
     @staticmethod
     def get_user_prompt(name: str) -> str:
-        return (
-            "Develop a full action-adventure executive brief for '"
-            + name
-            +"', covering world identity, hero journey, combat and exploration pillars, and how progression plus live content sustain players."
-        )
-
-    @staticmethod
-    def json_format_instructions() -> str:
-        return (
-            instructions
-            + "\nOUTPUT FORMAT:\nReturn JSON with keys such as title, game_summary, core_loop, world_setting, hero_profile, camera_perspective, release_year, "
-            "average_completion_hours, completionist_hours, exploration_focus, combat_identity, puzzle_integrations, difficulty_modes, monetisation_model, "
-            "endgame_structure, player_agency_features, platforms, developers, publishers, platform_releases, signature_mechanics, progression_tracks, "
-            "narrative_beats, live_events, accessibility_features, technical_benchmarks, audio_design."
-        )
-
-    def _summary_panel(self) -> tuple[str, Sequence[str], str]:
-        title = self.title or self.summary_title_fallback
-        lines = [line for line in (self.core_loop, self.game_summary) if isinstance(line, str) and line.strip()]
-        if not lines:
-            lines.append("(no summary provided)")
-        return title, lines, self.summary_panel_style
+        return f"Develop a full action-adventure executive brief for '{name}', covering world identity, hero journey, combat and exploration pillars, and how progression plus live content sustain players."
 
     def _fact_pairs(self) -> Sequence[tuple[str, str]]:
-        return [
+        return (
             ("Release Year", format_year(self.release_year)),
             ("Completion (hrs)", format_number(self.average_completion_hours) if self.average_completion_hours else "-"),
-            (
-                "Completionist",
-                format_number(self.completionist_hours) if self.completionist_hours else "-",
-            ),
-            ("Exploration", ", ".join(self.exploration_focus.split(";")) if self.exploration_focus else "-"),
-            ("Combat", ", ".join(self.combat_identity) if self.combat_identity else "-"),
-            ("Difficulty", ", ".join(self.difficulty_modes) if self.difficulty_modes else "-"),
-            ("Platforms", ", ".join(self.platforms) if self.platforms else "-"),
+            ("Completionist", format_number(self.completionist_hours) if self.completionist_hours else "-"),
+            ("Exploration", self.exploration_focus.replace(";", ", ") or "-"),
+            ("Combat", format_list(self.combat_identity)),
+            ("Difficulty", format_list(self.difficulty_modes)),
+            ("Platforms", format_list(self.platforms)),
             ("Monetisation", self.monetisation_model or "-"),
-        ]
-
-    def _table_sections(self) -> Sequence[tuple[str, List[TableSchema], Sequence]]:
-        sections: list[tuple[str, List[TableSchema], Sequence]] = []
-        if self.developers:
-            sections.append(("Developers", StudioProfile.table_schema(), self.developers))
-        if self.publishers:
-            sections.append(("Publishers", StudioProfile.table_schema(), self.publishers))
-        if self.platform_releases:
-            sections.append(("Platform Releases", PlatformReleaseInfo.table_schema(), self.platform_releases))
-        if self.signature_mechanics:
-            sections.append(("Signature Mechanics", GameplayMechanicHighlight.table_schema(), self.signature_mechanics))
-        if self.progression_tracks:
-            sections.append(("Progression Tracks", ProgressionTrackInfo.table_schema(), self.progression_tracks))
-        if self.narrative_beats:
-            sections.append(("Narrative Beats", NarrativeBeatInfo.table_schema(), self.narrative_beats))
-        if self.live_events:
-            sections.append(("Live Content", LiveServiceEventInfo.table_schema(), self.live_events))
-        if self.accessibility_features:
-            sections.append(("Accessibility", AccessibilityFeatureInfo.table_schema(), self.accessibility_features))
-        if self.technical_benchmarks:
-            sections.append(("Technical Benchmarks", TechnicalBenchmarkInfo.table_schema(), self.technical_benchmarks))
-        if self.audio_design:
-            sections.append(("Audio Design", AudioDesignCue.table_schema(), self.audio_design))
-        return sections
-
-    def _extra_panels(self) -> Sequence[tuple[str, str, str]]:
+        )
+
+    def _extra_panel_bodies(self) -> Sequence[str]:
         world_details = []
         if self.world_setting:
             world_details.append(f"Setting: {self.world_setting}")
@@ -150,10 +119,7 @@ class ActionAdventureGameInfo(GameFormatBase):
 
         endgame_panel = self.endgame_structure.strip() if self.endgame_structure else ""
 
-        return [
-            ("World & Protagonist", world_panel, "cyan"),
-            ("Endgame Loop", endgame_panel, "magenta"),
-        ]
+        return world_panel, endgame_panel
 
 
 __all__ = ["ActionAdventureGameInfo"]
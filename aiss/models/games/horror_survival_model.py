@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import ClassVar, List, Sequence
+from typing import ClassVar, Final, List, Sequence
 
 from pydantic import Field
 
@@ -13,8 +13,8 @@ from ._base import (
     AccessibilityFeatureInfo,
     AudioDesignCue,
     GameFormatBase,
-    GameJsonModel,
     GameplayMechanicHighlight,
+    GameRowModel,
     LiveServiceEventInfo,
     NarrativeBeatInfo,
     PlatformReleaseInfo,
@@ -22,10 +22,10 @@ from ._base import (
     StudioProfile,
 )
 
-instructions = "Summarise a horror or survival game as a fear architect. Explain tone, threats, survival resource tension, pacing, and how players manage vulnerability. Include level or scenario structure, co-op support, live updates, monetisation, and accessibility for scares."
+instructions: Final[str] = "Summarise a horror or survival game as a fear architect. Explain tone, threats, survival resource tension, pacing, and how players manage vulnerability. Include level or scenario structure, co-op support, live updates, monetisation, and accessibility for scares."
 
 
-class ThreatProfile(GameJsonModel):
+class ThreatProfile(GameRowModel):
     """Primary threat or antagonist archetype."""
 
     name: str = Field("", description="Threat name")
@@ -34,7 +34,7 @@ class ThreatProfile(GameJsonModel):
     counterplay: str = Field("", description="Counterplay or survival strategy")
 
     @classmethod
-    def table_schema(cls) -> List[TableSchema]:
+    def _build_table_schema(cls) -> List[TableSchema]:
         return [
             TableSchema(name="name", header="Threat", style="magenta"),
             TableSchema(name="behaviour", header="Behaviour", style="cyan"),
@@ -43,7 +43,7 @@ class ThreatProfile(GameJsonModel):
         ]
 
 
-class SurvivalResourceProfile(GameJsonModel):
+class SurvivalResourceProfile(GameRowModel):
     """Critical survival resource or crafting loop."""
 
     resource_name: str = Field("", description="Resource name")
@@ -52,7 +52,7 @@ class SurvivalResourceProfile(GameJsonModel):
     usage_pressure: str = Field("", description="Consumption pressure or trade-offs")
 
     @classmethod
-    def table_schema(cls) -> List[TableSchema]:
+    def _build_table_schema(cls) -> List[TableSchema]:
         return [
             TableSchema(name="resource_name", header="Resource", style="magenta"),
             TableSchema(name="scarcity_model", header="Scarcity", style="cyan"),
@@ -61,7 +61,7 @@ class SurvivalResourceProfile(GameJsonModel):
         ]
 
 
-class ScenarioStructureProfile(GameJsonModel):
+class ScenarioStructureProfile(GameRowModel):
     """Mission, chapter, or scenario structure element."""
 
     scenario_name: str = Field("", description="Scenario or level name")
@@ -70,7 +70,7 @@ class ScenarioStructureProfile(GameJsonModel):
     coop_support: str = Field("", description="Co-op support or player count")
 
     @classmethod
-    def table_schema(cls) -> List[TableSchema]:
+    def _build_table_schema(cls) -> List[TableSchema]:
         return [
             TableSchema(name="scenario_name", header="Scenario", style="magenta"),
             TableSchema(name="objective", header="Objective", style="cyan"),
@@ -88,6 +88,34 @@ class HorrorSurvivalGameInfo(GameFormatBase):
 
     summary_title_fallback: ClassVar[str] = "Horror / Survival Game"
     summary_attributes: ClassVar[Sequence[str]] = ("core_loop", "game_summary")
+    table_specs: ClassVar[tuple[tuple[str, str, type[GameRowModel]], ...]] = (
+        ("Developers", "developers", StudioProfile),
+        ("Publishers", "publishers", StudioProfile),
+        ("Platform Releases", "platform_releases", PlatformReleaseInfo),
+        ("Threats", "threats", ThreatProfile),
+        ("Resources", "survival_resources", SurvivalResourceProfile),
+        ("Scenarios", "scenarios", ScenarioStructureProfile),
+        ("Mechanics", "mechanics", GameplayMechanicHighlight),
+        ("Narrative", "narrative_beats", NarrativeBeatInfo),
+        ("Progression", "progression_tracks", ProgressionTrackInfo),
+        ("Live Ops", "live_events", LiveServiceEventInfo),
+        ("Accessibility", "accessibility_features", AccessibilityFeatureInfo),
+        ("Audio Design", "audio_design", AudioDesignCue),
+    )
+    extra_panel_specs: ClassVar[tuple[tuple[str, str], ...]] = (
+        ("Fear Design", "cyan"),
+        ("Survival Plan", "magenta"),
+    )
+    extra_panel_fields: ClassVar[tuple[tuple[tuple[str, str], ...], ...]] = (
+        (
+            ("Threat Philosophy", "threat_design_philosophy"),
+            ("Vulnerability", "vulnerability_model"),
+        ),
+        (
+            ("Subgenre", "horror_subgenre"),
+            ("Live Strategy", "live_update_strategy"),
+        ),
+    )
 
     title: str = Field("", description="Game title")
     game_summary: str = Field("", description="Tone and hook")
@@ -120,86 +148,17 @@ class HorrorSurvivalGameInfo(GameFormatBase):
 
     @staticmethod
     def get_user_prompt(name: str) -> str:
-        return "Provide a horror or survival blueprint for '" + name + "', detailing threats, resource tension, scenarios, co-op, monetisation, and live update strategy."
-
-    @staticmethod
-    def json_format_instructions() -> str:
-        return (
-            instructions + "\nOUTPUT FORMAT:\nReturn JSON with keys like title, game_summary, core_loop, horror_subgenre, threat_design_philosophy, tension_delivery, "
-            "vulnerability_model, monetisation_model, live_update_strategy, release_year, average_session_minutes, developers, publishers, platform_releases, threats, "
-            "survival_resources, scenarios, mechanics, narrative_beats, progression_tracks, live_events, accessibility_features, audio_design."
-        )
-
-    def _summary_panel(self) -> tuple[str, Sequence[str], str]:
-        title = self.title or self.summary_title_fallback
-        lines = [line for line in (self.core_loop, self.game_summary) if isinstance(line, str) and line.strip()]
-        if not lines:
-            lines.append("(no summary provided)")
-        return title, lines, self.summary_panel_style
+        return f"Provide a horror or survival blueprint for '{name}', detailing threats, resource tension, scenarios, co-op, monetisation, and live update strategy."
 
     def _fact_pairs(self) -> Sequence[tuple[str, str]]:
-        return [
+        minutes = self.average_session_minutes
+        return (
             ("Release Year", format_year(self.release_year)),
-            (
-                "Session Length",
-                format_number(self.average_session_minutes) + " min" if self.average_session_minutes else "-",
-            ),
+            ("Session Length", f"{format_number(minutes)} min" if minutes else "-"),
             ("Subgenre", self.horror_subgenre or "-"),
             ("Tension Delivery", self.tension_delivery or "-"),
             ("Monetisation", self.monetisation_model or "-"),
-        ]
-
-    def _table_sections(self) -> Sequence[tuple[str, List[TableSchema], Sequence]]:
-        sections: list[tuple[str, List[TableSchema], Sequence]] = []
-        if self.developers:
-            sections.append(("Developers", StudioProfile.table_schema(), self.developers))
-        if self.publishers:
-            sections.append(("Publishers", StudioProfile.table_schema(), self.publishers))
-        if self.platform_releases:
-            sections.append(("Platform Releases", PlatformReleaseInfo.table_schema(), self.platform_releases))
-        if self.threats:
-            sections.append(("Threats", ThreatProfile.table_schema(), self.threats))
-        if self.survival_resources:
-            sections.append(("Resources", SurvivalResourceProfile.table_schema(), self.survival_resources))
-        if self.scenarios:
-            sections.append(("Scenarios", ScenarioStructureProfile.table_schema(), self.scenarios))
-        if self.mechanics:
-            sections.append(("Mechanics", GameplayMechanicHighlight.table_schema(), self.mechanics))
-        if self.narrative_beats:
-            sections.append(("Narrative", NarrativeBeatInfo.table_schema(), self.narrative_beats))
-        if self.progression_tracks:
-            sections.append(("Progression", ProgressionTrackInfo.table_schema(), self.progression_tracks))
-        if self.live_events:
-            sections.append(("Live Ops", LiveServiceEventInfo.table_schema(), self.live_events))
-        if self.accessibility_features:
-            sections.append(("Accessibility", AccessibilityFeatureInfo.table_schema(), self.accessibility_features))
-        if self.audio_design:
-            sections.append(("Audio Design", AudioDesignCue.table_schema(), self.audio_design))
-        return sections
-
-    def _extra_panels(self) -> Sequence[tuple[str, str, str]]:
-        dread_panel = "\n".join(
-            filter(
-                None,
-                (
-                    f"Threat Philosophy: {self.threat_design_philosophy}" if self.threat_design_philosophy else "",
-                    f"Vulnerability: {self.vulnerability_model}" if self.vulnerability_model else "",
-                ),
-            )
         )
-        survival_panel = "\n".join(
-            filter(
-                None,
-                (
-                    f"Subgenre: {self.horror_subgenre}" if self.horror_subgenre else "",
-                    f"Live Strategy: {self.live_update_strategy}" if self.live_update_strategy else "",
-                ),
-            )
-        )
-        return [
-            ("Fear Design", dread_panel, "cyan"),
-            ("Survival Plan", survival_panel, "magenta"),
-        ]
 
 
 __all__ = [
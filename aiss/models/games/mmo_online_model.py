@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import ClassVar, List, Sequence
+from typing import ClassVar, Final, List, Sequence
 
 from pydantic import Field
 
@@ -14,8 +14,8 @@ from ._base import (
     AudioDesignCue,
     EconomyLoopInfo,
     GameFormatBase,
-    GameJsonModel,
     GameplayMechanicHighlight,
+    GameRowModel,
     LiveServiceEventInfo,
     NarrativeBeatInfo,
     PlatformReleaseInfo,
@@ -24,10 +24,10 @@ from ._base import (
     StudioProfile,
 )
 
-instructions = "Summarise an MMO or persistent online game as a live service director. Outline world structure, social systems, endgame loops, monetisation pillars, and operations cadence. Highlight server architecture, matchmaking, competitive ladders, community programs, and retention levers."
+instructions: Final[str] = "Summarise an MMO or persistent online game as a live service director. Outline world structure, social systems, endgame loops, monetisation pillars, and operations cadence. Highlight server architecture, matchmaking, competitive ladders, community programs, and retention levers."
 
 
-class ServerArchitectureProfile(GameJsonModel):
+class ServerArchitectureProfile(GameRowModel):
     """Server or shard architecture details."""
 
     name: str = Field("", description="Server architecture or shard name")
@@ -36,7 +36,7 @@ class ServerArchitectureProfile(GameJsonModel):
     region_support: str = Field("", description="Region or localisation coverage")
 
     @classmethod
-    def table_schema(cls) -> List[TableSchema]:
+    def _build_table_schema(cls) -> List[TableSchema]:
         return [
             TableSchema(name="name", header="Architecture", style="magenta"),
             TableSchema(name="capacity", header="Capacity", style="cyan"),
@@ -45,7 +45,7 @@ class ServerArchitectureProfile(GameJsonModel):
         ]
 
 
-class EndgameActivityProfile(GameJsonModel):
+class EndgameActivityProfile(GameRowModel):
     """Endgame loop or pinnacle activity."""
 
     activity_name: str = Field("", description="Activity or mode name")
@@ -54,7 +54,7 @@ class EndgameActivityProfile(GameJsonModel):
     rewards: list[str] = Field(default_factory=list, description="Reward highlights")
 
     @classmethod
-    def table_schema(cls) -> List[TableSchema]:
+    def _build_table_schema(cls) -> List[TableSchema]:
         return [
             TableSchema(name="activity_name", header="Activity", style="magenta"),
             TableSchema(name="description", header="Description", style="cyan"),
@@ -62,7 +62,7 @@ class EndgameActivityProfile(GameJsonModel):
         ]
 
 
-class CommunityProgramProfile(GameJsonModel):
+class CommunityProgramProfile(GameRowModel):
     """Community or creator program."""
 
     program_name: str = Field("", description="Program name")
@@ -71,7 +71,7 @@ class CommunityProgramProfile(GameJsonModel):
     incentives: list[str] = Field(default_factory=list, description="Incentives or rewards")
 
     @classmethod
-    def table_schema(cls) -> List[TableSchema]:
+    def _build_table_schema(cls) -> List[TableSchema]:
         return [
             TableSchema(name="program_name", header="Program", style="magenta"),
             TableSchema(name="focus", header="Focus", style="cyan"),
@@ -88,6 +88,36 @@ class MmoOnlineGameInfo(GameFormatBase):
 
     summary_title_fallback: ClassVar[str] = "MMO / Online Service Game"
     summary_attributes: ClassVar[Sequence[str]] = ("core_loop", "game_summary")
+    table_specs: ClassVar[tuple[tuple[str, str, type[GameRowModel]], ...]] = (
+        ("Developers", "developers", StudioProfile),
+        ("Publishers", "publishers", StudioProfile),
+        ("Platform Releases", "platform_releases", PlatformReleaseInfo),
+        ("Server Architecture", "server_architecture", ServerArchitectureProfile),
+        ("Social Systems", "social_features", SocialFeatureInfo),
+        ("Mechanics", "mechanics", GameplayMechanicHighlight),
+        ("Progression", "progression_tracks", ProgressionTrackInfo),
+        ("Economy", "economy_loops", EconomyLoopInfo),
+        ("Endgame", "endgame_activities", EndgameActivityProfile),
+        ("Live Ops", "live_events", LiveServiceEventInfo),
+        ("Community Programs", "community_programs", CommunityProgramProfile),
+        ("Narrative", "narrative_beats", NarrativeBeatInfo),
+        ("Accessibility", "accessibility_features", AccessibilityFeatureInfo),
+        ("Audio Design", "audio_design", AudioDesignCue),
+    )
+    extra_panel_specs: ClassVar[tuple[tuple[str, str], ...]] = (
+        ("Operations", "cyan"),
+        ("Community", "magenta"),
+    )
+    extra_panel_fields: ClassVar[tuple[tuple[tuple[str, str], ...], ...]] = (
+        (
+            ("World Structure", "world_structure"),
+            ("Operations", "operations_cadence"),
+        ),
+        (
+            ("Social Vision", "social_vision"),
+            ("Community", "retention_levers"),
+        ),
+    )
 
     title: str = Field("", description="Game title")
     game_summary: str = Field("", description="World overview and positioning")
@@ -121,90 +151,16 @@ class MmoOnlineGameInfo(GameFormatBase):
 
     @staticmethod
     def get_user_prompt(name: str) -> str:
-        return "Provide an MMO or persistent online service overview for '" + name + "', covering world structure, social systems, operations cadence, monetisation pillars, and endgame activities."
-
-    @staticmethod
-    def json_format_instructions() -> str:
-        return (
-            instructions + "\nOUTPUT FORMAT:\nReturn JSON with keys like title, game_summary, core_loop, world_structure, social_vision, operations_cadence, monetisation_pillars, "
-            "retention_levers, release_year, peak_concurrency_target, developers, publishers, platform_releases, server_architecture, social_features, mechanics, "
-            "progression_tracks, economy_loops, endgame_activities, live_events, community_programs, narrative_beats, accessibility_features, audio_design."
-        )
-
-    def _summary_panel(self) -> tuple[str, Sequence[str], str]:
-        title = self.title or self.summary_title_fallback
-        lines = [line for line in (self.core_loop, self.game_summary) if isinstance(line, str) and line.strip()]
-        if not lines:
-            lines.append("(no summary provided)")
-        return title, lines, self.summary_panel_style
+        return f"Provide an MMO or persistent online service overview for '{name}', covering world structure, social systems, operations cadence, monetisation pillars, and endgame activities."
 
     def _fact_pairs(self) -> Sequence[tuple[str, str]]:
-        return [
+        return (
             ("Release Year", format_year(self.release_year)),
-            (
-                "Peak CCU",
-                format_number(self.peak_concurrency_target) if self.peak_concurrency_target else "-",
-            ),
+            ("Peak CCU", format_number(self.peak_concurrency_target) if self.peak_concurrency_target else "-"),
             ("Operations", self.operations_cadence or "-"),
             ("Monetisation", self.monetisation_pillars or "-"),
             ("Retention", self.retention_levers or "-"),
-        ]
-
-    def _table_sections(self) -> Sequence[tuple[str, List[TableSchema], Sequence]]:
-        sections: list[tuple[str, List[TableSchema], Sequence]] = []
-        if self.developers:
-            sections.append(("Developers", StudioProfile.table_schema(), self.developers))
-        if self.publishers:
-            sections.append(("Publishers", StudioProfile.table_schema(), self.publishers))
-        if self.platform_releases:
-            sections.append(("Platform Releases", PlatformReleaseInfo.table_schema(), self.platform_releases))
-        if self.server_architecture:
-            sections.append(("Server Architecture", ServerArchitectureProfile.table_schema(), self.server_architecture))
-        if self.social_features:
-            sections.append(("Social Systems", SocialFeatureInfo.table_schema(), self.social_features))
-        if self.mechanics:
-            sections.append(("Mechanics", GameplayMechanicHighlight.table_schema(), self.mechanics))
-        if self.progression_tracks:
-            sections.append(("Progression", ProgressionTrackInfo.table_schema(), self.progression_tracks))
-        if self.economy_loops:
-            sections.append(("Economy", EconomyLoopInfo.table_schema(), self.economy_loops))
-        if self.endgame_activities:
-            sections.append(("Endgame", EndgameActivityProfile.table_schema(), self.endgame_activities))
-        if self.live_events:
-            sections.append(("Live Ops", LiveServiceEventInfo.table_schema(), self.live_events))
-        if self.community_programs:
-            sections.append(("Community Programs", CommunityProgramProfile.table_schema(), self.community_programs))
-        if self.narrative_beats:
-            sections.append(("Narrative", NarrativeBeatInfo.table_schema(), self.narrative_beats))
-        if self.accessibility_features:
-            sections.append(("Accessibility", AccessibilityFeatureInfo.table_schema(), self.accessibility_features))
-        if self.audio_design:
-            sections.append(("Audio Design", AudioDesignCue.table_schema(), self.audio_design))
-        return sections
-
-    def _extra_panels(self) -> Sequence[tuple[str, str, str]]:
-        operations_panel = "\n".join(
-            filter(
-                None,
-                (
-                    f"World Structure: {self.world_structure}" if self.world_structure else "",
-                    f"Operations: {self.operations_cadence}" if self.operations_cadence else "",
-                ),
-            )
         )
-        social_panel = "\n".join(
-            filter(
-                None,
-                (
-                    f"Social Vision: {self.social_vision}" if self.social_vision else "",
-                    f"Community: {self.retention_levers}" if self.retention_levers else "",
-                ),
-            )
-        )
-        return [
-            ("Operations", operations_panel, "cyan"),
-            ("Community", social_panel, "magenta"),
-        ]
 
 
 __all__ = [
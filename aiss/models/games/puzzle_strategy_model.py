@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import ClassVar, List, Sequence
+from typing import ClassVar, Final, List, Sequence
 
 from pydantic import Field
 
@@ -12,8 +12,8 @@ from ..shared import TableSchema, compose_instructions
 from ._base import (
     AccessibilityFeatureInfo,
     GameFormatBase,
-    GameJsonModel,
     GameplayMechanicHighlight,
+    GameRowModel,
     LiveServiceEventInfo,
     PlatformReleaseInfo,
     ProgressionTrackInfo,
@@ -21,10 +21,10 @@ from ._base import (
     StudioProfile,
 )
 
-instructions = "Write as a systems designer summarising a puzzle or strategy title for stakeholders. Cover the core ruleset, puzzle escalation, AI sophistication, difficulty tuning, and how players are taught to master systems. Document platform releases, post-launch content, and analytics loops so the product roadmap is clear."
+instructions: Final[str] = "Write as a systems designer summarising a puzzle or strategy title for stakeholders. Cover the core ruleset, puzzle escalation, AI sophistication, difficulty tuning, and how players are taught to master systems. Document platform releases, post-launch content, and analytics loops so the product roadmap is clear."
 
 
-class PuzzleModuleInfo(GameJsonModel):
+class PuzzleModuleInfo(GameRowModel):
     """Puzzle module or level pack descriptor."""
 
     module_name: str = Field("", description="Module or region name")
@@ -34,7 +34,7 @@ class PuzzleModuleInfo(GameJsonModel):
     completion_rate_target: float | None = Field(None, description="Target completion percentage")
 
     @classmethod
-    def table_schema(cls) -> List[TableSchema]:
+    def _build_table_schema(cls) -> List[TableSchema]:
         return [
             TableSchema(name="module_name", header="Module", style="magenta"),
             TableSchema(name="challenge_theme", header="Theme", style="cyan"),
@@ -43,7 +43,7 @@ class PuzzleModuleInfo(GameJsonModel):
         ]
 
 
-class StrategyScenarioInfo(GameJsonModel):
+class StrategyScenarioInfo(GameRowModel):
     """Strategy scenario or mission descriptor."""
 
     scenario_name: str = Field("", description="Scenario name")
@@ -53,7 +53,7 @@ class StrategyScenarioInfo(GameJsonModel):
     turn_limit: int | None = Field(None, description="Turn or timer limit")
 
     @classmethod
-    def table_schema(cls) -> List[TableSchema]:
+    def _build_table_schema(cls) -> List[TableSchema]:
         return [
             TableSchema(name="scenario_name", header="Scenario", style="magenta"),
             TableSchema(name="objective", header="Objective", style="cyan"),
@@ -62,7 +62,7 @@ class StrategyScenarioInfo(GameJsonModel):
         ]
 
 
-class TeachingMomentInfo(GameJsonModel):
+class TeachingMomentInfo(GameRowModel):
     """Tutorial or player education moment."""
 
     beat_name: str = Field("", description="Tutorial beat name")
@@ -71,7 +71,7 @@ class TeachingMomentInfo(GameJsonModel):
     analytics_signal: str = Field("", description="Metric monitored to validate understanding")
 
     @classmethod
-    def table_schema(cls) -> List[TableSchema]:
+    def _build_table_schema(cls) -> List[TableSchema]:
         return [
             TableSchema(name="beat_name", header="Beat", style="magenta"),
             TableSchema(name="learning_goal", header="Learning Goal", style="cyan"),
@@ -89,6 +89,23 @@ class PuzzleStrategyGameInfo(GameFormatBase):
 
     summary_title_fallback: ClassVar[str] = "Puzzle / Strategy Game"
     summary_attributes: ClassVar[Sequence[str]] = ("core_loop", "game_summary")
+    table_specs: ClassVar[tuple[tuple[str, str, type[GameRowModel]], ...]] = (
+        ("Developers", "developers", StudioProfile),
+        ("Publishers", "publishers", StudioProfile),
+        ("Platform Releases", "platform_releases", PlatformReleaseInfo),
+        ("Puzzle Modules", "puzzle_modules", PuzzleModuleInfo),
+        ("Scenarios", "strategy_scenarios", StrategyScenarioInfo),
+        ("Gameplay Layers", "gameplay_layers", GameplayMechanicHighlight),
+        ("Teaching Moments", "teaching_moments", TeachingMomentInfo),
+        ("Progression", "progression_tracks", ProgressionTrackInfo),
+        ("Live Ops", "live_events", LiveServiceEventInfo),
+        ("Accessibility", "accessibility_features", AccessibilityFeatureInfo),
+        ("Session Profiles", "session_profiles", SessionProfileInfo),
+    )
+    extra_panel_specs: ClassVar[tuple[tuple[str, str], ...]] = (
+        ("Systems Overview", "cyan"),
+        ("Difficulty Philosophy", "magenta"),
+    )
 
     title: str = Field("", description="Game title")
     game_summary: str = Field("", description="High-level overview of fantasy and rules")
@@ -120,60 +137,20 @@ class PuzzleStrategyGameInfo(GameFormatBase):
 
     @staticmethod
     def get_user_prompt(name: str) -> str:
-        return "Prepare a puzzle/strategy production brief for '" + name + "', outlining rulesets, difficulty escalation, AI behaviours, teaching beats, monetisation, and live support."
-
-    @staticmethod
-    def json_format_instructions() -> str:
-        return (
-            instructions + "\nOUTPUT FORMAT:\nReturn JSON with keys such as title, game_summary, core_loop, ruleset_overview, difficulty_philosophy, ai_capabilities, release_year, "
-            "average_session_minutes, target_audience, replayability_hooks, monetisation_model, developers, publishers, platform_releases, puzzle_modules, strategy_scenarios, "
-            "gameplay_layers, teaching_moments, progression_tracks, live_events, accessibility_features, session_profiles."
-        )
-
-    def _summary_panel(self) -> tuple[str, Sequence[str], str]:
-        title = self.title or self.summary_title_fallback
-        lines = [line for line in (self.core_loop, self.game_summary) if isinstance(line, str) and line.strip()]
-        if not lines:
-            lines.append("(no summary provided)")
-        return title, lines, self.summary_panel_style
+        return f"Prepare a puzzle/strategy production brief for '{name}', outlining rulesets, difficulty escalation, AI behaviours, teaching beats, monetisation, and live support."
 
     def _fact_pairs(self) -> Sequence[tuple[str, str]]:
-        return [
+        minutes = self.average_session_minutes
+        return (
             ("Release Year", format_year(self.release_year)),
-            ("Session Length", format_number(self.average_session_minutes) + " min" if self.average_session_minutes else "-"),
+            ("Session Length", f"{format_number(minutes)} min" if minutes else "-"),
             ("Difficulty", self.difficulty_philosophy or "-"),
             ("AI", self.ai_capabilities or "-"),
             ("Monetisation", self.monetisation_model or "-"),
             ("Audience", self.target_audience or "-"),
-        ]
+        )
 
-    def _table_sections(self) -> Sequence[tuple[str, List[TableSchema], Sequence]]:
-        sections: list[tuple[str, List[TableSchema], Sequence]] = []
-        if self.developers:
-            sections.append(("Developers", StudioProfile.table_schema(), self.developers))
-        if self.publishers:
-            sections.append(("Publishers", StudioProfile.table_schema(), self.publishers))
-        if self.platform_releases:
-            sections.append(("Platform Releases", PlatformReleaseInfo.table_schema(), self.platform_releases))
-        if self.puzzle_modules:
-            sections.append(("Puzzle Modules", PuzzleModuleInfo.table_schema(), self.puzzle_modules))
-        if self.strategy_scenarios:
-            sections.append(("Scenarios", StrategyScenarioInfo.table_schema(), self.strategy_scenarios))
-        if self.gameplay_layers:
-            sections.append(("Gameplay Layers", GameplayMechanicHighlight.table_schema(), self.gameplay_layers))
-        if self.teaching_moments:
-            sections.append(("Teaching Moments", TeachingMomentInfo.table_schema(), self.teaching_moments))
-        if self.progression_tracks:
-            sections.append(("Progression", ProgressionTrackInfo.table_schema(), self.progression_tracks))
-        if self.live_events:
-            sections.append(("Live Ops", LiveServiceEventInfo.table_schema(), self.live_events))
-        if self.accessibility_features:
-            sections.append(("Accessibility", AccessibilityFeatureInfo.table_schema(), self.accessibility_features))
-        if self.session_profiles:
-            sections.append(("Session Profiles", SessionProfileInfo.table_schema(), self.session_profiles))
-        return sections
-
-    def _extra_panels(self) -> Sequence[tuple[str, str, str]]:
+    def _extra_panel_bodies(self) -> Sequence[str]:
         system_lines = []
         if self.ruleset_overview:
             system_lines.append(f"Rules: {self.ruleset_overview}")
@@ -183,10 +160,7 @@ class PuzzleStrategyGameInfo(GameFormatBase):
 
         difficulty_panel = self.difficulty_philosophy.strip() if self.difficulty_philosophy else ""
 
-        return [
-            ("Systems Overview", systems_panel, "cyan"),
-            ("Difficulty Philosophy", difficulty_panel, "magenta"),
-        ]
+        return systems_panel, difficulty_panel
 
 
 __all__ = [
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import ClassVar, List, Sequence
+from typing import ClassVar, Final, List, Sequence
 
 from pydantic import Field
 
@@ -13,8 +13,8 @@ from ._base import (
     AccessibilityFeatureInfo,
     AudioDesignCue,
     GameFormatBase,
-    GameJsonModel,
     GameplayMechanicHighlight,
+    GameRowModel,
     LiveServiceEventInfo,
     NarrativeBeatInfo,
     PlatformReleaseInfo,
@@ -22,10 +22,10 @@ from ._base import (
     StudioProfile,
 )
 
-instructions = "Summarise an RPG as a worldbuilding director. Describe setting, factions, character classes, choice consequence systems, and how player builds evolve. Capture quest arcs, companion dynamics, monetisation, and post-launch narrative cadence so the RPG’s scope is obvious."
+instructions: Final[str] = "Summarise an RPG as a worldbuilding director. Describe setting, factions, character classes, choice consequence systems, and how player builds evolve. Capture quest arcs, companion dynamics, monetisation, and post-launch narrative cadence so the RPG’s scope is obvious."
 
 
-class CharacterClassProfile(GameJsonModel):
+class CharacterClassProfile(GameRowModel):
     """Playable class or archetype profile."""
 
     class_name: str = Field("", description="Class name or archetype")
@@ -35,7 +35,7 @@ class CharacterClassProfile(GameJsonModel):
     complexity_rating: str = Field("", description="Learning complexity or recommended audience")
 
     @classmethod
-    def table_schema(cls) -> List[TableSchema]:
+    def _build_table_schema(cls) -> List[TableSchema]:
         return [
             TableSchema(name="class_name", header="Class", style="magenta"),
             TableSchema(name="combat_role", header="Role", style="cyan"),
@@ -44,7 +44,7 @@ class CharacterClassProfile(GameJsonModel):
         ]
 
 
-class CompanionProfile(GameJsonModel):
+class CompanionProfile(GameRowModel):
     """Recruitable companion or party member."""
 
     name: str = Field("", description="Companion name")
@@ -54,7 +54,7 @@ class CompanionProfile(GameJsonModel):
     romanceable: bool = Field(False, description="Whether romance is available")
 
     @classmethod
-    def table_schema(cls) -> List[TableSchema]:
+    def _build_table_schema(cls) -> List[TableSchema]:
         return [
             TableSchema(name="name", header="Companion", style="magenta"),
             TableSchema(name="origin", header="Origin", style="cyan"),
@@ -63,7 +63,7 @@ class CompanionProfile(GameJsonModel):
         ]
 
 
-class FactionProfile(GameJsonModel):
+class FactionProfile(GameRowModel):
     """Faction or organisation description."""
 
     faction_name: str = Field("", description="Faction name")
@@ -73,7 +73,7 @@ class FactionProfile(GameJsonModel):
     rewards: list[str] = Field(default_factory=list, description="Rewards or benefits")
 
     @classmethod
-    def table_schema(cls) -> List[TableSchema]:
+    def _build_table_schema(cls) -> List[TableSchema]:
         return [
             TableSchema(name="faction_name", header="Faction", style="magenta"),
             TableSchema(name="ideology", header="Ideology", style="cyan"),
@@ -91,6 +91,35 @@ class RolePlayingGameInfo(GameFormatBase):
 
     summary_title_fallback: ClassVar[str] = "Role-Playing Game"
     summary_attributes: ClassVar[Sequence[str]] = ("core_loop", "game_summary")
+    table_specs: ClassVar[tuple[tuple[str, str, type[GameRowModel]], ...]] = (
+        ("Developers", "developers", StudioProfile),
+        ("Publishers", "publishers", StudioProfile),
+        ("Platform Releases", "platform_releases", PlatformReleaseInfo),
+        ("Factions", "factions", FactionProfile),
+        ("Character Classes", "character_classes", CharacterClassProfile),
+        ("Companions", "companions", CompanionProfile),
+        ("Systems", "systems", GameplayMechanicHighlight),
+        ("Narrative Beats", "narrative_beats", NarrativeBeatInfo),
+        ("Progression", "progression_tracks", ProgressionTrackInfo),
+        ("Live Ops", "live_events", LiveServiceEventInfo),
+        ("Accessibility", "accessibility_features", AccessibilityFeatureInfo),
+        ("Audio Design", "audio_design", AudioDesignCue),
+    )
+    extra_panel_specs: ClassVar[tuple[tuple[str, str], ...]] = (
+        ("Worldbuilding", "cyan"),
+        ("Player Fantasy", "magenta"),
+    )
+    extra_panel_fields: ClassVar[tuple[tuple[tuple[str, str], ...], ...]] = (
+        (
+            ("World", "world_setting"),
+            ("Timeline", "timeline_context"),
+            ("Post-Launch", "post_launch_story_plan"),
+        ),
+        (
+            ("Protagonist", "protagonist_identity"),
+            ("Build Freedom", "build_flexibility"),
+        ),
+    )
 
     title: str = Field("", description="Game title")
     game_summary: str = Field("", description="World overview and narrative hook")
@@ -124,81 +153,16 @@ class RolePlayingGameInfo(GameFormatBase):
 
     @staticmethod
     def get_user_prompt(name: str) -> str:
-        return "Provide an RPG leadership brief for '" + name + "', covering setting, factions, classes, companions, branching choices, monetisation, and post-launch narrative plans."
-
-    @staticmethod
-    def json_format_instructions() -> str:
-        return (
-            instructions + "\nOUTPUT FORMAT:\nReturn JSON with keys such as title, game_summary, core_loop, world_setting, timeline_context, protagonist_identity, release_year, "
-            "estimated_campaign_hours, build_flexibility, choice_consequence_map, monetisation_model, post_launch_story_plan, developers, publishers, platform_releases, "
-            "factions, character_classes, companions, systems, narrative_beats, progression_tracks, live_events, accessibility_features, audio_design."
-        )
-
-    def _summary_panel(self) -> tuple[str, Sequence[str], str]:
-        title = self.title or self.summary_title_fallback
-        lines = [line for line in (self.core_loop, self.game_summary) if isinstance(line, str) and line.strip()]
-        if not lines:
-            lines.append("(no summary provided)")
-        return title, lines, self.summary_panel_style
+        return f"Provide an RPG leadership brief for '{name}', covering setting, factions, classes, companions, branching choices, monetisation, and post-launch narrative plans."
 
     def _fact_pairs(self) -> Sequence[tuple[str, str]]:
-        return [
+        return (
             ("Release Year", format_year(self.release_year)),
             ("Campaign Hours", format_number(self.estimated_campaign_hours) if self.estimated_campaign_hours else "-"),
             ("Build Flexibility", self.build_flexibility or "-"),
             ("Choices", self.choice_consequence_map or "-"),
             ("Monetisation", self.monetisation_model or "-"),
-        ]
-
-    def _table_sections(self) -> Sequence[tuple[str, List[TableSchema], Sequence]]:
-        sections: list[tuple[str, List[TableSchema], Sequence]] = []
-        if self.developers:
-            sections.append(("Developers", StudioProfile.table_schema(), self.developers))
-        if self.publishers:
-            sections.append(("Publishers", StudioProfile.table_schema(), self.publishers))
-        if self.platform_releases:
-            sections.append(("Platform Releases", PlatformReleaseInfo.table_schema(), self.platform_releases))
-        if self.factions:
-            sections.append(("Factions", FactionProfile.table_schema(), self.factions))
-        if self.character_classes:
-            sections.append(("Character Classes", CharacterClassProfile.table_schema(), self.character_classes))
-        if self.companions:
-            sections.append(("Companions", CompanionProfile.table_schema(), self.companions))
-        if self.systems:
-            sections.append(("Systems", GameplayMechanicHighlight.table_schema(), self.systems))
-        if self.narrative_beats:
-            sections.append(("Narrative Beats", NarrativeBeatInfo.table_schema(), self.narrative_beats))
-        if self.progression_tracks:
-            sections.append(("Progression", ProgressionTrackInfo.table_schema(), self.progression_tracks))
-        if self.live_events:
-            sections.append(("Live Ops", LiveServiceEventInfo.table_schema(), self.live_events))
-        if self.accessibility_features:
-            sections.append(("Accessibility", AccessibilityFeatureInfo.table_schema(), self.accessibility_features))
-        if self.audio_design:
-            sections.append(("Audio Design", AudioDesignCue.table_schema(), self.audio_design))
-        return sections
-
-    def _extra_panels(self) -> Sequence[tuple[str, str, str]]:
-        world_lines = []
-        if self.world_setting:
-            world_lines.append(f"World: {self.world_setting}")
-        if self.timeline_context:
-            world_lines.append(f"Timeline: {self.timeline_context}")
-        if self.post_launch_story_plan:
-            world_lines.append(f"Post-Launch: {self.post_launch_story_plan}")
-        world_panel = "\n".join(world_lines)
-
-        protagonist_lines = []
-        if self.protagonist_identity:
-            protagonist_lines.append(f"Protagonist: {self.protagonist_identity}")
-        if self.build_flexibility:
-            protagonist_lines.append(f"Build Freedom: {self.build_flexibility}")
-        protagonist_panel = "\n".join(protagonist_lines)
-
-        return [
-            ("Worldbuilding", world_panel, "cyan"),
-            ("Player Fantasy", protagonist_panel, "magenta"),
-        ]
+        )
 
 
 __all__ = [
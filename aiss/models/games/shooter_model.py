@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import ClassVar, List, Sequence
+from typing import ClassVar, Final, List, Sequence
 
 from pydantic import Field
 
@@ -14,8 +14,8 @@ from ._base import (
     EconomyModelInfo,
     EsportsEventInfo,
     GameFormatBase,
-    GameJsonModel,
     GameplayMechanicHighlight,
+    GameRowModel,
     LiveServiceEventInfo,
     MultiplayerModeInfo,
     PlatformReleaseInfo,
@@ -25,14 +25,14 @@ from ._base import (
     TechnicalBenchmarkInfo,
 )
 
-instructions = (
+instructions: Final[str] = (
     "Adopt the lens of a competitive shooter product lead preparing a pitch deck. "
     "Explain the gunplay vision, movement tech, map philosophy, competitive rules, and service roadmap. "
     "Clarify platform releases, economy plans, anti-cheat posture, and esports aspirations so stakeholders grasp the shooter’s lifecycle."
 )
 
 
-class WeaponArchetypeInfo(GameJsonModel):
+class WeaponArchetypeInfo(GameRowModel):
     """Weapon archetype with handling notes."""
 
     name: str = Field("", description="Weapon archetype name")
@@ -42,7 +42,7 @@ class WeaponArchetypeInfo(GameJsonModel):
     skill_ceiling: str = Field("", description="Mastery requirement or difficulty")
 
     @classmethod
-    def table_schema(cls) -> List[TableSchema]:
+    def _build_table_schema(cls) -> List[TableSchema]:
         return [
             TableSchema(name="name", header="Weapon", style="magenta"),
             TableSchema(name="role", header="Role", style="cyan"),
@@ -51,7 +51,7 @@ class WeaponArchetypeInfo(GameJsonModel):
         ]
 
 
-class MapRotationInfo(GameJsonModel):
+class MapRotationInfo(GameRowModel):
     """Playable map or battleground descriptor."""
 
     map_name: str = Field("", description="Map name")
@@ -61,7 +61,7 @@ class MapRotationInfo(GameJsonModel):
     callouts: list[str] = Field(default_factory=list, description="Key areas or callouts")
 
     @classmethod
-    def table_schema(cls) -> List[TableSchema]:
+    def _build_table_schema(cls) -> List[TableSchema]:
         return [
             TableSchema(name="map_name", header="Map", style="magenta"),
             TableSchema(name="environment", header="Environment", style="cyan"),
@@ -79,6 +79,36 @@ class ShooterGameInfo(GameFormatBase):
 
     summary_title_fallback: ClassVar[str] = "Shooter Game"
     summary_attributes: ClassVar[Sequence[str]] = ("core_loop", "game_summary")
+    table_specs: ClassVar[tuple[tuple[str, str, type[GameRowModel]], ...]] = (
+        ("Developers", "developers", StudioProfile),
+        ("Publishers", "publishers", StudioProfile),
+        ("Platform Releases", "platform_releases", PlatformReleaseInfo),
+        ("Weapon Archetypes", "weapon_archetypes", WeaponArchetypeInfo),
+        ("Gameplay Pillars", "gameplay_pillars", GameplayMechanicHighlight),
+        ("Map Pool", "map_rotation", MapRotationInfo),
+        ("Multiplayer Modes", "multiplayer_modes", MultiplayerModeInfo),
+        ("Progression", "progression_tracks", ProgressionTrackInfo),
+        ("Live Ops", "live_events", LiveServiceEventInfo),
+        ("Accessibility", "accessibility_features", AccessibilityFeatureInfo),
+        ("Economy", "economy_models", EconomyModelInfo),
+        ("Esports", "esports_events", EsportsEventInfo),
+        ("Tech Benchmarks", "technical_benchmarks", TechnicalBenchmarkInfo),
+        ("Player Sessions", "session_profiles", SessionProfileInfo),
+    )
+    extra_panel_specs: ClassVar[tuple[tuple[str, str], ...]] = (
+        ("Combat & Movement", "cyan"),
+        ("Service Overview", "magenta"),
+    )
+    extra_panel_fields: ClassVar[tuple[tuple[tuple[str, str], ...], ...]] = (
+        (
+            ("Gunplay", "combat_philosophy"),
+            ("Movement", "movement_signature"),
+        ),
+        (
+            ("Ranked", "ranked_focus"),
+            ("Economy", "monetisation_model"),
+        ),
+    )
 
     title: str = Field("", description="Game title")
     game_summary: str = Field("", description="Framing narrative or setting context")
@@ -115,31 +145,10 @@ class ShooterGameInfo(GameFormatBase):
 
     @staticmethod
     def get_user_prompt(name: str) -> str:
-        return (
-            "Compile a shooter genre production brief for '"
-            + name
-            + "', detailing gunplay goals, movement tech, map rotation, multiplayer modes, monetisation, and competitive aspirations."
-        )
-
-    @staticmethod
-    def json_format_instructions() -> str:
-        return (
-            instructions
-            + "\nOUTPUT FORMAT:\nReturn JSON with keys such as title, game_summary, core_loop, combat_philosophy, movement_signature, player_perspective, release_year, "
-            "match_length_minutes, netcode_strategy, anti_cheat_approach, crossplay_support, ranked_focus, monetisation_model, developers, publishers, platform_releases, "
-            "weapon_archetypes, gameplay_pillars, map_rotation, multiplayer_modes, progression_tracks, live_events, accessibility_features, economy_models, esports_events, "
-            "technical_benchmarks, session_profiles."
-        )
-
-    def _summary_panel(self) -> tuple[str, Sequence[str], str]:
-        title = self.title or self.summary_title_fallback
-        lines = [line for line in (self.core_loop, self.game_summary) if isinstance(line, str) and line.strip()]
-        if not lines:
-            lines.append("(no summary provided)")
-        return title, lines, self.summary_panel_style
+        return f"Compile a shooter genre production brief for '{name}', detailing gunplay goals, movement tech, map rotation, multiplayer modes, monetisation, and competitive aspirations."
 
     def _fact_pairs(self) -> Sequence[tuple[str, str]]:
-        return [
+        return (
             ("Release Year", format_year(self.release_year)),
             ("Perspective", self.player_perspective or "-"),
             ("Match Length", format_runtime_minutes(self.match_length_minutes) if self.match_length_minutes else "-"),
@@ -148,59 +157,7 @@ class ShooterGameInfo(GameFormatBase):
             ("Anti-Cheat", self.anti_cheat_approach or "-"),
             ("Ranked", self.ranked_focus or "-"),
             ("Monetisation", self.monetisation_model or "-"),
-        ]
-
-    def _table_sections(self) -> Sequence[tuple[str, List[TableSchema], Sequence]]:
-        sections: list[tuple[str, List[TableSchema], Sequence]] = []
-        if self.developers:
-            sections.append(("Developers", StudioProfile.table_schema(), self.developers))
-        if self.publishers:
-            sections.append(("Publishers", StudioProfile.table_schema(), self.publishers))
-        if self.platform_releases:
-            sections.append(("Platform Releases", PlatformReleaseInfo.table_schema(), self.platform_releases))
-        if self.weapon_archetypes:
-            sections.append(("Weapon Archetypes", WeaponArchetypeInfo.table_schema(), self.weapon_archetypes))
-        if self.gameplay_pillars:
-            sections.append(("Gameplay Pillars", GameplayMechanicHighlight.table_schema(), self.gameplay_pillars))
-        if self.map_rotation:
-            sections.append(("Map Pool", MapRotationInfo.table_schema(), self.map_rotation))
-        if self.multiplayer_modes:
-            sections.append(("Multiplayer Modes", MultiplayerModeInfo.table_schema(), self.multiplayer_modes))
-        if self.progression_tracks:
-            sections.append(("Progression", ProgressionTrackInfo.table_schema(), self.progression_tracks))
-        if self.live_events:
-            sections.append(("Live Ops", LiveServiceEventInfo.table_schema(), self.live_events))
-        if self.accessibility_features:
-            sections.append(("Accessibility", AccessibilityFeatureInfo.table_schema(), self.accessibility_features))
-        if self.economy_models:
-            sections.append(("Economy", EconomyModelInfo.table_schema(), self.economy_models))
-        if self.esports_events:
-            sections.append(("Esports", EsportsEventInfo.table_schema(), self.esports_events))
-        if self.technical_benchmarks:
-            sections.append(("Tech Benchmarks", TechnicalBenchmarkInfo.table_schema(), self.technical_benchmarks))
-        if self.session_profiles:
-            sections.append(("Player Sessions", SessionProfileInfo.table_schema(), self.session_profiles))
-        return sections
-
-    def _extra_panels(self) -> Sequence[tuple[str, str, str]]:
-        combat_panel_lines = []
-        if self.combat_philosophy:
-            combat_panel_lines.append(f"Gunplay: {self.combat_philosophy}")
-        if self.movement_signature:
-            combat_panel_lines.append(f"Movement: {self.movement_signature}")
-        combat_panel = "\n".join(combat_panel_lines)
-
-        service_lines = []
-        if self.ranked_focus:
-            service_lines.append(f"Ranked: {self.ranked_focus}")
-        if self.monetisation_model:
-            service_lines.append(f"Economy: {self.monetisation_model}")
-        service_panel = "\n".join(service_lines)
-
-        return [
-            ("Combat & Movement", combat_panel, "cyan"),
-            ("Service Overview", service_panel, "magenta"),
-        ]
+        )
 
 
 __all__ = ["ShooterGameInfo", "WeaponArchetypeInfo", "MapRotationInfo"]
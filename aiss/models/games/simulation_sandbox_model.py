@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import ClassVar, List, Sequence
+from typing import ClassVar, Final, List, Sequence
 
 from pydantic import Field
 
@@ -14,8 +14,8 @@ from ._base import (
     AudioDesignCue,
     EconomyLoopInfo,
     GameFormatBase,
-    GameJsonModel,
     GameplayMechanicHighlight,
+    GameRowModel,
     LiveServiceEventInfo,
     NarrativeBeatInfo,
     PlatformReleaseInfo,
@@ -23,10 +23,10 @@ from ._base import (
     StudioProfile,
 )
 
-instructions = "Summarise a simulation or sandbox game as a systems design director. Describe simulation depth, player authored creativity, systemic interactions, and technical constraints. Highlight progression, economy loops, creator tools, live updates, and how players share or monetise creations."
+instructions: Final[str] = "Summarise a simulation or sandbox game as a systems design director. Describe simulation depth, player authored creativity, systemic interactions, and technical constraints. Highlight progression, economy loops, creator tools, live updates, and how players share or monetise creations."
 
 
-class SimulationSystemProfile(GameJsonModel):
+class SimulationSystemProfile(GameRowModel):
     """Key simulation system or rule set."""
 
     name: str = Field("", description="System name (eg. weather, AI, physics)")
@@ -36,7 +36,7 @@ class SimulationSystemProfile(GameJsonModel):
     emergent_outcomes: list[str] = Field(default_factory=list, description="Notable emergent outcomes")
 
     @classmethod
-    def table_schema(cls) -> List[TableSchema]:
+    def _build_table_schema(cls) -> List[TableSchema]:
         return [
             TableSchema(name="name", header="System", style="magenta"),
             TableSchema(name="scope", header="Scope", style="cyan"),
@@ -45,7 +45,7 @@ class SimulationSystemProfile(GameJsonModel):
         ]
 
 
-class CreatorToolProfile(GameJsonModel):
+class CreatorToolProfile(GameRowModel):
     """User generated content tool or pipeline."""
 
     tool_name: str = Field("", description="Tool or editor name")
@@ -55,7 +55,7 @@ class CreatorToolProfile(GameJsonModel):
     monetisation: str = Field("", description="Monetisation options if any")
 
     @classmethod
-    def table_schema(cls) -> List[TableSchema]:
+    def _build_table_schema(cls) -> List[TableSchema]:
         return [
             TableSchema(name="tool_name", header="Tool", style="magenta"),
             TableSchema(name="capabilities", header="Capabilities", style="cyan"),
@@ -74,6 +74,35 @@ class SimulationSandboxGameInfo(GameFormatBase):
 
     summary_title_fallback: ClassVar[str] = "Simulation / Sandbox Game"
     summary_attributes: ClassVar[Sequence[str]] = ("core_loop", "game_summary")
+    table_specs: ClassVar[tuple[tuple[str, str, type[GameRowModel]], ...]] = (
+        ("Developers", "developers", StudioProfile),
+        ("Publishers", "publishers", StudioProfile),
+        ("Platform Releases", "platform_releases", PlatformReleaseInfo),
+        ("Simulation Systems", "simulation_systems", SimulationSystemProfile),
+        ("Creator Tools", "creator_tools", CreatorToolProfile),
+        ("Mechanics", "mechanics", GameplayMechanicHighlight),
+        ("Progression", "progression_tracks", ProgressionTrackInfo),
+        ("Economy Loops", "economy_loops", EconomyLoopInfo),
+        ("Live Ops", "live_events", LiveServiceEventInfo),
+        ("Narrative Moments", "narrative_beats", NarrativeBeatInfo),
+        ("Accessibility", "accessibility_features", AccessibilityFeatureInfo),
+        ("Audio Design", "audio_design", AudioDesignCue),
+    )
+    extra_panel_specs: ClassVar[tuple[tuple[str, str], ...]] = (
+        ("Systems", "cyan"),
+        ("Player Creation", "magenta"),
+    )
+    extra_panel_fields: ClassVar[tuple[tuple[tuple[str, str], ...], ...]] = (
+        (
+            ("Simulation Scope", "simulation_scope"),
+            ("Tech Constraints", "tech_constraints"),
+            ("Live Cadence", "live_update_cadence"),
+        ),
+        (
+            ("Authorship", "player_authorship"),
+            ("Sharing", "sharing_infrastructure"),
+        ),
+    )
 
     title: str = Field("", description="Game title")
     game_summary: str = Field("", description="High level concept and fantasy")
@@ -106,87 +135,17 @@ class SimulationSandboxGameInfo(GameFormatBase):
 
     @staticmethod
     def get_user_prompt(name: str) -> str:
-        return "Provide a simulation and sandbox overview for '" + name + "', detailing systemic depth, creation tools, progression, economies, sharing infrastructure, and live update plans."
-
-    @staticmethod
-    def json_format_instructions() -> str:
-        return (
-            instructions + "\nOUTPUT FORMAT:\nReturn JSON with keys like title, game_summary, core_loop, simulation_scope, player_authorship, tech_constraints, release_year, "
-            "average_session_minutes, sharing_infrastructure, monetisation_model, live_update_cadence, developers, publishers, platform_releases, simulation_systems, "
-            "creator_tools, mechanics, progression_tracks, economy_loops, live_events, narrative_beats, accessibility_features, audio_design."
-        )
-
-    def _summary_panel(self) -> tuple[str, Sequence[str], str]:
-        title = self.title or self.summary_title_fallback
-        lines = [line for line in (self.core_loop, self.game_summary) if isinstance(line, str) and line.strip()]
-        if not lines:
-            lines.append("(no summary provided)")
-        return title, lines, self.summary_panel_style
+        return f"Provide a simulation and sandbox overview for '{name}', detailing systemic depth, creation tools, progression, economies, sharing infrastructure, and live update plans."
 
     def _fact_pairs(self) -> Sequence[tuple[str, str]]:
-        return [
+        minutes = self.average_session_minutes
+        return (
             ("Release Year", format_year(self.release_year)),
-            (
-                "Session Length",
-                format_number(self.average_session_minutes) + " min" if self.average_session_minutes else "-",
-            ),
+            ("Session Length", f"{format_number(minutes)} min" if minutes else "-"),
             ("Player Authorship", self.player_authorship or "-"),
             ("Sharing", self.sharing_infrastructure or "-"),
             ("Monetisation", self.monetisation_model or "-"),
-        ]
-
-    def _table_sections(self) -> Sequence[tuple[str, List[TableSchema], Sequence]]:
-        sections: list[tuple[str, List[TableSchema], Sequence]] = []
-        if self.developers:
-            sections.append(("Developers", StudioProfile.table_schema(), self.developers))
-        if self.publishers:
-            sections.append(("Publishers", StudioProfile.table_schema(), self.publishers))
-        if self.platform_releases:
-            sections.append(("Platform Releases", PlatformReleaseInfo.table_schema(), self.platform_releases))
-        if self.simulation_systems:
-            sections.append(("Simulation Systems", SimulationSystemProfile.table_schema(), self.simulation_systems))
-        if self.creator_tools:
-            sections.append(("Creator Tools", CreatorToolProfile.table_schema(), self.creator_tools))
-        if self.mechanics:
-            sections.append(("Mechanics", GameplayMechanicHighlight.table_schema(), self.mechanics))
-        if self.progression_tracks:
-            sections.append(("Progression", ProgressionTrackInfo.table_schema(), self.progression_tracks))
-        if self.economy_loops:
-            sections.append(("Economy Loops", EconomyLoopInfo.table_schema(), self.economy_loops))
-        if self.live_events:
-            sections.append(("Live Ops", LiveServiceEventInfo.table_schema(), self.live_events))
-        if self.narrative_beats:
-            sections.append(("Narrative Moments", NarrativeBeatInfo.table_schema(), self.narrative_beats))
-        if self.accessibility_features:
-            sections.append(("Accessibility", AccessibilityFeatureInfo.table_schema(), self.accessibility_features))
-        if self.audio_design:
-            sections.append(("Audio Design", AudioDesignCue.table_schema(), self.audio_design))
-        return sections
-
-    def _extra_panels(self) -> Sequence[tuple[str, str, str]]:
-        systems_panel = "\n".join(
-            filter(
-                None,
-                (
-                    f"Simulation Scope: {self.simulation_scope}" if self.simulation_scope else "",
-                    f"Tech Constraints: {self.tech_constraints}" if self.tech_constraints else "",
-                    f"Live Cadence: {self.live_update_cadence}" if self.live_update_cadence else "",
-                ),
-            )
         )
-        creation_panel = "\n".join(
-            filter(
-                None,
-                (
-                    f"Authorship: {self.player_authorship}" if self.player_authorship else "",
-                    f"Sharing: {self.sharing_infrastructure}" if self.sharing_infrastructure else "",
-                ),
-            )
-        )
-        return [
-            ("Systems", systems_panel, "cyan"),
-            ("Player Creation", creation_panel, "magenta"),
-        ]
 
 
 __all__ = [
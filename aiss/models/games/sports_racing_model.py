@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import ClassVar, List, Sequence
+from typing import ClassVar, Final, List, Sequence
 
 from pydantic import Field
 
@@ -14,18 +14,18 @@ from ._base import (
     AudioDesignCue,
     EconomyLoopInfo,
     GameFormatBase,
-    GameJsonModel,
     GameplayMechanicHighlight,
+    GameRowModel,
     LiveServiceEventInfo,
     PlatformReleaseInfo,
     ProgressionTrackInfo,
     StudioProfile,
 )
 
-instructions = "Summarise a sports or racing game like a franchise executive. Detail league licences, athlete or vehicle rosters, season cadence, live competitions, and monetisation programs. Explain physics fidelity, skill gaps, accessibility, online infrastructure, and community broadcast hooks."
+instructions: Final[str] = "Summarise a sports or racing game like a franchise executive. Detail league licences, athlete or vehicle rosters, season cadence, live competitions, and monetisation programs. Explain physics fidelity, skill gaps, accessibility, online infrastructure, and community broadcast hooks."
 
 
-class LeagueLicenseProfile(GameJsonModel):
+class LeagueLicenseProfile(GameRowModel):
     """League or competition license."""
 
     name: str = Field("", description="League or competition name")
@@ -34,7 +34,7 @@ class LeagueLicenseProfile(GameJsonModel):
     renewal_term: str = Field("", description="License term or renewal notes")
 
     @classmethod
-    def table_schema(cls) -> List[TableSchema]:
+    def _build_table_schema(cls) -> List[TableSchema]:
         return [
             TableSchema(name="name", header="League", style="magenta"),
             TableSchema(name="scope", header="Scope", style="cyan"),
@@ -43,7 +43,7 @@ class LeagueLicenseProfile(GameJsonModel):
         ]
 
 
-class AthleteVehicleProfile(GameJsonModel):
+class AthleteVehicleProfile(GameRowModel):
     """Athlete, team, or vehicle roster entry."""
 
     name: str = Field("", description="Athlete, team, or vehicle name")
@@ -52,7 +52,7 @@ class AthleteVehicleProfile(GameJsonModel):
     signature_strength: str = Field("", description="Signature strength or trait")
 
     @classmethod
-    def table_schema(cls) -> List[TableSchema]:
+    def _build_table_schema(cls) -> List[TableSchema]:
         return [
             TableSchema(name="name", header="Name", style="magenta"),
             TableSchema(name="classification", header="Class", style="cyan"),
@@ -61,7 +61,7 @@ class AthleteVehicleProfile(GameJsonModel):
         ]
 
 
-class SportsModeProfile(GameJsonModel):
+class SportsModeProfile(GameRowModel):
     """Core game mode or season experience."""
 
     mode_name: str = Field("", description="Mode name")
@@ -70,7 +70,7 @@ class SportsModeProfile(GameJsonModel):
     online_enabled: bool = Field(False, description="Whether online play is supported")
 
     @classmethod
-    def table_schema(cls) -> List[TableSchema]:
+    def _build_table_schema(cls) -> List[TableSchema]:
         return [
             TableSchema(name="mode_name", header="Mode", style="magenta"),
             TableSchema(name="structure", header="Structure", style="cyan"),
@@ -87,6 +87,35 @@ class SportsRacingGameInfo(GameFormatBase):
 
     summary_title_fallback: ClassVar[str] = "Sports / Racing Game"
     summary_attributes: ClassVar[Sequence[str]] = ("core_loop", "game_summary")
+    table_specs: ClassVar[tuple[tuple[str, str, type[GameRowModel]], ...]] = (
+        ("Developers", "developers", StudioProfile),
+        ("Publishers", "publishers", StudioProfile),
+        ("Platform Releases", "platform_releases", PlatformReleaseInfo),
+        ("Licences", "league_licenses", LeagueLicenseProfile),
+        ("Roster", "roster", AthleteVehicleProfile),
+        ("Modes", "modes", SportsModeProfile),
+        ("Mechanics", "mechanics", GameplayMechanicHighlight),
+        ("Progression", "progression_tracks", ProgressionTrackInfo),
+        ("Economy", "economy_loops", EconomyLoopInfo),
+        ("Live Ops", "live_events", LiveServiceEventInfo),
+        ("Accessibility", "accessibility_features", AccessibilityFeatureInfo),
+        ("Audio Design", "audio_design", AudioDesignCue),
+    )
+    extra_panel_specs: ClassVar[tuple[tuple[str, str], ...]] = (
+        ("Competition", "cyan"),
+        ("Skill & Physics", "magenta"),
+    )
+    extra_panel_fields: ClassVar[tuple[tuple[tuple[str, str], ...], ...]] = (
+        (
+            ("Sport Focus", "sport_focus"),
+            ("Live Season", "live_season_plan"),
+            ("Broadcast", "broadcast_hooks"),
+        ),
+        (
+            ("Skill Gap", "skill_gap_statement"),
+            ("Physics Fidelity", "physics_fidelity"),
+        ),
+    )
 
     title: str = Field("", description="Game title")
     game_summary: str = Field("", description="High-level positioning")
@@ -120,87 +149,17 @@ class SportsRacingGameInfo(GameFormatBase):
 
     @staticmethod
     def get_user_prompt(name: str) -> str:
-        return "Provide a sports or racing franchise overview for '" + name + "', covering licences, roster depth, modes, physics, monetisation, live seasons, and broadcast hooks."
-
-    @staticmethod
-    def json_format_instructions() -> str:
-        return (
-            instructions + "\nOUTPUT FORMAT:\nReturn JSON with keys like title, game_summary, core_loop, sport_focus, licence_strategy, physics_fidelity, skill_gap_statement, "
-            "broadcast_hooks, monetisation_model, live_season_plan, release_year, average_match_minutes, developers, publishers, platform_releases, league_licenses, roster, "
-            "modes, mechanics, progression_tracks, economy_loops, live_events, accessibility_features, audio_design."
-        )
-
-    def _summary_panel(self) -> tuple[str, Sequence[str], str]:
-        title = self.title or self.summary_title_fallback
-        lines = [line for line in (self.core_loop, self.game_summary) if isinstance(line, str) and line.strip()]
-        if not lines:
-            lines.append("(no summary provided)")
-        return title, lines, self.summary_panel_style
+        return f"Provide a sports or racing franchise overview for '{name}', covering licences, roster depth, modes, physics, monetisation, live seasons, and broadcast hooks."
 
     def _fact_pairs(self) -> Sequence[tuple[str, str]]:
-        return [
+        minutes = self.average_match_minutes
+        return (
             ("Release Year", format_year(self.release_year)),
-            (
-                "Match Length",
-                format_number(self.average_match_minutes) + " min" if self.average_match_minutes else "-",
-            ),
+            ("Match Length", f"{format_number(minutes)} min" if minutes else "-"),
             ("Licence Strategy", self.licence_strategy or "-"),
             ("Physics", self.physics_fidelity or "-"),
             ("Monetisation", self.monetisation_model or "-"),
-        ]
-
-    def _table_sections(self) -> Sequence[tuple[str, List[TableSchema], Sequence]]:
-        sections: list[tuple[str, List[TableSchema], Sequence]] = []
-        if self.developers:
-            sections.append(("Developers", StudioProfile.table_schema(), self.developers))
-        if self.publishers:
-            sections.append(("Publishers", StudioProfile.table_schema(), self.publishers))
-        if self.platform_releases:
-            sections.append(("Platform Releases", PlatformReleaseInfo.table_schema(), self.platform_releases))
-        if self.league_licenses:
-            sections.append(("Licences", LeagueLicenseProfile.table_schema(), self.league_licenses))
-        if self.roster:
-            sections.append(("Roster", AthleteVehicleProfile.table_schema(), self.roster))
-        if self.modes:
-            sections.append(("Modes", SportsModeProfile.table_schema(), self.modes))
-        if self.mechanics:
-            sections.append(("Mechanics", GameplayMechanicHighlight.table_schema(), self.mechanics))
-        if self.progression_tracks:
-            sections.append(("Progression", ProgressionTrackInfo.table_schema(), self.progression_tracks))
-        if self.economy_loops:
-            sections.append(("Economy", EconomyLoopInfo.table_schema(), self.economy_loops))
-        if self.live_events:
-            sections.append(("Live Ops", LiveServiceEventInfo.table_schema(), self.live_events))
-        if self.accessibility_features:
-            sections.append(("Accessibility", AccessibilityFeatureInfo.table_schema(), self.accessibility_features))
-        if self.audio_design:
-            sections.append(("Audio Design", AudioDesignCue.table_schema(), self.audio_design))
-        return sections
-
-    def _extra_panels(self) -> Sequence[tuple[str, str, str]]:
-        competition_panel = "\n".join(
-            filter(
-                None,
-                (
-                    f"Sport Focus: {self.sport_focus}" if self.sport_focus else "",
-                    f"Live Season: {self.live_season_plan}" if self.live_season_plan else "",
-                    f"Broadcast: {self.broadcast_hooks}" if self.broadcast_hooks else "",
-                ),
-            )
         )
-        skill_panel = "\n".join(
-            filter(
-                None,
-                (
-                    f"Skill Gap: {self.skill_gap_statement}" if self.skill_gap_statement else "",
-                    f"Physics Fidelity: {self.physics_fidelity}" if self.physics_fidelity else "",
-                ),
-            )
-        )
-        return [
-            ("Competition", competition_panel, "cyan"),
-            ("Skill & Physics", skill_panel, "magenta"),
-        ]
 
 
 __all__ = [
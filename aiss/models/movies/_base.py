@@ -8,16 +8,18 @@ formats. Each concrete movie format (drama, comedy, etc.) extends
 from __future__ import annotations
 
 import json
+from functools import cache
 from pathlib import Path
-from typing import Any, ClassVar, Iterable, List, Optional, Sequence, Type, TypeVar
+from typing import Any, ClassVar, Iterable, List, Optional, Self, Sequence, Type, TypeVar
 
-from pydantic import BaseModel, Field
-from rich.console import Console
+import pydantic_core
+from pydantic import BaseModel, ConfigDict, Field
+from rich.console import Console, Group, RenderableType
 from rich.panel import Panel
 
-from aiss.utils import format_decimal, format_money, format_runtime_minutes, format_year, render_table_from_schema
+from aiss.utils import build_table_from_schema, format_decimal, format_money, format_runtime_minutes, format_year
 
-from ..shared import TableSchema, compose_instructions
+from ..shared import TableSchema, TableSchemaMixin, compose_instructions, nested_model_fields
 
 # Reusable helper type for BaseModel factories
 T = TypeVar("T", bound=BaseModel)
@@ -30,15 +32,43 @@ def _model_dump(instance: BaseModel) -> dict[str, Any]:  # pragma: no cover - tr
         return instance.dict()  # type: ignore[call-arg]
 
 
-def _model_validate(cls: Type[T], data: Any) -> T:  # pragma: no cover - trivial helper
+def _model_dump_json(instance: BaseModel) -> str:  # pragma: no cover - trivial helper
+    try:
+        return instance.model_dump_json(indent=2)  # type: ignore[attr-defined]
+    except AttributeError:
+        return instance.json(indent=2, ensure_ascii=False)  # type: ignore[call-arg]
+
+
+def _model_validate[M: BaseModel](cls: type[M], data: Any) -> M:  # pragma: no cover - trivial helper
     try:
         return cls.model_validate(data)  # type: ignore[attr-defined]
     except AttributeError:
         return cls.parse_obj(data)  # type: ignore[call-arg]
 
 
+def _model_validate_json[M: BaseModel](cls: type[M], raw: bytes) -> M:  # pragma: no cover - trivial helper
+    try:
+        return cls.model_validate_json(raw)  # type: ignore[attr-defined]
+    except AttributeError:
+        return cls.parse_raw(raw)  # type: ignore[call-arg]
+
+
+@cache
+def _json_format_instructions(model_cls: type[Any]) -> str:
+    # Schema and base instructions are fixed per class, so render them once.
+    schema_text = model_cls._json_schema()
+    return f"{model_cls.get_instructions()}\nRespond with JSON that adheres to the following schema:\n```json\n{schema_text}\n```"
+
+
+class MovieRowModel(TableSchemaMixin, BaseModel):
+    """Immutable base for the nested helper models embedded in movie formats."""
+
+    # Nested rows are only read after parsing, so freeze them like the game rows.
+    model_config = ConfigDict(frozen=True)
+
+
 # MARK: Cast and Crew Helpers
-class CastMemberInfo(BaseModel):
+class CastMemberInfo(MovieRowModel):
     """Principal cast member information."""
 
     character: str = Field("", description="Name of character in the movie")
@@ -46,7 +76,7 @@ class CastMemberInfo(BaseModel):
     role: str = Field("", description="Role type (lead/supporting/guest)")
 
     @classmethod
-    def table_schema(cls) -> List[TableSchema]:
+    def _build_table_schema(cls) -> List[TableSchema]:
         """Return the table schema for rendering cast information."""
 
         return [
@@ -60,8 +90,7 @@ class CastMemberInfo(BaseModel):
 
     def to_json(self, json_file_path: Path | str) -> None:
         path = Path(json_file_path)
-        with path.open("w", encoding="utf-8") as handle:
-            json.dump(self.to_dict(), handle, ensure_ascii=False, indent=2)
+        path.write_text(_model_dump_json(self), encoding="utf-8")
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "CastMemberInfo":
@@ -70,12 +99,10 @@ class CastMemberInfo(BaseModel):
     @classmethod
     def from_json(cls, json_file_path: Path | str) -> "CastMemberInfo":
         path = Path(json_file_path)
-        with path.open("r", encoding="utf-8") as handle:
-            data = json.load(handle)
-        return cls.from_dict(data)
+        return _model_validate_json(cls, path.read_bytes())
 
 
-class CrewMemberInfo(BaseModel):
+class CrewMemberInfo(MovieRowModel):
     """Notable crew member information beyond directors/producers."""
 
     name: str = Field("", description="Crew member name")
@@ -83,7 +110,7 @@ class CrewMemberInfo(BaseModel):
     notable_work: str = Field("", description="Past notable credits or accolades")
 
     @classmethod
-    def table_schema(cls) -> List[TableSchema]:
+    def _build_table_schema(cls) -> List[TableSchema]:
         return [
             TableSchema(name="name", header="Name", style="magenta"),
             TableSchema(name="role", header="Role", style="cyan"),
@@ -99,18 +126,15 @@ class CrewMemberInfo(BaseModel):
 
     def to_json(self, json_file_path: Path | str) -> None:
         path = Path(json_file_path)
-        with path.open("w", encoding="utf-8") as handle:
-            json.dump(self.to_dict(), handle, ensure_ascii=False, indent=2)
+        path.write_text(_model_dump_json(self), encoding="utf-8")
 
     @classmethod
     def from_json(cls, json_file_path: Path | str) -> "CrewMemberInfo":
         path = Path(json_file_path)
-        with path.open("r", encoding="utf-8") as handle:
-            data = json.load(handle)
-        return cls.from_dict(data)
+        return _model_validate_json(cls, path.read_bytes())
 
 
-class ProductionCompanyInfo(BaseModel):
+class ProductionCompanyInfo(MovieRowModel):
     """Production company involvement details."""
 
     name: str = Field("", description="Name of the production company")
@@ -120,7 +144,7 @@ class ProductionCompanyInfo(BaseModel):
     country: str = Field("", description="Country where the production company is based")
 
     @classmethod
-    def table_schema(cls) -> List[TableSchema]:
+    def _build_table_schema(cls) -> List[TableSchema]:
         return [
             TableSchema(name="name", header="Name", style="magenta"),
             TableSchema(
@@ -149,8 +173,7 @@ class ProductionCompanyInfo(BaseModel):
 
     def to_json(self, json_file_path: Path | str) -> None:
         path = Path(json_file_path)
-        with path.open("w", encoding="utf-8") as handle:
-            json.dump(self.to_dict(), handle, ensure_ascii=False, indent=2)
+        path.write_text(_model_dump_json(self), encoding="utf-8")
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "ProductionCompanyInfo":
@@ -159,12 +182,10 @@ class ProductionCompanyInfo(BaseModel):
     @classmethod
     def from_json(cls, json_file_path: Path | str) -> "ProductionCompanyInfo":
         path = Path(json_file_path)
-        with path.open("r", encoding="utf-8") as handle:
-            data = json.load(handle)
-        return cls.from_dict(data)
+        return _model_validate_json(cls, path.read_bytes())
 
 
-class BoxOfficeInfo(BaseModel):
+class BoxOfficeInfo(MovieRowModel):
     """Aggregated box office and budget information."""
 
     budget: Optional[int] = Field(None, description="Budget in local currency or smallest unit")
@@ -172,7 +193,7 @@ class BoxOfficeInfo(BaseModel):
     gross_domestic: Optional[int] = Field(None, description="Domestic gross")
 
     @classmethod
-    def table_schema(cls) -> List[TableSchema]:
+    def _build_table_schema(cls) -> List[TableSchema]:
         return [
             TableSchema(
                 name="budget",
@@ -202,8 +223,7 @@ class BoxOfficeInfo(BaseModel):
 
     def to_json(self, json_file_path: Path | str) -> None:
         path = Path(json_file_path)
-        with path.open("w", encoding="utf-8") as handle:
-            json.dump(self.to_dict(), handle, ensure_ascii=False, indent=2)
+        path.write_text(_model_dump_json(self), encoding="utf-8")
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "BoxOfficeInfo":
@@ -212,12 +232,10 @@ class BoxOfficeInfo(BaseModel):
     @classmethod
     def from_json(cls, json_file_path: Path | str) -> "BoxOfficeInfo":
         path = Path(json_file_path)
-        with path.open("r", encoding="utf-8") as handle:
-            data = json.load(handle)
-        return cls.from_dict(data)
+        return _model_validate_json(cls, path.read_bytes())
 
 
-class DistributionInfo(BaseModel):
+class DistributionInfo(MovieRowModel):
     """Distribution details for a movie (territory-specific releases)."""
 
     distributor: str = Field("", description="Name of the distributor")
@@ -228,7 +246,7 @@ class DistributionInfo(BaseModel):
     revenue: Optional[int] = Field(None, description="Reported revenue for this territory (if available)")
 
     @classmethod
-    def table_schema(cls) -> List[TableSchema]:
+    def _build_table_schema(cls) -> List[TableSchema]:
         return [
             TableSchema(name="distributor", header="Distributor", style="magenta", no_wrap=True),
             TableSchema(name="territory", header="Territory", style="cyan"),
@@ -247,19 +265,16 @@ class DistributionInfo(BaseModel):
 
     def to_json(self, json_file_path: Path | str) -> None:
         path = Path(json_file_path)
-        with path.open("w", encoding="utf-8") as handle:
-            json.dump(self.to_dict(), handle, ensure_ascii=False, indent=2)
+        path.write_text(_model_dump_json(self), encoding="utf-8")
 
     @classmethod
     def from_json(cls, json_file_path: Path | str) -> "DistributionInfo":
         path = Path(json_file_path)
-        with path.open("r", encoding="utf-8") as handle:
-            data = json.load(handle)
-        return cls.from_dict(data)
+        return _model_validate_json(cls, path.read_bytes())
 
 
 # MARK: Genre-Specific Helper Models
-class CharacterArcInfo(BaseModel):
+class CharacterArcInfo(MovieRowModel):
     """Detailed character journey information used in character-driven movies."""
 
     name: str = Field("", description="Character name")
@@ -276,7 +291,7 @@ class CharacterArcInfo(BaseModel):
     )
 
     @classmethod
-    def table_schema(cls) -> List[TableSchema]:
+    def _build_table_schema(cls) -> List[TableSchema]:
         return [
             TableSchema(name="name", header="Character", style="magenta", no_wrap=True),
             TableSchema(name="portrayed_by", header="Actor", style="cyan"),
@@ -285,7 +300,7 @@ class CharacterArcInfo(BaseModel):
         ]
 
 
-class ActionSetPieceInfo(BaseModel):
+class ActionSetPieceInfo(MovieRowModel):
     """Set piece information for action or spectacle-driven movies."""
 
     name: str = Field("", description="Name or description of the set piece")
@@ -295,7 +310,7 @@ class ActionSetPieceInfo(BaseModel):
     practical_effects: str = Field("", description="Notable stunts, VFX, or practical work")
 
     @classmethod
-    def table_schema(cls) -> List[TableSchema]:
+    def _build_table_schema(cls) -> List[TableSchema]:
         return [
             TableSchema(name="name", header="Set Piece", style="magenta", no_wrap=True),
             TableSchema(name="act", header="Act", justify="center"),
@@ -305,7 +320,7 @@ class ActionSetPieceInfo(BaseModel):
         ]
 
 
-class HumorBeatInfo(BaseModel):
+class HumorBeatInfo(MovieRowModel):
     """Major comedic beats tracked for comedy movies."""
 
     situation: str = Field("", description="Setup for the comedic beat")
@@ -317,7 +332,7 @@ class HumorBeatInfo(BaseModel):
     comedic_style: str = Field("", description="Type of humor (satire, slapstick, deadpan, etc.)")
 
     @classmethod
-    def table_schema(cls) -> List[TableSchema]:
+    def _build_table_schema(cls) -> List[TableSchema]:
         return [
             TableSchema(name="situation", header="Situation", style="magenta"),
             TableSchema(name="punchline", header="Payoff", style="cyan"),
@@ -325,7 +340,7 @@ class HumorBeatInfo(BaseModel):
         ]
 
 
-class InvestigationThreadInfo(BaseModel):
+class InvestigationThreadInfo(MovieRowModel):
     """Used for thriller/mystery plots to track investigative threads."""
 
     thread: str = Field("", description="Name or short description of the investigation thread")
@@ -334,7 +349,7 @@ class InvestigationThreadInfo(BaseModel):
     status: str = Field("", description="Current status (active, resolved, red herring)")
 
     @classmethod
-    def table_schema(cls) -> List[TableSchema]:
+    def _build_table_schema(cls) -> List[TableSchema]:
         return [
             TableSchema(name="thread", header="Thread", style="magenta"),
             TableSchema(name="suspect_or_focus", header="Focus", style="cyan"),
@@ -342,7 +357,7 @@ class InvestigationThreadInfo(BaseModel):
         ]
 
 
-class RomanticBeatInfo(BaseModel):
+class RomanticBeatInfo(MovieRowModel):
     """Romantic beat tracking for romance-driven stories."""
 
     beat_name: str = Field("", description="Name of the romantic beat")
@@ -351,7 +366,7 @@ class RomanticBeatInfo(BaseModel):
     setting: str = Field("", description="Where the beat occurs")
 
     @classmethod
-    def table_schema(cls) -> List[TableSchema]:
+    def _build_table_schema(cls) -> List[TableSchema]:
         return [
             TableSchema(name="beat_name", header="Beat", style="magenta"),
             TableSchema(name="emotional_shift", header="Emotional Shift", style="cyan"),
@@ -359,7 +374,7 @@ class RomanticBeatInfo(BaseModel):
         ]
 
 
-class FearMomentInfo(BaseModel):
+class FearMomentInfo(MovieRowModel):
     """Major scare or tension moments for horror movies."""
 
     moment_name: str = Field("", description="Identifier for the scare or tension beat")
@@ -372,7 +387,7 @@ class FearMomentInfo(BaseModel):
     )
 
     @classmethod
-    def table_schema(cls) -> List[TableSchema]:
+    def _build_table_schema(cls) -> List[TableSchema]:
         return [
             TableSchema(name="moment_name", header="Moment", style="magenta"),
             TableSchema(name="type_of_fear", header="Fear Type", style="cyan"),
@@ -380,7 +395,7 @@ class FearMomentInfo(BaseModel):
         ]
 
 
-class SubjectFocusInfo(BaseModel):
+class SubjectFocusInfo(MovieRowModel):
     """Subject focus details for documentaries or biographical films."""
 
     subject: str = Field("", description="Primary subject or individual")
@@ -389,7 +404,7 @@ class SubjectFocusInfo(BaseModel):
     perspective: str = Field("", description="Narrative perspective or framing")
 
     @classmethod
-    def table_schema(cls) -> List[TableSchema]:
+    def _build_table_schema(cls) -> List[TableSchema]:
         return [
             TableSchema(name="subject", header="Subject", style="magenta"),
             TableSchema(name="role_or_significance", header="Significance", style="cyan"),
@@ -455,8 +470,7 @@ class BaseMovieInfo(BaseModel):
         """Persist the movie info as JSON on disk."""
 
         path = Path(json_file_path)
-        with path.open("w", encoding="utf-8") as handle:
-            json.dump(self.to_dict(), handle, ensure_ascii=False, indent=2)
+        path.write_text(_model_dump_json(self), encoding="utf-8")
 
     @classmethod
     def from_dict(cls: Type[T], data: dict[str, Any]) -> T:
@@ -469,9 +483,34 @@ class BaseMovieInfo(BaseModel):
         """Load the movie format from a JSON file."""
 
         path = Path(json_file_path)
-        with path.open("r", encoding="utf-8") as handle:
-            data = json.load(handle)
-        return cls.from_dict(data)
+        return _model_validate_json(cls, path.read_bytes())
+
+    # Trusted loaders skip validation entirely. Only use them for data this
+    # package wrote itself (via :meth:`to_json`) or already validated upstream.
+    @classmethod
+    def from_dict_trusted(cls, data: dict[str, Any]) -> Self:
+        """Build the movie format from trusted data without running validation.
+
+        :param data: Mapping previously produced by :meth:`to_dict` or schema-validated upstream.
+        :return: The constructed model, with nested helper rows rebuilt via ``model_construct``.
+        """
+        built = dict(data)
+        for name, row_type, is_list in nested_model_fields(cls, MovieRowModel):
+            value = built.get(name)
+            if value is None:
+                continue
+            if is_list:
+                built[name] = [row_type.model_construct(**item) if isinstance(item, dict) else item for item in value]
+            elif isinstance(value, dict):
+                built[name] = row_type.model_construct(**value)
+        return cls.model_construct(**built)
+
+    @classmethod
+    def from_json_trusted(cls, json_file_path: Path | str) -> Self:
+        """Load a trusted JSON file written by :meth:`to_json` without validation."""
+
+        path = Path(json_file_path)
+        return cls.from_dict_trusted(pydantic_core.from_json(path.read_bytes()))
 
     @classmethod
     def get_instructions(cls, additional_info: Sequence[str] | None = None) -> str:  # pragma: no cover - simple delegation
@@ -493,46 +532,53 @@ class BaseMovieInfo(BaseModel):
     def json_format_instructions(cls) -> str:
         """Return instructions that include an explicit JSON schema example."""
 
-        schema_text = cls._json_schema()
-        return f"{cls.get_instructions()}\nRespond with JSON that adheres to the following schema:\n```json\n{schema_text}\n```"
+        return _json_format_instructions(cls)
 
     # Rendering helpers -------------------------------------------------------------------
     def _base_fact_pairs(self) -> list[tuple[str, str]]:
-        facts: list[tuple[str, str]] = []
-        release_display = format_year(self.release_year)
-        facts.append(("Release", release_display))
-        facts.append(("Runtime", format_runtime_minutes(self.runtime_minutes)))
-        facts.append(("Genres", ", ".join(self.genres) if self.genres else "-"))
-        facts.append(("MPAA", self.mpaa_rating or "-"))
-        facts.append(("Directors", ", ".join(self.directors) if self.directors else "-"))
-        facts.append(("Producers", ", ".join(self.producers) if self.producers else "-"))
-        facts.append(("Writers", ", ".join(self.writers) if self.writers else "-"))
-        facts.append(("Language", self.original_language or "-"))
-        facts.append(("Countries", ", ".join(self.countries) if self.countries else "-"))
-        facts.append(("Rating", format_decimal(self.rating) if self.rating is not None else "-"))
-        return facts
+        return [
+            ("Release", format_year(self.release_year)),
+            ("Runtime", format_runtime_minutes(self.runtime_minutes)),
+            ("Genres", ", ".join(self.genres) or "-"),
+            ("MPAA", self.mpaa_rating or "-"),
+            ("Directors", ", ".join(self.directors) or "-"),
+            ("Producers", ", ".join(self.producers) or "-"),
+            ("Writers", ", ".join(self.writers) or "-"),
+            ("Language", self.original_language or "-"),
+            ("Countries", ", ".join(self.countries) or "-"),
+            ("Rating", format_decimal(self.rating) if self.rating is not None else "-"),
+        ]
 
     def _additional_fact_pairs(self) -> list[tuple[str, str]]:
         return []
 
-    def _extra_tables(self) -> list[tuple[str, List[TableSchema], Sequence[BaseModel]]]:
+    def _extra_tables(self) -> list[tuple[str, Sequence[TableSchema], Sequence[BaseModel]]]:
         return []
 
     def _extra_panels(self) -> list[tuple[str, str]]:
         return []
 
-    def _render_list_panel(self, title: str, items: Iterable[str], console: Console) -> None:
-        data = list(items)
-        if not data:
-            return
-        body = "\n".join(f"- {item}" for item in data)
-        console.print(Panel(body, title=title, expand=False, style="blue"))
+    def _list_panel(self, title: str, items: Iterable[str]) -> Panel | None:
+        body = "\n".join(f"- {item}" for item in items)
+        if not body:
+            return None
+        return Panel(body, title=title, expand=False, style="blue")
 
-    def _render_wikipedia_summary(self, console: Console) -> None:
+    def _wikipedia_panel(self) -> Panel | None:
         hint_text = self.wikipedia_summary.strip()
         if not hint_text:
-            return
-        console.print(Panel(hint_text, title="Context", expand=False, style="yellow"))
+            return None
+        return Panel(hint_text, title="Context", expand=False, style="yellow")
+
+    def _render_list_panel(self, title: str, items: Iterable[str], console: Console) -> None:
+        panel = self._list_panel(title, items)
+        if panel is not None:
+            console.print(panel)
+
+    def _render_wikipedia_summary(self, console: Console) -> None:
+        panel = self._wikipedia_panel()
+        if panel is not None:
+            console.print(panel)
 
     def render(self, console: Console) -> None:
         """Render the movie information using Rich primitives."""
@@ -550,47 +596,51 @@ class BaseMovieInfo(BaseModel):
         synopsis_text = self.synopsis or "(no synopsis provided)"
         if self.tagline:
             synopsis_text = f"{self.tagline}\n\n{synopsis_text}".strip()
-        console.print(Panel(synopsis_text, title=title_text, expand=False, style="green"))
-        self._render_wikipedia_summary(console)
+
+        # Collect every section and print once so Rich lays out the movie in a single pass.
+        items: list[RenderableType] = [Panel(synopsis_text, title=title_text, expand=False, style="green")]
+        if (context_panel := self._wikipedia_panel()) is not None:
+            items.append(context_panel)
 
         facts = self._base_fact_pairs() + self._additional_fact_pairs()
         facts_text = ", ".join(f"{header}: {value}" for header, value in facts)
-        console.print(Panel(facts_text, title="Facts", expand=False, style="magenta"))
+        items.append(Panel(facts_text, title="Facts", expand=False, style="magenta"))
 
-        if self.keywords:
-            self._render_list_panel("Keywords", self.keywords, console)
-        if self.awards:
-            self._render_list_panel("Awards", self.awards, console)
-        if self.soundtrack_highlights:
-            self._render_list_panel("Soundtrack", self.soundtrack_highlights, console)
+        for title, values in (
+            ("Keywords", self.keywords),
+            ("Awards", self.awards),
+            ("Soundtrack", self.soundtrack_highlights),
+        ):
+            if (list_panel := self._list_panel(title, values)) is not None:
+                items.append(list_panel)
 
         if self.cast:
-            render_table_from_schema("Cast", CastMemberInfo.table_schema(), self.cast, console)
+            items.append(build_table_from_schema("Cast", CastMemberInfo.table_schema_shared(), self.cast))
         if self.notable_crew:
-            render_table_from_schema("Key Crew", CrewMemberInfo.table_schema(), self.notable_crew, console)
+            items.append(build_table_from_schema("Key Crew", CrewMemberInfo.table_schema_shared(), self.notable_crew))
         if self.production_companies:
-            render_table_from_schema(
-                "Production Companies",
-                ProductionCompanyInfo.table_schema(),
-                self.production_companies,
-                console,
+            items.append(
+                build_table_from_schema(
+                    "Production Companies",
+                    ProductionCompanyInfo.table_schema_shared(),
+                    self.production_companies,
+                )
             )
         if self.box_office:
-            render_table_from_schema("Box Office", BoxOfficeInfo.table_schema(), [self.box_office], console)
+            items.append(build_table_from_schema("Box Office", BoxOfficeInfo.table_schema_shared(), [self.box_office]))
         if self.distribution_info:
-            render_table_from_schema(
-                "Distribution",
-                DistributionInfo.table_schema(),
-                self.distribution_info,
-                console,
+            items.append(
+                build_table_from_schema("Distribution", DistributionInfo.table_schema_shared(), self.distribution_info)
             )
 
         for title, schema, rows in self._extra_tables():
             if rows:
-                render_table_from_schema(title, schema, rows, console)
+                items.append(build_table_from_schema(title, schema, rows))
 
         for title, body in self._extra_panels():
-            console.print(Panel(body, title=title, expand=False, style="cyan"))
+            items.append(Panel(body, title=title, expand=False, style="cyan"))
+
+        console.print(Group(*items))
 
 
 __all__ = [
@@ -51,7 +51,7 @@ class ActionAdventureMovieInfo(BaseMovieInfo):
     def _extra_tables(self):
         tables = []
         if self.set_pieces:
-            tables.append(("Set Pieces", ActionSetPieceInfo.table_schema(), self.set_pieces))
+            tables.append(("Set Pieces", ActionSetPieceInfo.table_schema_shared(), self.set_pieces))
         return tables
 
     def _extra_panels(self):
@@ -50,7 +50,7 @@ class ComedyMovieInfo(BaseMovieInfo):
     def _extra_tables(self):
         tables = []
         if self.comedic_beats:
-            tables.append(("Comedic Beats", HumorBeatInfo.table_schema(), self.comedic_beats))
+            tables.append(("Comedic Beats", HumorBeatInfo.table_schema_shared(), self.comedic_beats))
         return tables
 
     def _extra_panels(self):
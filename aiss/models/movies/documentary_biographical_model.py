@@ -59,7 +59,7 @@ class DocumentaryBiographicalMovieInfo(BaseMovieInfo):
     def _extra_tables(self):
         tables = []
         if self.subjects:
-            tables.append(("Subjects", SubjectFocusInfo.table_schema(), self.subjects))
+            tables.append(("Subjects", SubjectFocusInfo.table_schema_shared(), self.subjects))
         return tables
 
     def _extra_panels(self):
@@ -43,7 +43,7 @@ class DramaMovieInfo(BaseMovieInfo):
     def _extra_tables(self):
         tables = []
         if self.character_arcs:
-            tables.append(("Character Arcs", CharacterArcInfo.table_schema(), self.character_arcs))
+            tables.append(("Character Arcs", CharacterArcInfo.table_schema_shared(), self.character_arcs))
         return tables
 
     def _extra_panels(self):
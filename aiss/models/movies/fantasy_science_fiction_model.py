@@ -51,7 +51,7 @@ class FantasyScienceFictionMovieInfo(BaseMovieInfo):
     def _extra_tables(self):
         tables = []
         if self.signature_set_pieces:
-            tables.append(("Signature Set Pieces", ActionSetPieceInfo.table_schema(), self.signature_set_pieces))
+            tables.append(("Signature Set Pieces", ActionSetPieceInfo.table_schema_shared(), self.signature_set_pieces))
         return tables
 
     def _extra_panels(self):
@@ -50,7 +50,7 @@ class HorrorMovieInfo(BaseMovieInfo):
     def _extra_tables(self):
         tables = []
         if self.fear_moments:
-            tables.append(("Fear Moments", FearMomentInfo.table_schema(), self.fear_moments))
+            tables.append(("Fear Moments", FearMomentInfo.table_schema_shared(), self.fear_moments))
         return tables
 
     def _extra_panels(self):
@@ -50,7 +50,7 @@ class RomanceMovieInfo(BaseMovieInfo):
     def _extra_tables(self):
         tables = []
         if self.romantic_beats:
-            tables.append(("Romantic Beats", RomanticBeatInfo.table_schema(), self.romantic_beats))
+            tables.append(("Romantic Beats", RomanticBeatInfo.table_schema_shared(), self.romantic_beats))
         return tables
 
     def _extra_panels(self):
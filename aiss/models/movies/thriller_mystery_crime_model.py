@@ -45,7 +45,7 @@ class ThrillerMysteryCrimeMovieInfo(BaseMovieInfo):
     def _extra_tables(self):
         tables = []
         if self.investigation_threads:
-            tables.append(("Investigation Threads", InvestigationThreadInfo.table_schema(), self.investigation_threads))
+            tables.append(("Investigation Threads", InvestigationThreadInfo.table_schema_shared(), self.investigation_threads))
         return tables
 
     def _extra_panels(self):
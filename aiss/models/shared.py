@@ -8,12 +8,17 @@ for a column in a Rich table.
 
 from dataclasses import dataclass
 from enum import StrEnum
-from functools import lru_cache
-from typing import Any, Callable, Optional, Sequence, cast
+from functools import cache, lru_cache
+from typing import TYPE_CHECKING, Any, Callable, Optional, Sequence, cast, get_args, get_origin
 
 # Avoid top-level imports of models to prevent circular imports; import lazily
 from .protocols import ModelFormatProtocol
 
+if TYPE_CHECKING:
+    from pydantic import BaseModel
+
+    from .find_model import FindModelMinimalRequest
+
 
 def compose_instructions(base: str, additional_info: Optional[Sequence[str]] = None) -> str:
     """Combine base instructions with optional additional context lines."""
@@ -21,6 +26,14 @@ def compose_instructions(base: str, additional_info: Optional[Sequence[str]] = N
     if not additional_info:
         return base
 
+    # The same context lines are typically composed for each result type of a title.
+    try:
+        return _compose_cached(base, tuple(additional_info))
+    except TypeError:
+        return _compose(base, additional_info)
+
+
+def _compose(base: str, additional_info: Sequence[str]) -> str:
     extras = [line.strip() for line in additional_info if isinstance(line, str) and line.strip()]
     if not extras:
         return base
@@ -30,6 +43,20 @@ def compose_instructions(base: str, additional_info: Optional[Sequence[str]] = N
     return f"{base_text}\n\nAdditional context:\n{joined_extras}"
 
 
+_compose_cached = lru_cache(maxsize=32)(_compose)
+
+
+def json_keys_instructions(instructions: str, model_cls: "type[BaseModel]") -> str:
+    """Append an output-format line advertising the JSON keys of ``model_cls``.
+
+    Keys come straight from ``model_fields`` (excluded fields omitted, declaration
+    order kept) so the prompt cannot drift from the schema.
+    """
+
+    keys = ", ".join(name for name, field in model_cls.model_fields.items() if not field.exclude)
+    return f"{instructions}\nOUTPUT FORMAT:\nReturn JSON with keys such as {keys}."
+
+
 class ResultType(StrEnum):
     PARSED = "parsed"
     JSON = "json"
@@ -200,6 +227,10 @@ class ModelType(StrEnum):
         raise ValueError(f"Unknown ModelType: {self}")
 
 
+# Plain dict lookup for label -> member, bypassing ``EnumType.__call__``.
+_MT_BY_VALUE: dict[str, ModelType] = {member.value: member for member in ModelType}
+
+
 @dataclass
 class ModelTypeResult:
     model_type: ModelType
@@ -207,6 +238,27 @@ class ModelTypeResult:
     formatted_name: str
     additional_info: Optional[list[str]] = None
 
+    @classmethod
+    def from_find_request(cls, request: "FindModelMinimalRequest") -> "ModelTypeResult":
+        """
+        Build a result from an already-validated classification response.
+
+        :param request: Parsed ``FindModelRequest`` (or its minimal variant)
+        :type request: FindModelMinimalRequest
+
+        :return: The matching model type result
+        :rtype: ModelTypeResult
+        """
+        model_type = _MT_BY_VALUE.get(request.find_model)
+        if model_type is None:
+            model_type = ModelType(request.find_model)
+        return cls(
+            model_type=model_type,
+            description=getattr(request, "description", ""),
+            formatted_name=request.formatted_name,
+            additional_info=getattr(request, "additional_info", []),
+        )
+
     def __str__(self) -> str:
         """
         String representation of the model type result.
@@ -222,13 +274,14 @@ class ModelTypeResult:
 
 
 # MARK: Table Schema
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TableSchema:
     """Schema descriptor for a table column.
 
     This small dataclass centralizes how table columns are described. It is
     intended to replace older dict-shaped schemas and provides clearer
-    typing for renderers.
+    typing for renderers. Instances are immutable so cached layouts can be
+    shared between every model that renders the same row type.
 
     :param name: Attribute name on the item to read
     :type name: str
@@ -255,5 +308,73 @@ class TableSchema:
     formatter: Optional[Callable[[Any], str]] = None
 
 
-# Default show model fallback used when no specific show type is provided
-DEFAULT_SHOW_MODEL = cast(type[ModelFormatProtocol], ModelType.SHOW.get_model_from_name())
+@cache
+def _schema_for(model_cls: type["TableSchemaMixin"]) -> tuple[TableSchema, ...]:
+    """Build and memoise the table layout for a row model class."""
+    return tuple(model_cls._build_table_schema())
+
+
+class TableSchemaMixin:
+    """Give row models a per-class cached table layout.
+
+    Subclasses implement :meth:`_build_table_schema`; the layout is built on
+    first use and shared by every later render of that row type.
+    """
+
+    @classmethod
+    def table_schema(cls) -> list[TableSchema]:
+        """Return the column layout as a fresh list callers may extend."""
+        return list(_schema_for(cls))
+
+    @classmethod
+    def table_schema_shared(cls) -> tuple[TableSchema, ...]:
+        """Return the cached column layout itself, for render paths that only read it."""
+        return _schema_for(cls)
+
+    @classmethod
+    def _build_table_schema(cls) -> list[TableSchema]:
+        raise NotImplementedError(f"{cls.__name__} does not define a table schema")
+
+
+def _nested_model_type(annotation: Any, base: type) -> tuple[type | None, bool]:
+    """Return the ``base`` subclass held by an annotation and whether it is a list.
+
+    Handles ``Model``, ``list[Model]`` and optional variants of either.
+    """
+    origin = get_origin(annotation)
+    if origin is list:
+        (item_type,) = get_args(annotation) or (Any,)
+        model_type, _ = _nested_model_type(item_type, base)
+        return model_type, True
+    if origin is not None:
+        for arg in get_args(annotation):
+            if arg is type(None):
+                continue
+            model_type, is_list = _nested_model_type(arg, base)
+            if model_type is not None:
+                return model_type, is_list
+        return None, False
+    if isinstance(annotation, type) and issubclass(annotation, base):
+        return annotation, False
+    return None, False
+
+
+@cache
+def nested_model_fields(model_cls: "type[BaseModel]", base: type) -> tuple[tuple[str, type, bool], ...]:
+    """Return ``(name, nested model, is_list)`` for fields holding ``base`` models, resolved once per class."""
+    nested = []
+    for name, field in model_cls.model_fields.items():
+        model_type, is_list = _nested_model_type(field.annotation, base)
+        if model_type is not None:
+            nested.append((name, model_type, is_list))
+    return tuple(nested)
+
+
+def __getattr__(name: str) -> Any:
+    # Default show model fallback used when no specific show type is provided.
+    # Resolved lazily so importing this module does not load every format package.
+    if name == "DEFAULT_SHOW_MODEL":
+        value = cast(type[ModelFormatProtocol], ModelType.SHOW.get_model_from_name())
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -9,7 +9,6 @@ to access the same abstractions from a single place.
 
 from __future__ import annotations
 
-import json
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Callable, ClassVar, List, Optional, Sequence, TypeVar
 
@@ -27,7 +26,7 @@ from aiss.utils import (
 )
 
 from ..protocols import ModelFormatProtocol
-from ..shared import TableSchema
+from ..shared import TableSchema, TableSchemaMixin, json_keys_instructions
 
 
 def _dump(obj: BaseModel) -> dict[str, Any]:
@@ -45,7 +44,7 @@ def _dump(obj: BaseModel) -> dict[str, Any]:
 T = TypeVar("T", bound="JsonModel")
 
 
-class JsonModel(BaseModel):
+class JsonModel(TableSchemaMixin, BaseModel):
     """Extend Pydantic's BaseModel with convenient JSON helpers."""
 
     def to_dict(self) -> dict[str, Any]:
@@ -53,8 +52,7 @@ class JsonModel(BaseModel):
 
     def to_json(self, json_file_path: Path | str) -> None:
         path = Path(json_file_path)
-        with path.open("w", encoding="utf-8") as handle:
-            json.dump(self.to_dict(), handle, ensure_ascii=False, indent=2)
+        path.write_text(self.model_dump_json(indent=2), encoding="utf-8")
 
     @classmethod
     def from_dict(cls: type[T], data: dict[str, Any]) -> T:
@@ -63,9 +61,8 @@ class JsonModel(BaseModel):
     @classmethod
     def from_json(cls: type[T], json_file_path: Path | str) -> T:
         path = Path(json_file_path)
-        with path.open("r", encoding="utf-8") as handle:
-            data = json.load(handle)
-        return cls.from_dict(data)
+        return cls.model_validate_json(path.read_bytes())
+
 
 
 if TYPE_CHECKING:
@@ -82,12 +79,13 @@ if TYPE_CHECKING:
         summary_attributes: ClassVar[Sequence[str]]
         facts_panel_title: ClassVar[str]
         facts_panel_style: ClassVar[str]
+        table_specs: ClassVar[tuple[tuple[str, str, type[JsonModel]], ...]]
 
         def _summary_panel(self) -> tuple[str, Sequence[str], str]: ...
 
         def _fact_pairs(self) -> Sequence[tuple[str, str]]: ...
 
-        def _table_sections(self) -> Sequence[tuple[str, List[TableSchema], Sequence[JsonModel]]]: ...
+        def _table_sections(self) -> Sequence[tuple[str, Sequence[TableSchema], Sequence[JsonModel]]]: ...
 
         def _extra_panels(self) -> Sequence[tuple[str, str, str]]: ...
 
@@ -104,6 +102,9 @@ else:
         summary_attributes: ClassVar[Sequence[str]] = ("tagline", "show_summary")
         facts_panel_title: ClassVar[str] = "Quick Facts"
         facts_panel_style: ClassVar[str] = "blue"
+        # (section title, attribute name, row model) rendered in order when the attribute is non-empty.
+        table_specs: ClassVar[tuple[tuple[str, str, type[JsonModel]], ...]] = ()
+        _json_format_text: ClassVar[str] = ""
 
         wikipedia_summary: str = Field(
             "",
@@ -111,6 +112,17 @@ else:
             description="Runtime-only hint populated after parsing for richer rendering.",
         )
 
+        @classmethod
+        def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+            super().__pydantic_init_subclass__(**kwargs)
+            get_instructions = getattr(cls, "get_instructions", None)
+            if get_instructions is not None:
+                cls._json_format_text = json_keys_instructions(get_instructions(), cls)
+
+        @classmethod
+        def json_format_instructions(cls) -> str:
+            return cls._json_format_text
+
         def render_wikipedia_summary(self, console: Console) -> None:
             hint_text = self.wikipedia_summary.strip()
             if not hint_text:
@@ -121,13 +133,14 @@ else:
         def _summary_panel(self) -> tuple[str, Sequence[str], str]:
             title_value = getattr(self, "title", "") or self.summary_title_fallback
             lines: list[str] = []
+            # ``isspace`` tests blank values without allocating; only real text is stripped.
             for attribute in self.summary_attributes:
                 value = getattr(self, attribute, None)
-                if isinstance(value, str) and value.strip():
+                if value and isinstance(value, str) and not value.isspace():
                     lines.append(value.strip())
             if not lines:
                 fallback = getattr(self, "show_summary", None)
-                if isinstance(fallback, str) and fallback.strip():
+                if fallback and isinstance(fallback, str) and not fallback.isspace():
                     lines.append(fallback.strip())
             if not lines:
                 lines.append("(no summary provided)")
@@ -136,8 +149,12 @@ else:
         def _fact_pairs(self) -> Sequence[tuple[str, str]]:
             return []
 
-        def _table_sections(self) -> Sequence[tuple[str, List[TableSchema], Sequence[JsonModel]]]:
-            return []
+        def _table_sections(self) -> Sequence[tuple[str, Sequence[TableSchema], Sequence[JsonModel]]]:
+            return [
+                (label, row_model.table_schema_shared(), rows)
+                for label, attribute, row_model in self.table_specs
+                if (rows := getattr(self, attribute))
+            ]
 
         def _extra_panels(self) -> Sequence[tuple[str, str, str]]:
             return []
@@ -145,8 +162,8 @@ else:
         # MARK: Render -------------------------------------------------------------------
         def render(self, console: Console) -> None:
             summary_title, summary_lines, summary_style = self._summary_panel()
-            summary_body = "\n\n".join(line for line in summary_lines if line.strip())
-            if not summary_body.strip():
+            summary_body = "\n\n".join(line for line in summary_lines if line and not line.isspace())
+            if not summary_body:
                 summary_body = "(no summary provided)"
             console.print(Panel(summary_body, title=summary_title, expand=False, style=summary_style))
 
@@ -177,7 +194,7 @@ class CriticalResponse(JsonModel):
     publication_date: str = Field("", description="Release date of the review in ISO format")
 
     @classmethod
-    def table_schema(cls) -> list[TableSchema]:
+    def _build_table_schema(cls) -> list[TableSchema]:
         return [
             TableSchema(name="outlet", header="Outlet", style="magenta"),
             TableSchema(name="reviewer", header="Reviewer", style="cyan"),
@@ -196,7 +213,7 @@ class AudienceEngagement(JsonModel):
     engagement_notes: str = Field("", description="Contextual notes about the metric")
 
     @classmethod
-    def table_schema(cls) -> list[TableSchema]:
+    def _build_table_schema(cls) -> list[TableSchema]:
         return [
             TableSchema(name="region", header="Region", style="magenta"),
             TableSchema(name="demographic", header="Demographic", style="cyan"),
@@ -215,7 +232,7 @@ class CharInfoInfo(JsonModel):
     year_joined: int = Field(0, description="Year the character joined the show")
 
     @classmethod
-    def table_schema(cls) -> List[TableSchema]:
+    def _build_table_schema(cls) -> List[TableSchema]:
         """
         Return a TableSchema list describing columns for character tables.
 
@@ -248,7 +265,7 @@ class ProductionCompanyInfo(JsonModel):
     country: str = Field("", description="Country where the production company is based")
 
     @classmethod
-    def table_schema(cls) -> List[TableSchema]:
+    def _build_table_schema(cls) -> List[TableSchema]:
         """
         Return a TableSchema list describing production company columns.
 
@@ -280,7 +297,7 @@ class BroadcastInfo(JsonModel):
     end_year: int = Field(0, description="Year the show ended broadcasting on this network")
 
     @classmethod
-    def table_schema(cls) -> List[TableSchema]:
+    def _build_table_schema(cls) -> List[TableSchema]:
         """
         Return TableSchema for broadcast info columns.
 
@@ -319,7 +336,7 @@ class DistributionInfo(JsonModel):
     revenue: Optional[int] = Field(None, description="Reported revenue for this territory (if available)")
 
     @classmethod
-    def table_schema(cls) -> List[TableSchema]:
+    def _build_table_schema(cls) -> List[TableSchema]:
         return [
             TableSchema(name="distributor", header="Distributor", style="magenta", no_wrap=True),
             TableSchema(name="territory", header="Territory", style="cyan"),
@@ -349,7 +366,7 @@ class BoxOfficeInfo(JsonModel):
         return f"Budget: {format_money(self.budget)} | Worldwide: {format_money(self.gross_worldwide)}"
 
     @classmethod
-    def table_schema(cls) -> List[TableSchema]:
+    def _build_table_schema(cls) -> List[TableSchema]:
         return [
             TableSchema(name="budget", header="Budget", style="magenta", justify="right", formatter=format_money),
             TableSchema(name="gross_worldwide", header="Gross (WW)", style="cyan", justify="right", formatter=format_money),
@@ -38,7 +38,7 @@ class HeroProfile(JsonModel):
     arc_summary: str = Field("", description="Summary of the character's journey")
 
     @classmethod
-    def table_schema(cls) -> List[TableSchema]:
+    def _build_table_schema(cls) -> List[TableSchema]:
         return [
             TableSchema(name="name", header="Hero", style="magenta", no_wrap=True),
             TableSchema(name="actor", header="Performer", style="cyan"),
@@ -59,7 +59,7 @@ class QuestArc(JsonModel):
     resolution: str = Field("", description="Outcome of the quest")
 
     @classmethod
-    def table_schema(cls) -> List[TableSchema]:
+    def _build_table_schema(cls) -> List[TableSchema]:
         return [
             TableSchema(name="quest_name", header="Quest", style="magenta"),
             TableSchema(name="season", header="Season", justify="center", formatter=format_year),
@@ -80,7 +80,7 @@ class WorldLocation(JsonModel):
     narrative_significance: str = Field("", description="Why the location matters")
 
     @classmethod
-    def table_schema(cls) -> List[TableSchema]:
+    def _build_table_schema(cls) -> List[TableSchema]:
         return [
             TableSchema(name="name", header="Location", style="magenta"),
             TableSchema(name="locale_type", header="Type", style="cyan"),
@@ -99,7 +99,7 @@ class ArtifactInfo(JsonModel):
     origin: str = Field("", description="Origin story or creation details")
 
     @classmethod
-    def table_schema(cls) -> List[TableSchema]:
+    def _build_table_schema(cls) -> List[TableSchema]:
         return [
             TableSchema(name="name", header="Artifact", style="magenta"),
             TableSchema(name="classification", header="Type", style="cyan"),
@@ -113,6 +113,17 @@ class ActionAdventureFantasyShowInfo(ShowFormatBase):
     model_name: ClassVar[str] = "ActionAdventureFantasyShowInfo"
     description: ClassVar[str] = "High-energy television adventure model capturing world-building depth, serialized quest structure, and production ecosystem insights."
     key_trait: ClassVar[str] = "Serialized action-fantasy television driven by quests and expansive settings"
+    table_specs: ClassVar[tuple[tuple[str, str, type[JsonModel]], ...]] = (
+        ("Heroes", "heroes", HeroProfile),
+        ("Quest Arcs", "quest_arcs", QuestArc),
+        ("World Locations", "world_locations", WorldLocation),
+        ("Artifacts", "artifacts", ArtifactInfo),
+        ("Critical Reception", "critical_reception", CriticalResponse),
+        ("Audience Metrics", "audience_metrics", AudienceEngagement),
+        ("Production Companies", "production_companies", ProductionCompanyInfo),
+        ("Broadcast", "broadcast_info", BroadcastInfo),
+        ("Distribution", "distribution_info", DistributionInfo),
+    )
 
     title: str = Field("", description="Series title")
     show_summary: str = Field("", description="Expanded synopsis")
@@ -180,42 +191,10 @@ class ActionAdventureFantasyShowInfo(ShowFormatBase):
             ("Rating", self.age_rating or "-"),
         ]
 
-    def _table_sections(self) -> list[tuple[str, List[TableSchema], list[JsonModel]]]:
-        sections: list[tuple[str, List[TableSchema], list[JsonModel]]] = []
-        if self.heroes:
-            sections.append(("Heroes", HeroProfile.table_schema(), self.heroes))
-        if self.quest_arcs:
-            sections.append(("Quest Arcs", QuestArc.table_schema(), self.quest_arcs))
-        if self.world_locations:
-            sections.append(("World Locations", WorldLocation.table_schema(), self.world_locations))
-        if self.artifacts:
-            sections.append(("Artifacts", ArtifactInfo.table_schema(), self.artifacts))
-        if self.critical_reception:
-            sections.append(("Critical Reception", CriticalResponse.table_schema(), self.critical_reception))
-        if self.audience_metrics:
-            sections.append(("Audience Metrics", AudienceEngagement.table_schema(), self.audience_metrics))
-        if self.production_companies:
-            sections.append(("Production Companies", ProductionCompanyInfo.table_schema(), self.production_companies))
-        if self.broadcast_info:
-            sections.append(("Broadcast", BroadcastInfo.table_schema(), self.broadcast_info))
-        if self.distribution_info:
-            sections.append(("Distribution", DistributionInfo.table_schema(), self.distribution_info))
-        return sections
-
     @staticmethod
     def get_instructions(additional_info: Sequence[str] | None = None) -> str:
         return compose_instructions(instructions, additional_info)
 
     @staticmethod
     def get_user_prompt(name: str) -> str:
-        return "Craft a richly detailed action, adventure, or fantasy TV show brief for '" + name + "', highlighting world-building, heroic ensembles, landmark quests, production scale, and reception."
-
-    @staticmethod
-    def json_format_instructions() -> str:
-        return (
-            instructions + "\nOUTPUT FORMAT:\nReturn JSON containing fields including title, show_summary, tagline, world_setting, genre_mix, "
-            "tone, core_themes, season_count, episode_count, average_runtime_minutes, age_rating, visual_style, "
-            "effects_approach, release_start_year, release_end_year, creators, showrunners, stunt_coordinators, "
-            "heroes, quest_arcs, world_locations, artifacts, critical_reception, audience_metrics, "
-            "production_companies, broadcast_info, distribution_info."
-        )
+        return f"Craft a richly detailed action, adventure, or fantasy TV show brief for '{name}', highlighting world-building, heroic ensembles, landmark quests, production scale, and reception."
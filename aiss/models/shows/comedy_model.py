@@ -40,7 +40,7 @@ class ComedyCharacterProfile(JsonModel):
     spotlight_episodes: list[str] = Field(default_factory=list, description="Episodes featuring the character prominently")
 
     @classmethod
-    def table_schema(cls) -> List[TableSchema]:
+    def _build_table_schema(cls) -> List[TableSchema]:
         return [
             TableSchema(name="name", header="Character", style="magenta", no_wrap=True),
             TableSchema(name="actor", header="Actor", style="cyan"),
@@ -60,7 +60,7 @@ class ComedyEpisodeBeat(JsonModel):
     resolution: str = Field("", description="How the episode resolves or buttons the joke")
 
     @classmethod
-    def table_schema(cls) -> List[TableSchema]:
+    def _build_table_schema(cls) -> List[TableSchema]:
         return [
             TableSchema(name="episode_title", header="Episode", style="magenta"),
             TableSchema(name="season", header="Season", justify="center", formatter=format_year),
@@ -79,7 +79,7 @@ class RunningGagInfo(JsonModel):
     notable_variations: list[str] = Field(default_factory=list, description="Memorable variations of the gag")
 
     @classmethod
-    def table_schema(cls) -> List[TableSchema]:
+    def _build_table_schema(cls) -> List[TableSchema]:
         return [
             TableSchema(name="name", header="Running Gag", style="magenta"),
             TableSchema(name="first_appearance", header="First Seen", style="cyan"),
@@ -94,6 +94,16 @@ class ComedyShowInfo(ShowFormatBase):
     model_name: ClassVar[str] = "ComedyShowInfo"
     description: ClassVar[str] = "Comprehensive intelligence model for humour-driven television series, balancing creative, production, and market context."
     key_trait: ClassVar[str] = "Television comedy storytelling anchored by recurring humour engines"
+    table_specs: ClassVar[tuple[tuple[str, str, type[JsonModel]], ...]] = (
+        ("Characters", "characters", ComedyCharacterProfile),
+        ("Running Gags", "running_gags", RunningGagInfo),
+        ("Episode Beats", "episode_beats", ComedyEpisodeBeat),
+        ("Critical Reception", "critical_reception", CriticalResponse),
+        ("Audience Metrics", "audience_metrics", AudienceEngagement),
+        ("Production Companies", "production_companies", ProductionCompanyInfo),
+        ("Broadcast", "broadcast_info", BroadcastInfo),
+        ("Distribution", "distribution_info", DistributionInfo),
+    )
 
     title: str = Field("", description="Title of the comedy series")
     premise: str = Field("", description="One-line premise or hook")
@@ -159,41 +169,10 @@ class ComedyShowInfo(ShowFormatBase):
             ("Rating", self.age_rating or "-"),
         ]
 
-    def _table_sections(self) -> list[tuple[str, List[TableSchema], list[JsonModel]]]:
-        sections: list[tuple[str, List[TableSchema], list[JsonModel]]] = []
-        if self.characters:
-            sections.append(("Characters", ComedyCharacterProfile.table_schema(), self.characters))
-        if self.running_gags:
-            sections.append(("Running Gags", RunningGagInfo.table_schema(), self.running_gags))
-        if self.episode_beats:
-            sections.append(("Episode Beats", ComedyEpisodeBeat.table_schema(), self.episode_beats))
-        if self.critical_reception:
-            sections.append(("Critical Reception", CriticalResponse.table_schema(), self.critical_reception))
-        if self.audience_metrics:
-            sections.append(("Audience Metrics", AudienceEngagement.table_schema(), self.audience_metrics))
-        if self.production_companies:
-            sections.append(("Production Companies", ProductionCompanyInfo.table_schema(), self.production_companies))
-        if self.broadcast_info:
-            sections.append(("Broadcast", BroadcastInfo.table_schema(), self.broadcast_info))
-        if self.distribution_info:
-            sections.append(("Distribution", DistributionInfo.table_schema(), self.distribution_info))
-        return sections
-
     @staticmethod
     def get_instructions(additional_info: Sequence[str] | None = None) -> str:
         return compose_instructions(instructions, additional_info)
 
     @staticmethod
     def get_user_prompt(name: str) -> str:
-        return "Produce a richly detailed comedy TV show brief for '" + name + "', emphasizing tone, ensemble chemistry, standout comedic beats, and performance metrics."
-
-    @staticmethod
-    def json_format_instructions() -> str:
-        return (
-            instructions + "\nOUTPUT FORMAT:\nReturn JSON including fields such as title, premise, show_summary, format_type, "
-            "humour_styles, tone, primary_setting, season_count, episode_count, "
-            "episode_length_minutes, release_start_year, release_end_year, age_rating, "
-            "live_audience, improv_elements, writers_room, directors, characters, "
-            "episode_beats, running_gags, critical_reception, audience_metrics, "
-            "production_companies, broadcast_info, distribution_info."
-        )
+        return f"Produce a richly detailed comedy TV show brief for '{name}', emphasizing tone, ensemble chemistry, standout comedic beats, and performance metrics."
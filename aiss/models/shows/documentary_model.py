@@ -36,7 +36,7 @@ class DocumentaryEpisode(JsonModel):
     narrative_devices: list[str] = Field(default_factory=list, description="Narrative devices (interviews, animation)")
 
     @classmethod
-    def table_schema(cls) -> List[TableSchema]:
+    def _build_table_schema(cls) -> List[TableSchema]:
         return [
             TableSchema(name="title", header="Episode", style="magenta"),
             TableSchema(name="focus", header="Focus", style="cyan"),
@@ -54,7 +54,7 @@ class InterviewSubject(JsonModel):
     standout_quote: str = Field("", description="Notable quote or insight")
 
     @classmethod
-    def table_schema(cls) -> List[TableSchema]:
+    def _build_table_schema(cls) -> List[TableSchema]:
         return [
             TableSchema(name="name", header="Subject", style="magenta", no_wrap=True),
             TableSchema(name="expertise", header="Expertise", style="cyan"),
@@ -73,7 +73,7 @@ class ArchiveMaterial(JsonModel):
     usage: str = Field("", description="How it is used in the narrative")
 
     @classmethod
-    def table_schema(cls) -> List[TableSchema]:
+    def _build_table_schema(cls) -> List[TableSchema]:
         return [
             TableSchema(name="material_type", header="Material", style="magenta"),
             TableSchema(name="source", header="Source", style="cyan"),
@@ -91,7 +91,7 @@ class InsightHighlight(JsonModel):
     impact_statement: str = Field("", description="Impact on public understanding or policy")
 
     @classmethod
-    def table_schema(cls) -> List[TableSchema]:
+    def _build_table_schema(cls) -> List[TableSchema]:
         return [
             TableSchema(name="topic", header="Topic", style="magenta"),
             TableSchema(name="takeaway", header="Takeaway", style="cyan"),
@@ -105,6 +105,17 @@ class DocumentaryFactualShowInfo(ShowFormatBase):
     model_name: ClassVar[str] = "DocumentaryFactualShowInfo"
     description: ClassVar[str] = "Comprehensive factual television model capturing investigative craft, storytelling design, and platform reach."
     key_trait: ClassVar[str] = "Non-fiction television that informs through investigative or observational storytelling"
+    table_specs: ClassVar[tuple[tuple[str, str, type[JsonModel]], ...]] = (
+        ("Episodes", "episodes", DocumentaryEpisode),
+        ("Interview Subjects", "interview_subjects", InterviewSubject),
+        ("Archive Materials", "archive_materials", ArchiveMaterial),
+        ("Insights", "insights", InsightHighlight),
+        ("Critical Reception", "critical_reception", CriticalResponse),
+        ("Audience Metrics", "audience_metrics", AudienceEngagement),
+        ("Production Companies", "production_companies", ProductionCompanyInfo),
+        ("Broadcast", "broadcast_info", BroadcastInfo),
+        ("Distribution", "distribution_info", DistributionInfo),
+    )
 
     title: str = Field("", description="Series title")
     show_summary: str = Field("", description="Expanded synopsis")
@@ -166,41 +177,10 @@ class DocumentaryFactualShowInfo(ShowFormatBase):
             ("Rating", self.age_rating or "-"),
         ]
 
-    def _table_sections(self) -> list[tuple[str, List[TableSchema], list[JsonModel]]]:
-        sections: list[tuple[str, List[TableSchema], list[JsonModel]]] = []
-        if self.episodes:
-            sections.append(("Episodes", DocumentaryEpisode.table_schema(), self.episodes))
-        if self.interview_subjects:
-            sections.append(("Interview Subjects", InterviewSubject.table_schema(), self.interview_subjects))
-        if self.archive_materials:
-            sections.append(("Archive Materials", ArchiveMaterial.table_schema(), self.archive_materials))
-        if self.insights:
-            sections.append(("Insights", InsightHighlight.table_schema(), self.insights))
-        if self.critical_reception:
-            sections.append(("Critical Reception", CriticalResponse.table_schema(), self.critical_reception))
-        if self.audience_metrics:
-            sections.append(("Audience Metrics", AudienceEngagement.table_schema(), self.audience_metrics))
-        if self.production_companies:
-            sections.append(("Production Companies", ProductionCompanyInfo.table_schema(), self.production_companies))
-        if self.broadcast_info:
-            sections.append(("Broadcast", BroadcastInfo.table_schema(), self.broadcast_info))
-        if self.distribution_info:
-            sections.append(("Distribution", DistributionInfo.table_schema(), self.distribution_info))
-        return sections
-
     @staticmethod
     def get_instructions(additional_info: Sequence[str] | None = None) -> str:
         return compose_instructions(instructions, additional_info)
 
     @staticmethod
     def get_user_prompt(name: str) -> str:
-        return "Deliver a richly detailed documentary or factual TV show overview for '" + name + "', highlighting scope, storytelling approach, signature episodes, key contributors, and impact."
-
-    @staticmethod
-    def json_format_instructions() -> str:
-        return (
-            instructions + "\nOUTPUT FORMAT:\nReturn JSON keys including title, show_summary, scope, narrative_style, tone, production_style, "
-            "season_count, episode_count, average_runtime_minutes, release_start_year, release_end_year, age_rating, "
-            "directors, narrators, cinematographers, episodes, interview_subjects, archive_materials, insights, "
-            "critical_reception, audience_metrics, production_companies, broadcast_info, distribution_info."
-        )
+        return f"Deliver a richly detailed documentary or factual TV show overview for '{name}', highlighting scope, storytelling approach, signature episodes, key contributors, and impact."
@@ -38,7 +38,7 @@ class DramaCharacterProfile(JsonModel):
     notable_episodes: list[str] = Field(default_factory=list, description="Episodes pivotal to the character arc")
 
     @classmethod
-    def table_schema(cls) -> List[TableSchema]:
+    def _build_table_schema(cls) -> List[TableSchema]:
         return [
             TableSchema(name="name", header="Character", style="magenta", no_wrap=True),
             TableSchema(name="actor", header="Actor", style="cyan"),
@@ -61,7 +61,7 @@ class DramaStoryArc(JsonModel):
     key_turning_point: str = Field("", description="Defining twist or escalation point")
 
     @classmethod
-    def table_schema(cls) -> List[TableSchema]:
+    def _build_table_schema(cls) -> List[TableSchema]:
         return [
             TableSchema(name="arc_title", header="Arc", style="magenta"),
             TableSchema(name="season_focus", header="Season", justify="center", formatter=format_year),
@@ -82,7 +82,7 @@ class DramaAwardRecognition(JsonModel):
     notes: str = Field("", description="Context such as specific episode or season")
 
     @classmethod
-    def table_schema(cls) -> List[TableSchema]:
+    def _build_table_schema(cls) -> List[TableSchema]:
         return [
             TableSchema(name="year", header="Year", justify="center", formatter=format_year),
             TableSchema(name="award_body", header="Award", style="magenta"),
@@ -98,6 +98,16 @@ class DramaShowInfo(ShowFormatBase):
     model_name: ClassVar[str] = "DramaShowInfo"
     description: ClassVar[str] = "Detailed television drama intelligence model capturing serialized storytelling, character evolution, and industry recognition."
     key_trait: ClassVar[str] = "Emotionally charged serialized TV drama anchored by character arcs"
+    table_specs: ClassVar[tuple[tuple[str, str, type[JsonModel]], ...]] = (
+        ("Characters", "characters", DramaCharacterProfile),
+        ("Story Arcs", "major_story_arcs", DramaStoryArc),
+        ("Awards", "awards", DramaAwardRecognition),
+        ("Critical Reception", "critical_reception", CriticalResponse),
+        ("Audience Metrics", "audience_metrics", AudienceEngagement),
+        ("Production Companies", "production_companies", ProductionCompanyInfo),
+        ("Broadcast", "broadcast_info", BroadcastInfo),
+        ("Distribution", "distribution_info", DistributionInfo),
+    )
 
     title: str = Field("", description="Official title of the drama")
     logline: str = Field("", description="High-level premise statement")
@@ -160,41 +170,10 @@ class DramaShowInfo(ShowFormatBase):
             ("Showrunners", ", ".join(self.showrunners) if self.showrunners else "-"),
         ]
 
-    def _table_sections(self) -> list[tuple[str, List[TableSchema], list[JsonModel]]]:
-        sections: list[tuple[str, List[TableSchema], list[JsonModel]]] = []
-        if self.characters:
-            sections.append(("Characters", DramaCharacterProfile.table_schema(), self.characters))
-        if self.major_story_arcs:
-            sections.append(("Story Arcs", DramaStoryArc.table_schema(), self.major_story_arcs))
-        if self.awards:
-            sections.append(("Awards", DramaAwardRecognition.table_schema(), self.awards))
-        if self.critical_reception:
-            sections.append(("Critical Reception", CriticalResponse.table_schema(), self.critical_reception))
-        if self.audience_metrics:
-            sections.append(("Audience Metrics", AudienceEngagement.table_schema(), self.audience_metrics))
-        if self.production_companies:
-            sections.append(("Production Companies", ProductionCompanyInfo.table_schema(), self.production_companies))
-        if self.broadcast_info:
-            sections.append(("Broadcast", BroadcastInfo.table_schema(), self.broadcast_info))
-        if self.distribution_info:
-            sections.append(("Distribution", DistributionInfo.table_schema(), self.distribution_info))
-        return sections
-
     @staticmethod
     def get_instructions(additional_info: Sequence[str] | None = None) -> str:
         return compose_instructions(instructions, additional_info)
 
     @staticmethod
     def get_user_prompt(name: str) -> str:
-        return "Deliver a richly layered drama TV show brief for '" + name + "', covering character journeys, serialized arcs, tonal themes, awards profile, and distribution reach."
-
-    @staticmethod
-    def json_format_instructions() -> str:
-        return (
-            instructions + "\nOUTPUT FORMAT:\nReturn a JSON object with keys such as title, logline, show_summary, "
-            "tone, themes, primary_setting, season_count, episode_count, "
-            "average_runtime_minutes, age_rating, release_start_year, release_end_year, "
-            "showrunners, head_writers, directors, composers, characters, major_story_arcs, "
-            "awards, critical_reception, audience_metrics, production_companies, broadcast_info, "
-            "distribution_info."
-        )
+        return f"Deliver a richly layered drama TV show brief for '{name}', covering character journeys, serialized arcs, tonal themes, awards profile, and distribution reach."
@@ -38,7 +38,7 @@ class FamilyCharacterProfile(JsonModel):
     catchphrases: list[str] = Field(default_factory=list, description="Catchphrases or slogans")
 
     @classmethod
-    def table_schema(cls) -> List[TableSchema]:
+    def _build_table_schema(cls) -> List[TableSchema]:
         return [
             TableSchema(name="name", header="Character", style="magenta", no_wrap=True),
             TableSchema(name="voice_actor", header="Voice Actor", style="cyan"),
@@ -57,7 +57,7 @@ class EducationalSegment(JsonModel):
     takeaway: str = Field("", description="Key lesson takeaway")
 
     @classmethod
-    def table_schema(cls) -> List[TableSchema]:
+    def _build_table_schema(cls) -> List[TableSchema]:
         return [
             TableSchema(name="episode", header="Episode", style="magenta"),
             TableSchema(name="topic", header="Topic", style="cyan"),
@@ -75,7 +75,7 @@ class ParentGuideNote(JsonModel):
     reinforcement_ideas: list[str] = Field(default_factory=list, description="Activities to reinforce lessons")
 
     @classmethod
-    def table_schema(cls) -> List[TableSchema]:
+    def _build_table_schema(cls) -> List[TableSchema]:
         return [
             TableSchema(name="topic", header="Topic", style="magenta"),
             TableSchema(name="emotional_notes", header="Emotional Notes", style="cyan"),
@@ -91,7 +91,7 @@ class MusicMoment(JsonModel):
     purpose: str = Field("", description="Purpose such as teaching, celebration, montage")
 
     @classmethod
-    def table_schema(cls) -> List[TableSchema]:
+    def _build_table_schema(cls) -> List[TableSchema]:
         return [
             TableSchema(name="song_title", header="Song", style="magenta"),
             TableSchema(name="episode", header="Episode", style="cyan"),
@@ -106,6 +106,17 @@ class FamilyAnimationKidsShowInfo(ShowFormatBase):
     model_name: ClassVar[str] = "FamilyAnimationKidsShowInfo"
     description: ClassVar[str] = "Family and kids television intelligence model blending creative highlights, educational intent, and market positioning."
     key_trait: ClassVar[str] = "Family-friendly TV storytelling that balances developmental goals with entertainment"
+    table_specs: ClassVar[tuple[tuple[str, str, type[JsonModel]], ...]] = (
+        ("Characters", "characters", FamilyCharacterProfile),
+        ("Educational Segments", "educational_segments", EducationalSegment),
+        ("Parent Guides", "parent_guides", ParentGuideNote),
+        ("Music Moments", "music", MusicMoment),
+        ("Critical Reception", "critical_reception", CriticalResponse),
+        ("Audience Metrics", "audience_metrics", AudienceEngagement),
+        ("Production Companies", "production_companies", ProductionCompanyInfo),
+        ("Broadcast", "broadcast_info", BroadcastInfo),
+        ("Distribution", "distribution_info", DistributionInfo),
+    )
 
     title: str = Field("", description="Series title")
     show_summary: str = Field("", description="Expanded synopsis")
@@ -171,42 +182,10 @@ class FamilyAnimationKidsShowInfo(ShowFormatBase):
             ("Rating", self.age_rating or "-"),
         ]
 
-    def _table_sections(self) -> list[tuple[str, List[TableSchema], list[JsonModel]]]:
-        sections: list[tuple[str, List[TableSchema], list[JsonModel]]] = []
-        if self.characters:
-            sections.append(("Characters", FamilyCharacterProfile.table_schema(), self.characters))
-        if self.educational_segments:
-            sections.append(("Educational Segments", EducationalSegment.table_schema(), self.educational_segments))
-        if self.parent_guides:
-            sections.append(("Parent Guides", ParentGuideNote.table_schema(), self.parent_guides))
-        if self.music:
-            sections.append(("Music Moments", MusicMoment.table_schema(), self.music))
-        if self.critical_reception:
-            sections.append(("Critical Reception", CriticalResponse.table_schema(), self.critical_reception))
-        if self.audience_metrics:
-            sections.append(("Audience Metrics", AudienceEngagement.table_schema(), self.audience_metrics))
-        if self.production_companies:
-            sections.append(("Production Companies", ProductionCompanyInfo.table_schema(), self.production_companies))
-        if self.broadcast_info:
-            sections.append(("Broadcast", BroadcastInfo.table_schema(), self.broadcast_info))
-        if self.distribution_info:
-            sections.append(("Distribution", DistributionInfo.table_schema(), self.distribution_info))
-        return sections
-
     @staticmethod
     def get_instructions(additional_info: Sequence[str] | None = None) -> str:
         return compose_instructions(instructions, additional_info)
 
     @staticmethod
     def get_user_prompt(name: str) -> str:
-        return "Deliver a comprehensive family or kids TV show profile for '" + name + "', spotlighting educational aims, character ensemble, signature lessons, and reception."
-
-    @staticmethod
-    def json_format_instructions() -> str:
-        return (
-            instructions + "\nOUTPUT FORMAT:\nReturn JSON with keys such as title, show_summary, premise, format_type, target_age_range, "
-            "educational_focus, core_values, tone, season_count, episode_count, average_runtime_minutes, "
-            "release_start_year, release_end_year, age_rating, creators, showrunners, educational_advisors, "
-            "characters, educational_segments, parent_guides, music, critical_reception, audience_metrics, "
-            "production_companies, broadcast_info, distribution_info."
-        )
+        return f"Deliver a comprehensive family or kids TV show profile for '{name}', spotlighting educational aims, character ensemble, signature lessons, and reception."
@@ -36,7 +36,7 @@ class AnchorProfile(JsonModel):
     tenure_years: int = Field(0, description="Years with the programme")
 
     @classmethod
-    def table_schema(cls) -> List[TableSchema]:
+    def _build_table_schema(cls) -> List[TableSchema]:
         return [
             TableSchema(name="name", header="Anchor", style="magenta", no_wrap=True),
             TableSchema(name="role", header="Role", style="yellow"),
@@ -56,7 +56,7 @@ class SegmentBlueprint(JsonModel):
     recurrence: str = Field("", description="Frequency within programme")
 
     @classmethod
-    def table_schema(cls) -> List[TableSchema]:
+    def _build_table_schema(cls) -> List[TableSchema]:
         return [
             TableSchema(name="name", header="Segment", style="magenta"),
             TableSchema(name="format_type", header="Format", style="cyan"),
@@ -75,7 +75,7 @@ class CorrespondentReport(JsonModel):
     date: str = Field("", description="Date of report")
 
     @classmethod
-    def table_schema(cls) -> List[TableSchema]:
+    def _build_table_schema(cls) -> List[TableSchema]:
         return [
             TableSchema(name="correspondent", header="Correspondent", style="magenta"),
             TableSchema(name="location", header="Location", style="cyan"),
@@ -92,7 +92,7 @@ class FactCheckProcess(JsonModel):
     responsible_team: str = Field("", description="Editorial team responsible")
 
     @classmethod
-    def table_schema(cls) -> List[TableSchema]:
+    def _build_table_schema(cls) -> List[TableSchema]:
         return [
             TableSchema(name="step", header="Step", style="magenta"),
             TableSchema(name="responsible_team", header="Team", style="cyan"),
@@ -106,6 +106,17 @@ class NewsInformationalShowInfo(ShowFormatBase):
     model_name: ClassVar[str] = "NewsInformationalShowInfo"
     description: ClassVar[str] = "Television news intelligence model capturing editorial architecture, on-air talent, and platform footprint."
     key_trait: ClassVar[str] = "Timely, verified public-interest journalism delivered as a TV programme"
+    table_specs: ClassVar[tuple[tuple[str, str, type[JsonModel]], ...]] = (
+        ("Anchors", "anchors", AnchorProfile),
+        ("Segments", "segment_blueprints", SegmentBlueprint),
+        ("Correspondent Reports", "correspondent_reports", CorrespondentReport),
+        ("Fact-Check Process", "fact_check_process", FactCheckProcess),
+        ("Critical Reception", "critical_reception", CriticalResponse),
+        ("Audience Metrics", "audience_metrics", AudienceEngagement),
+        ("Production Companies", "production_companies", ProductionCompanyInfo),
+        ("Broadcast", "broadcast_info", BroadcastInfo),
+        ("Distribution", "distribution_info", DistributionInfo),
+    )
 
     title: str = Field("", description="Programme name")
     show_summary: str = Field("", description="Expanded synopsis")
@@ -152,42 +163,10 @@ class NewsInformationalShowInfo(ShowFormatBase):
             ("Digital", ", ".join(self.digital_platforms) if self.digital_platforms else "-"),
         ]
 
-    def _table_sections(self) -> list[tuple[str, List[TableSchema], list[JsonModel]]]:
-        sections: list[tuple[str, List[TableSchema], list[JsonModel]]] = []
-        if self.anchors:
-            sections.append(("Anchors", AnchorProfile.table_schema(), self.anchors))
-        if self.segment_blueprints:
-            sections.append(("Segments", SegmentBlueprint.table_schema(), self.segment_blueprints))
-        if self.correspondent_reports:
-            sections.append(("Correspondent Reports", CorrespondentReport.table_schema(), self.correspondent_reports))
-        if self.fact_check_process:
-            sections.append(("Fact-Check Process", FactCheckProcess.table_schema(), self.fact_check_process))
-        if self.critical_reception:
-            sections.append(("Critical Reception", CriticalResponse.table_schema(), self.critical_reception))
-        if self.audience_metrics:
-            sections.append(("Audience Metrics", AudienceEngagement.table_schema(), self.audience_metrics))
-        if self.production_companies:
-            sections.append(("Production Companies", ProductionCompanyInfo.table_schema(), self.production_companies))
-        if self.broadcast_info:
-            sections.append(("Broadcast", BroadcastInfo.table_schema(), self.broadcast_info))
-        if self.distribution_info:
-            sections.append(("Distribution", DistributionInfo.table_schema(), self.distribution_info))
-        return sections
-
     @staticmethod
     def get_instructions(additional_info: Sequence[str] | None = None) -> str:
         return compose_instructions(instructions, additional_info)
 
     @staticmethod
     def get_user_prompt(name: str) -> str:
-        return "Deliver a comprehensive news or informational TV show overview for '" + name + "', covering talent lineup, segment structure, editorial standards, distribution, and audience performance."
-
-    @staticmethod
-    def json_format_instructions() -> str:
-        return (
-            instructions + "\nOUTPUT FORMAT:\nReturn JSON fields including title, show_summary, network, premiere_year, broadcast_schedule, "
-            "runtime_minutes, production_location, editorial_focus, tone, fact_check_philosophy, verification_sources, "
-            "digital_platforms, executive_producers, anchors, segment_blueprints, correspondent_reports, "
-            "fact_check_process, critical_reception, audience_metrics, production_companies, broadcast_info, "
-            "distribution_info."
-        )
+        return f"Deliver a comprehensive news or informational TV show overview for '{name}', covering talent lineup, segment structure, editorial standards, distribution, and audience performance."
@@ -36,7 +36,7 @@ class HostJudgeProfile(JsonModel):
     seasons_present: list[int] = Field(default_factory=list, description="Seasons they appeared")
 
     @classmethod
-    def table_schema(cls) -> List[TableSchema]:
+    def _build_table_schema(cls) -> List[TableSchema]:
         return [
             TableSchema(name="name", header="Name", style="magenta", no_wrap=True),
             TableSchema(name="role", header="Role", style="yellow"),
@@ -56,7 +56,7 @@ class ParticipantProfile(JsonModel):
     final_outcome: str = Field("", description="Result such as winner, finalist, eliminated week 5")
 
     @classmethod
-    def table_schema(cls) -> List[TableSchema]:
+    def _build_table_schema(cls) -> List[TableSchema]:
         return [
             TableSchema(name="name", header="Participant", style="magenta"),
             TableSchema(name="archetype", header="Archetype", style="yellow"),
@@ -76,7 +76,7 @@ class ChallengeInfo(JsonModel):
     frequency: str = Field("", description="How often it appears")
 
     @classmethod
-    def table_schema(cls) -> List[TableSchema]:
+    def _build_table_schema(cls) -> List[TableSchema]:
         return [
             TableSchema(name="name", header="Challenge", style="magenta"),
             TableSchema(name="challenge_type", header="Type", style="cyan"),
@@ -95,7 +95,7 @@ class FormatPhase(JsonModel):
     signature_elements: list[str] = Field(default_factory=list, description="Signature elements or twists")
 
     @classmethod
-    def table_schema(cls) -> List[TableSchema]:
+    def _build_table_schema(cls) -> List[TableSchema]:
         return [
             TableSchema(name="phase_name", header="Phase", style="magenta"),
             TableSchema(name="elimination_format", header="Elimination", style="yellow"),
@@ -110,6 +110,17 @@ class RealityCompetitionLifestyleShowInfo(ShowFormatBase):
     model_name: ClassVar[str] = "RealityCompetitionLifestyleShowInfo"
     description: ClassVar[str] = "Unscripted television intelligence model emphasizing format structure, on-camera talent, and audience hooks."
     key_trait: ClassVar[str] = "Competition or lifestyle TV storytelling powered by real participants"
+    table_specs: ClassVar[tuple[tuple[str, str, type[JsonModel]], ...]] = (
+        ("Hosts & Judges", "hosts_and_judges", HostJudgeProfile),
+        ("Participants", "participants", ParticipantProfile),
+        ("Challenges", "challenges", ChallengeInfo),
+        ("Format Phases", "format_phases", FormatPhase),
+        ("Critical Reception", "critical_reception", CriticalResponse),
+        ("Audience Metrics", "audience_metrics", AudienceEngagement),
+        ("Production Companies", "production_companies", ProductionCompanyInfo),
+        ("Broadcast", "broadcast_info", BroadcastInfo),
+        ("Distribution", "distribution_info", DistributionInfo),
+    )
 
     title: str = Field("", description="Series title")
     show_summary: str = Field("", description="Expanded synopsis")
@@ -172,41 +183,10 @@ class RealityCompetitionLifestyleShowInfo(ShowFormatBase):
             ("Rating", self.age_rating or "-"),
         ]
 
-    def _table_sections(self) -> list[tuple[str, List[TableSchema], list[JsonModel]]]:
-        sections: list[tuple[str, List[TableSchema], list[JsonModel]]] = []
-        if self.hosts_and_judges:
-            sections.append(("Hosts & Judges", HostJudgeProfile.table_schema(), self.hosts_and_judges))
-        if self.participants:
-            sections.append(("Participants", ParticipantProfile.table_schema(), self.participants))
-        if self.challenges:
-            sections.append(("Challenges", ChallengeInfo.table_schema(), self.challenges))
-        if self.format_phases:
-            sections.append(("Format Phases", FormatPhase.table_schema(), self.format_phases))
-        if self.critical_reception:
-            sections.append(("Critical Reception", CriticalResponse.table_schema(), self.critical_reception))
-        if self.audience_metrics:
-            sections.append(("Audience Metrics", AudienceEngagement.table_schema(), self.audience_metrics))
-        if self.production_companies:
-            sections.append(("Production Companies", ProductionCompanyInfo.table_schema(), self.production_companies))
-        if self.broadcast_info:
-            sections.append(("Broadcast", BroadcastInfo.table_schema(), self.broadcast_info))
-        if self.distribution_info:
-            sections.append(("Distribution", DistributionInfo.table_schema(), self.distribution_info))
-        return sections
-
     @staticmethod
     def get_instructions(additional_info: Sequence[str] | None = None) -> str:
         return compose_instructions(instructions, additional_info)
 
     @staticmethod
     def get_user_prompt(name: str) -> str:
-        return "Deliver a definitive reality, competition, or lifestyle TV show breakdown for '" + name + "', spotlighting talent, contestant archetypes, challenges, format phases, and reception."
-
-    @staticmethod
-    def json_format_instructions() -> str:
-        return (
-            instructions + "\nOUTPUT FORMAT:\nReturn JSON fields including title, show_summary, format_description, subgenre, tone, prize, "
-            "filming_locations, season_count, episode_count, average_runtime_minutes, release_start_year, "
-            "release_end_year, age_rating, creators, showrunners, hosts_and_judges, participants, challenges, "
-            "format_phases, critical_reception, audience_metrics, production_companies, broadcast_info, distribution_info."
-        )
+        return f"Deliver a definitive reality, competition, or lifestyle TV show breakdown for '{name}', spotlighting talent, contestant archetypes, challenges, format phases, and reception."
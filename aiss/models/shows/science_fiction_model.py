@@ -38,7 +38,7 @@ class SciFiCharacterProfile(JsonModel):
     arc_summary: str = Field("", description="Character arc overview")
 
     @classmethod
-    def table_schema(cls) -> List[TableSchema]:
+    def _build_table_schema(cls) -> List[TableSchema]:
         return [
             TableSchema(name="name", header="Character", style="magenta", no_wrap=True),
             TableSchema(name="actor", header="Performer", style="cyan"),
@@ -59,7 +59,7 @@ class TechnologyConcept(JsonModel):
     ethical_implications: str = Field("", description="Ethical or societal impact")
 
     @classmethod
-    def table_schema(cls) -> List[TableSchema]:
+    def _build_table_schema(cls) -> List[TableSchema]:
         return [
             TableSchema(name="name", header="Technology", style="magenta"),
             TableSchema(name="category", header="Category", style="cyan"),
@@ -78,7 +78,7 @@ class TimelineEvent(JsonModel):
     featured_in: list[str] = Field(default_factory=list, description="Episodes or seasons featuring the event")
 
     @classmethod
-    def table_schema(cls) -> List[TableSchema]:
+    def _build_table_schema(cls) -> List[TableSchema]:
         return [
             TableSchema(name="year", header="Year", justify="center", formatter=format_year),
             TableSchema(name="event", header="Event", style="magenta"),
@@ -96,7 +96,7 @@ class ScientificTheme(JsonModel):
     human_implication: str = Field("", description="Human or societal implication highlighted")
 
     @classmethod
-    def table_schema(cls) -> List[TableSchema]:
+    def _build_table_schema(cls) -> List[TableSchema]:
         return [
             TableSchema(name="theme", header="Theme", style="magenta"),
             TableSchema(name="question", header="Guiding Question", style="cyan"),
@@ -110,6 +110,17 @@ class ScienceFictionShowInfo(ShowFormatBase):
     model_name: ClassVar[str] = "ScienceFictionShowInfo"
     description: ClassVar[str] = "Speculative television intelligence model synthesizing world-building, scientific themes, and production context."
     key_trait: ClassVar[str] = "Technology-driven TV storytelling exploring future-facing ideas"
+    table_specs: ClassVar[tuple[tuple[str, str, type[JsonModel]], ...]] = (
+        ("Characters", "characters", SciFiCharacterProfile),
+        ("Technologies", "technologies", TechnologyConcept),
+        ("Timeline", "timeline_events", TimelineEvent),
+        ("Themes", "themes", ScientificTheme),
+        ("Critical Reception", "critical_reception", CriticalResponse),
+        ("Audience Metrics", "audience_metrics", AudienceEngagement),
+        ("Production Companies", "production_companies", ProductionCompanyInfo),
+        ("Broadcast", "broadcast_info", BroadcastInfo),
+        ("Distribution", "distribution_info", DistributionInfo),
+    )
 
     title: str = Field("", description="Series title")
     show_summary: str = Field("", description="Detailed synopsis")
@@ -175,42 +186,10 @@ class ScienceFictionShowInfo(ShowFormatBase):
             ("Rating", self.age_rating or "-"),
         ]
 
-    def _table_sections(self) -> list[tuple[str, List[TableSchema], list[JsonModel]]]:
-        sections: list[tuple[str, List[TableSchema], list[JsonModel]]] = []
-        if self.characters:
-            sections.append(("Characters", SciFiCharacterProfile.table_schema(), self.characters))
-        if self.technologies:
-            sections.append(("Technologies", TechnologyConcept.table_schema(), self.technologies))
-        if self.timeline_events:
-            sections.append(("Timeline", TimelineEvent.table_schema(), self.timeline_events))
-        if self.themes:
-            sections.append(("Themes", ScientificTheme.table_schema(), self.themes))
-        if self.critical_reception:
-            sections.append(("Critical Reception", CriticalResponse.table_schema(), self.critical_reception))
-        if self.audience_metrics:
-            sections.append(("Audience Metrics", AudienceEngagement.table_schema(), self.audience_metrics))
-        if self.production_companies:
-            sections.append(("Production Companies", ProductionCompanyInfo.table_schema(), self.production_companies))
-        if self.broadcast_info:
-            sections.append(("Broadcast", BroadcastInfo.table_schema(), self.broadcast_info))
-        if self.distribution_info:
-            sections.append(("Distribution", DistributionInfo.table_schema(), self.distribution_info))
-        return sections
-
     @staticmethod
     def get_instructions(additional_info: Sequence[str] | None = None) -> str:
         return compose_instructions(instructions, additional_info)
 
     @staticmethod
     def get_user_prompt(name: str) -> str:
-        return "Produce a comprehensive science fiction TV show briefing for '" + name + "', highlighting world-building, speculative technology, timeline events, and creative reception."
-
-    @staticmethod
-    def json_format_instructions() -> str:
-        return (
-            instructions + "\nOUTPUT FORMAT:\nReturn JSON keys such as title, show_summary, premise, world_setting, subgenre, scientific_focus, "
-            "philosophical_questions, tone, season_count, episode_count, average_runtime_minutes, age_rating, "
-            "release_start_year, release_end_year, creators, showrunners, scientific_consultants, characters, "
-            "technologies, timeline_events, themes, critical_reception, audience_metrics, production_companies, "
-            "broadcast_info, distribution_info."
-        )
+        return f"Produce a comprehensive science fiction TV show briefing for '{name}', highlighting world-building, speculative technology, timeline events, and creative reception."
@@ -36,7 +36,7 @@ class SportsPresenter(JsonModel):
     tone: str = Field("", description="On-air tone or personality")
 
     @classmethod
-    def table_schema(cls) -> List[TableSchema]:
+    def _build_table_schema(cls) -> List[TableSchema]:
         return [
             TableSchema(name="name", header="Presenter", style="magenta", no_wrap=True),
             TableSchema(name="role", header="Role", style="yellow"),
@@ -56,7 +56,7 @@ class CoverageSegment(JsonModel):
     duration_minutes: int = Field(0, description="Typical duration")
 
     @classmethod
-    def table_schema(cls) -> List[TableSchema]:
+    def _build_table_schema(cls) -> List[TableSchema]:
         return [
             TableSchema(name="name", header="Segment", style="magenta"),
             TableSchema(name="sport", header="Sport", style="cyan"),
@@ -75,7 +75,7 @@ class TeamAthleteFeature(JsonModel):
     stats_highlight: str = Field("", description="Stat or record emphasised")
 
     @classmethod
-    def table_schema(cls) -> List[TableSchema]:
+    def _build_table_schema(cls) -> List[TableSchema]:
         return [
             TableSchema(name="subject", header="Subject", style="magenta"),
             TableSchema(name="league", header="League", style="cyan"),
@@ -94,7 +94,7 @@ class SeasonEventBlock(JsonModel):
     rights_holder: str = Field("", description="Broadcast rights holder")
 
     @classmethod
-    def table_schema(cls) -> List[TableSchema]:
+    def _build_table_schema(cls) -> List[TableSchema]:
         return [
             TableSchema(name="event_name", header="Event", style="magenta"),
             TableSchema(name="start_date", header="Start", style="cyan"),
@@ -113,7 +113,7 @@ class StatHighlight(JsonModel):
     context: str = Field("", description="Contextual note or comparison")
 
     @classmethod
-    def table_schema(cls) -> List[TableSchema]:
+    def _build_table_schema(cls) -> List[TableSchema]:
         return [
             TableSchema(name="metric", header="Metric", style="magenta"),
             TableSchema(name="leader", header="Leader", style="cyan"),
@@ -128,6 +128,18 @@ class SportsShowInfo(ShowFormatBase):
     model_name: ClassVar[str] = "SportsShowInfo"
     description: ClassVar[str] = "Sports television intelligence model encapsulating live and studio coverage strategy, rights positioning, and audience impact."
     key_trait: ClassVar[str] = "Rights-driven sports TV coverage blending live action and analysis"
+    table_specs: ClassVar[tuple[tuple[str, str, type[JsonModel]], ...]] = (
+        ("Presenters", "presenters", SportsPresenter),
+        ("Coverage Segments", "coverage_segments", CoverageSegment),
+        ("Team/Athlete Features", "team_features", TeamAthleteFeature),
+        ("Seasonal Events", "seasonal_events", SeasonEventBlock),
+        ("Stat Highlights", "stat_highlights", StatHighlight),
+        ("Critical Reception", "critical_reception", CriticalResponse),
+        ("Audience Metrics", "audience_metrics", AudienceEngagement),
+        ("Production Companies", "production_companies", ProductionCompanyInfo),
+        ("Broadcast", "broadcast_info", BroadcastInfo),
+        ("Distribution", "distribution_info", DistributionInfo),
+    )
 
     title: str = Field("", description="Programme title")
     show_summary: str = Field("", description="Expanded synopsis")
@@ -178,43 +190,10 @@ class SportsShowInfo(ShowFormatBase):
             ("Monetization", ", ".join(self.monetization) if self.monetization else "-"),
         ]
 
-    def _table_sections(self) -> list[tuple[str, List[TableSchema], list[JsonModel]]]:
-        sections: list[tuple[str, List[TableSchema], list[JsonModel]]] = []
-        if self.presenters:
-            sections.append(("Presenters", SportsPresenter.table_schema(), self.presenters))
-        if self.coverage_segments:
-            sections.append(("Coverage Segments", CoverageSegment.table_schema(), self.coverage_segments))
-        if self.team_features:
-            sections.append(("Team/Athlete Features", TeamAthleteFeature.table_schema(), self.team_features))
-        if self.seasonal_events:
-            sections.append(("Seasonal Events", SeasonEventBlock.table_schema(), self.seasonal_events))
-        if self.stat_highlights:
-            sections.append(("Stat Highlights", StatHighlight.table_schema(), self.stat_highlights))
-        if self.critical_reception:
-            sections.append(("Critical Reception", CriticalResponse.table_schema(), self.critical_reception))
-        if self.audience_metrics:
-            sections.append(("Audience Metrics", AudienceEngagement.table_schema(), self.audience_metrics))
-        if self.production_companies:
-            sections.append(("Production Companies", ProductionCompanyInfo.table_schema(), self.production_companies))
-        if self.broadcast_info:
-            sections.append(("Broadcast", BroadcastInfo.table_schema(), self.broadcast_info))
-        if self.distribution_info:
-            sections.append(("Distribution", DistributionInfo.table_schema(), self.distribution_info))
-        return sections
-
     @staticmethod
     def get_instructions(additional_info: Sequence[str] | None = None) -> str:
         return compose_instructions(instructions, additional_info)
 
     @staticmethod
     def get_user_prompt(name: str) -> str:
-        return "Deliver a full-spectrum sports TV show overview for '" + name + "', detailing presenters, coverage segments, seasonal plans, rights context, and performance metrics."
-
-    @staticmethod
-    def json_format_instructions() -> str:
-        return (
-            instructions + "\nOUTPUT FORMAT:\nReturn JSON keys including title, show_summary, network, premiere_year, broadcast_schedule, runtime_minutes, "
-            "sports_covered, flagship_elements, production_style, tone, rights_overview, digital_strategy, monetization, "
-            "executive_producers, presenters, coverage_segments, team_features, seasonal_events, stat_highlights, "
-            "critical_reception, audience_metrics, production_companies, broadcast_info, distribution_info."
-        )
+        return f"Deliver a full-spectrum sports TV show overview for '{name}', detailing presenters, coverage segments, seasonal plans, rights context, and performance metrics."
@@ -38,7 +38,7 @@ class InvestigatorProfile(JsonModel):
     status: str = Field("", description="Current status within the story")
 
     @classmethod
-    def table_schema(cls) -> List[TableSchema]:
+    def _build_table_schema(cls) -> List[TableSchema]:
         return [
             TableSchema(name="name", header="Investigator", style="magenta", no_wrap=True),
             TableSchema(name="actor", header="Actor", style="cyan"),
@@ -60,7 +60,7 @@ class MajorCaseFile(JsonModel):
     antagonists_involved: list[str] = Field(default_factory=list, description="Key antagonists tied to the case")
 
     @classmethod
-    def table_schema(cls) -> List[TableSchema]:
+    def _build_table_schema(cls) -> List[TableSchema]:
         return [
             TableSchema(name="case_name", header="Case", style="magenta"),
             TableSchema(name="season", header="Season", justify="center", formatter=format_year),
@@ -82,7 +82,7 @@ class AntagonistProfile(JsonModel):
     fate: str = Field("", description="Fate within the narrative")
 
     @classmethod
-    def table_schema(cls) -> List[TableSchema]:
+    def _build_table_schema(cls) -> List[TableSchema]:
         return [
             TableSchema(name="name", header="Antagonist", style="magenta"),
             TableSchema(name="motive", header="Motive", style="yellow"),
@@ -98,6 +98,16 @@ class ThrillerShowInfo(ShowFormatBase):
     model_name: ClassVar[str] = "ThrillerShowInfo"
     description: ClassVar[str] = "Suspense television intelligence model spotlighting investigative craft, tension architecture, and market positioning."
     key_trait: ClassVar[str] = "High-stakes crime or mystery TV engineered for sustained suspense"
+    table_specs: ClassVar[tuple[tuple[str, str, type[JsonModel]], ...]] = (
+        ("Investigators", "investigators", InvestigatorProfile),
+        ("Major Cases", "major_cases", MajorCaseFile),
+        ("Antagonists", "antagonists", AntagonistProfile),
+        ("Critical Reception", "critical_reception", CriticalResponse),
+        ("Audience Metrics", "audience_metrics", AudienceEngagement),
+        ("Production Companies", "production_companies", ProductionCompanyInfo),
+        ("Broadcast", "broadcast_info", BroadcastInfo),
+        ("Distribution", "distribution_info", DistributionInfo),
+    )
 
     title: str = Field("", description="Series title")
     tagline: str = Field("", description="Tagline or hook")
@@ -162,40 +172,10 @@ class ThrillerShowInfo(ShowFormatBase):
             ("Runtime", runtime),
         ]
 
-    def _table_sections(self) -> list[tuple[str, List[TableSchema], list[JsonModel]]]:
-        sections: list[tuple[str, List[TableSchema], list[JsonModel]]] = []
-        if self.investigators:
-            sections.append(("Investigators", InvestigatorProfile.table_schema(), self.investigators))
-        if self.major_cases:
-            sections.append(("Major Cases", MajorCaseFile.table_schema(), self.major_cases))
-        if self.antagonists:
-            sections.append(("Antagonists", AntagonistProfile.table_schema(), self.antagonists))
-        if self.critical_reception:
-            sections.append(("Critical Reception", CriticalResponse.table_schema(), self.critical_reception))
-        if self.audience_metrics:
-            sections.append(("Audience Metrics", AudienceEngagement.table_schema(), self.audience_metrics))
-        if self.production_companies:
-            sections.append(("Production Companies", ProductionCompanyInfo.table_schema(), self.production_companies))
-        if self.broadcast_info:
-            sections.append(("Broadcast", BroadcastInfo.table_schema(), self.broadcast_info))
-        if self.distribution_info:
-            sections.append(("Distribution", DistributionInfo.table_schema(), self.distribution_info))
-        return sections
-
     @staticmethod
     def get_instructions(additional_info: Sequence[str] | None = None) -> str:
         return compose_instructions(instructions, additional_info)
 
     @staticmethod
     def get_user_prompt(name: str) -> str:
-        return "Deliver a high-tension thriller TV show analysis for '" + name + "', covering investigators, signature cases, antagonists, structure, and reception."
-
-    @staticmethod
-    def json_format_instructions() -> str:
-        return (
-            instructions + "\nOUTPUT FORMAT:\nReturn JSON with keys including title, tagline, show_summary, subgenre, "
-            "narrative_structure, tone, themes, violence_level, age_rating, season_count, episode_count, "
-            "average_runtime_minutes, release_start_year, release_end_year, creators, showrunners, consultants, "
-            "investigators, major_cases, antagonists, critical_reception, audience_metrics, production_companies, "
-            "broadcast_info, distribution_info."
-        )
+        return f"Deliver a high-tension thriller TV show analysis for '{name}', covering investigators, signature cases, antagonists, structure, and reception."
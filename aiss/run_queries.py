@@ -9,7 +9,7 @@ from rich.progress import (
     TimeElapsedColumn,
 )
 
-from .check_model import find_model_from_input
+from .check_model import find_model_from_input, make_classification_client
 from .models.shared import ResultType
 from .openai_direct import get_json_response, get_parsed_response, get_text_response
 
@@ -37,7 +37,7 @@ def run_the_query(input_text: str, result_type: ResultType | str | None = Result
         console.print("[bold red]Error:[/bold red] Input text must be provided")
         return
 
-    client: OpenAI = OpenAI()
+    client: OpenAI = make_classification_client()
 
     if not result_type:
         result_type = ResultType.PARSED
@@ -7,7 +7,8 @@ rendered to the terminal using Rich. It exposes two primary helpers:
 """
 
 import json
-from typing import List, Union
+from functools import lru_cache
+from typing import Sequence, Union
 
 from rich.console import Console
 from rich.panel import Panel
@@ -67,7 +68,14 @@ def format_year(v) -> str:
     Format a year-like value into a human-friendly string.
 
     Returns '-' for falsy values, otherwise returns the integer form as a string.
+    Plain ``int``/``float`` inputs are memoised; anything else is formatted directly.
     """
+    if type(v) in _CACHEABLE_NUMBERS:
+        return _format_year_cached(v)
+    return _format_year(v)
+
+
+def _format_year(v) -> str:
     try:
         if v is None:
             return "-"
@@ -96,6 +104,12 @@ def format_year(v) -> str:
 def format_number(v) -> str:
     """Format large integers with thousands separators."""
 
+    if type(v) in _CACHEABLE_NUMBERS:
+        return _format_number_cached(v)
+    return _format_number(v)
+
+
+def _format_number(v) -> str:
     try:
         number = _coerce_numeric(v)
     except Exception:
@@ -107,6 +121,12 @@ def format_number(v) -> str:
     return f"{number:,.2f}".rstrip("0").rstrip(".")
 
 
+# Exact types only: ``bool`` is an ``int`` subclass and would share cache slots.
+_CACHEABLE_NUMBERS = (int, float)
+_format_year_cached = lru_cache(maxsize=256)(_format_year)
+_format_number_cached = lru_cache(maxsize=1024)(_format_number)
+
+
 def format_decimal(v, digits: int = 1) -> str:
     """Format a numeric value to a fixed number of decimal places."""
 
@@ -137,8 +157,17 @@ def format_percentage(v) -> str:
 
 
 def format_runtime_minutes(v) -> str:
-    """Format a runtime in minutes with a suffix."""
+    """Format a runtime in minutes with a suffix.
 
+    Plain ``int``/``float`` inputs are memoised; anything else is formatted directly.
+    """
+
+    if type(v) in _CACHEABLE_NUMBERS:
+        return _format_runtime_minutes_cached(v)
+    return _format_runtime_minutes(v)
+
+
+def _format_runtime_minutes(v) -> str:
     try:
         minutes = int(round(_coerce_numeric(v)))
     except Exception:
@@ -149,27 +178,44 @@ def format_runtime_minutes(v) -> str:
     return f"{minutes:,} min"
 
 
+_format_runtime_minutes_cached = lru_cache(maxsize=256)(_format_runtime_minutes)
+
+
+def format_list(values, sep: str = ", ") -> str:
+    """Join a sequence of strings, returning '-' when it is empty."""
+
+    return sep.join(values) if values else "-"
+
+
 # MARK: Table Renderer
-def render_table_from_schema(title: str, schema: List[TableSchema], items: list, console: Console) -> None:
+def _cell_text(val):
+    """Join list/tuple cell values for display; other values pass through unchanged."""
+    if isinstance(val, (list, tuple)):
+        # join simple elements, otherwise str() each
+        try:
+            return ", ".join(str(x) for x in val)
+        except Exception:
+            return str(val)
+    return val
+
+
+def build_table_from_schema(title: str, schema: Sequence[TableSchema], items: list) -> Table:
     """
-    Render a Rich Table from a schema and list of objects.
+    Build a Rich Table from a schema and list of objects without printing it.
 
     :param title: Title used for the Rich Table
     :type title: str
 
     :param schema: Column schema as a list of dicts (legacy) or TableSchema
         dataclass instances.
-    :type schema: List[Union[dict, TableSchema]]
+    :type schema: Sequence[Union[dict, TableSchema]]
 
     :param items: Iterable of items to render. Each item may be a dict or an
         object with attributes matching the schema.name values.
     :type items: list
 
-    :param console: Rich Console to print the table to
-    :type console: Console
-
-    :return: None
-    :rtype: None
+    :return: The populated table
+    :rtype: Table
     """
     table = Table(title=title, show_lines=True)
     # add columns
@@ -186,54 +232,63 @@ def render_table_from_schema(title: str, schema: List[TableSchema], items: list,
         else:
             table.add_column(header, style=style, no_wrap=no_wrap)
 
-    # add rows
+    # add rows; resolve per-column lookups once rather than once per cell
+    columns = [(col.name, col.formatter) for col in schema]
     for it in items:
+        is_dict = isinstance(it, dict)
         row = []
-        for col in schema:
-            attr = col.name
-            formatter = col.formatter
-
+        for attr, formatter in columns:
             # support items that are either objects (getattr) or dicts
             if attr:
-                if isinstance(it, dict):
-                    val = it.get(attr)
-                else:
-                    val = getattr(it, attr, None)
+                val = it.get(attr) if is_dict else getattr(it, attr, None)
             else:
                 val = None
 
             if val is None:
                 rendered = "-"
+            elif not formatter:
+                rendered = _cell_text(val)
             else:
-                # handle common container types
-                if isinstance(val, (list, tuple)) and not isinstance(val, str):
-                    # join simple elements, otherwise str() each
-                    try:
-                        rendered = ", ".join(str(x) for x in val)
-                    except Exception:
-                        rendered = str(val)
-                else:
-                    rendered = val
-
-                if formatter:
-                    try:
-                        if callable(formatter):
-                            rendered = formatter(val)
-                        elif isinstance(formatter, str):
-                            # treat as format spec
-                            rendered = format(val, formatter)
-                        else:
-                            # unknown formatter type; fall back to str()
-                            rendered = str(rendered)
-                    except Exception:
-                        # on any formatting failure, fall back to str()
-                        rendered = str(val)
+                try:
+                    if callable(formatter):
+                        rendered = formatter(val)
+                    elif isinstance(formatter, str):
+                        # treat as format spec
+                        rendered = format(val, formatter)
+                    else:
+                        # unknown formatter type; fall back to str()
+                        rendered = str(_cell_text(val))
+                except Exception:
+                    # on any formatting failure, fall back to str()
+                    rendered = str(val)
 
             row.append(str(rendered))
 
         table.add_row(*row)
 
-    console.print(table)
+    return table
+
+
+def render_table_from_schema(title: str, schema: Sequence[TableSchema], items: list, console: Console) -> None:
+    """
+    Render a Rich Table from a schema and list of objects.
+
+    :param title: Title used for the Rich Table
+    :type title: str
+
+    :param schema: Column schema as TableSchema dataclass instances
+    :type schema: Sequence[TableSchema]
+
+    :param items: Iterable of items to render
+    :type items: list
+
+    :param console: Rich Console to print the table to
+    :type console: Console
+
+    :return: None
+    :rtype: None
+    """
+    console.print(build_table_from_schema(title, schema, items))
 
 
 def render_from_json(data: Union[dict, str], console: Console) -> None:
@@ -243,3 +243,10 @@ def test_action_adventure_world_setting(action_adventure_game_full):
     """Test world setting is accessible."""
     assert action_adventure_game_full.world_setting
     assert "Post-apocalyptic fantasy" in action_adventure_game_full.world_setting
+
+
+def test_action_adventure_exploration_fact():
+    """Test exploration focus entries are shown comma-separated, with a dash when empty."""
+    game = ActionAdventureGameInfo(exploration_focus="hub;open world")
+    assert dict(game._fact_pairs())["Exploration"] == "hub, open world"
+    assert dict(ActionAdventureGameInfo()._fact_pairs())["Exploration"] == "-"
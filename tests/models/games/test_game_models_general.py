@@ -107,6 +107,18 @@ def test_game_model_get_instructions_with_additional_info(model_class):
     assert "Additional context" in instructions or "Extra context" in instructions
 
 
+@pytest.mark.parametrize("model_class", ALL_GAME_MODELS)
+def test_game_model_json_format_instructions_is_prebuilt(model_class):
+    """Test JSON format instructions are built once and extend the base instructions."""
+    text = model_class.json_format_instructions()
+    assert text is model_class.json_format_instructions()
+    assert text.startswith(model_class.get_instructions())
+    assert "OUTPUT FORMAT" in text
+
+    advertised = text.rsplit("keys such as ", 1)[1].rstrip(".").split(", ")
+    assert advertised == [name for name, field in model_class.model_fields.items() if not field.exclude]
+
+
 @pytest.mark.parametrize("model_class", ALL_GAME_MODELS)
 def test_game_model_get_user_prompt(model_class):
     """Test get_user_prompt returns a string with the game name."""
@@ -166,6 +178,12 @@ def test_game_model_extra_panels_returns_sequence(model_class):
     assert isinstance(panels, (list, tuple))
 
 
+@pytest.mark.parametrize("model_class", ALL_GAME_MODELS)
+def test_game_model_extra_panels_skip_blank_bodies(model_class):
+    """Test sparse models produce no empty extra panels."""
+    assert list(model_class()._extra_panels()) == []
+
+
 @pytest.mark.parametrize("model_class", ALL_GAME_MODELS)
 def test_game_model_summary_panel_returns_tuple(model_class):
     """Test _summary_panel returns a tuple with title, lines, style."""
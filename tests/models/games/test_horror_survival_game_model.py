@@ -229,6 +229,17 @@ def test_horror_survival_table_sections(horror_survival_game_full):
     assert "Scenarios" in section_titles
 
 
+def test_horror_survival_table_sections_follow_spec_order(horror_survival_game_full):
+    """Test sections follow table_specs order, skip empty fields and reuse cached schemas."""
+    sections = horror_survival_game_full._table_sections()
+    spec_titles = [label for label, attribute, _ in HorrorSurvivalGameInfo.table_specs if getattr(horror_survival_game_full, attribute)]
+
+    assert [title for title, _, _ in sections] == spec_titles
+    threats = next(schema for title, schema, _ in sections if title == "Threats")
+    assert threats is ThreatProfile.table_schema_shared()
+    assert HorrorSurvivalGameInfo()._table_sections() == []
+
+
 def test_horror_survival_empty_optional_fields(console):
     """Test game with minimal data."""
     game = HorrorSurvivalGameInfo(
@@ -259,6 +270,16 @@ def test_horror_survival_roundtrip():
     assert restored.average_session_minutes == original.average_session_minutes
 
 
+def test_horror_survival_trusted_roundtrip(horror_survival_game_full):
+    """Test trusted hydration rebuilds game-specific nested rows without validation."""
+    data = horror_survival_game_full.to_dict()
+    restored = HorrorSurvivalGameInfo.from_dict_trusted(data)
+
+    assert isinstance(restored.threats[0], ThreatProfile)
+    assert isinstance(restored.scenarios[0], ScenarioStructureProfile)
+    assert restored == HorrorSurvivalGameInfo.from_dict(data)
+
+
 def test_threat_profile_table_schema():
     """Test ThreatProfile has table schema."""
     schema = ThreatProfile.table_schema()
@@ -285,6 +285,16 @@ def test_mmo_online_roundtrip():
     assert restored.operations_cadence == original.operations_cadence
 
 
+def test_mmo_online_trusted_roundtrip(mmo_online_game_full):
+    """Test trusted hydration rebuilds game-specific nested rows without validation."""
+    data = mmo_online_game_full.to_dict()
+    restored = MmoOnlineGameInfo.from_dict_trusted(data)
+
+    assert isinstance(restored.server_architecture[0], ServerArchitectureProfile)
+    assert isinstance(restored.endgame_activities[0], EndgameActivityProfile)
+    assert restored == MmoOnlineGameInfo.from_dict(data)
+
+
 def test_server_architecture_profile_table_schema():
     """Test ServerArchitectureProfile has table schema."""
     schema = ServerArchitectureProfile.table_schema()
@@ -263,6 +263,16 @@ def test_puzzle_strategy_roundtrip():
     assert restored.target_audience == original.target_audience
 
 
+def test_puzzle_strategy_trusted_roundtrip(puzzle_strategy_game_full):
+    """Test trusted hydration rebuilds game-specific nested rows without validation."""
+    data = puzzle_strategy_game_full.to_dict()
+    restored = PuzzleStrategyGameInfo.from_dict_trusted(data)
+
+    assert isinstance(restored.puzzle_modules[0], PuzzleModuleInfo)
+    assert isinstance(restored.teaching_moments[0], TeachingMomentInfo)
+    assert restored == PuzzleStrategyGameInfo.from_dict(data)
+
+
 def test_puzzle_module_info_table_schema():
     """Test PuzzleModuleInfo has table schema."""
     schema = PuzzleModuleInfo.table_schema()
@@ -274,6 +274,18 @@ def test_role_playing_roundtrip():
     assert restored.build_flexibility == original.build_flexibility
 
 
+def test_role_playing_trusted_roundtrip(role_playing_game_full):
+    """Test trusted hydration rebuilds game-specific nested rows without validation."""
+    data = role_playing_game_full.to_dict()
+    restored = RolePlayingGameInfo.from_dict_trusted(data)
+
+    assert isinstance(restored.factions[0], FactionProfile)
+    assert isinstance(restored.character_classes[0], CharacterClassProfile)
+    assert isinstance(restored.companions[0], CompanionProfile)
+    assert isinstance(restored.developers[0], StudioProfile)
+    assert restored == RolePlayingGameInfo.from_dict(data)
+
+
 def test_character_class_profile_table_schema():
     """Test CharacterClassProfile has table schema."""
     schema = CharacterClassProfile.table_schema()
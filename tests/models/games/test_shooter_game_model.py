@@ -316,6 +316,17 @@ def test_shooter_game_roundtrip():
     assert restored.match_length_minutes == original.match_length_minutes
 
 
+def test_shooter_game_trusted_roundtrip(shooter_game_full):
+    """Test trusted hydration rebuilds game-specific nested rows without validation."""
+    data = shooter_game_full.to_dict()
+    restored = ShooterGameInfo.from_dict_trusted(data)
+
+    assert isinstance(restored.weapon_archetypes[0], WeaponArchetypeInfo)
+    assert isinstance(restored.map_rotation[0], MapRotationInfo)
+    assert isinstance(restored.platform_releases[0], PlatformReleaseInfo)
+    assert restored == ShooterGameInfo.from_dict(data)
+
+
 def test_weapon_archetype_table_schema():
     """Test WeaponArchetypeInfo has table schema."""
     schema = WeaponArchetypeInfo.table_schema()
@@ -265,6 +265,16 @@ def test_simulation_sandbox_roundtrip():
     assert restored.simulation_scope == original.simulation_scope
 
 
+def test_simulation_sandbox_trusted_roundtrip(simulation_sandbox_game_full):
+    """Test trusted hydration rebuilds game-specific nested rows without validation."""
+    data = simulation_sandbox_game_full.to_dict()
+    restored = SimulationSandboxGameInfo.from_dict_trusted(data)
+
+    assert isinstance(restored.simulation_systems[0], SimulationSystemProfile)
+    assert isinstance(restored.creator_tools[0], CreatorToolProfile)
+    assert restored == SimulationSandboxGameInfo.from_dict(data)
+
+
 def test_simulation_system_profile_table_schema():
     """Test SimulationSystemProfile has table schema."""
     schema = SimulationSystemProfile.table_schema()
@@ -272,6 +272,17 @@ def test_sports_racing_roundtrip():
     assert restored.sport_focus == original.sport_focus
 
 
+def test_sports_racing_trusted_roundtrip(sports_racing_game_full):
+    """Test trusted hydration rebuilds game-specific nested rows without validation."""
+    data = sports_racing_game_full.to_dict()
+    restored = SportsRacingGameInfo.from_dict_trusted(data)
+
+    assert isinstance(restored.league_licenses[0], LeagueLicenseProfile)
+    assert isinstance(restored.roster[0], AthleteVehicleProfile)
+    assert isinstance(restored.modes[0], SportsModeProfile)
+    assert restored == SportsRacingGameInfo.from_dict(data)
+
+
 def test_league_license_profile_table_schema():
     """Test LeagueLicenseProfile has table schema."""
     schema = LeagueLicenseProfile.table_schema()
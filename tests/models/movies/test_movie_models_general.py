@@ -12,7 +12,7 @@ from aiss.models.movies import (
     RomanceMovieInfo,
     ThrillerMysteryCrimeMovieInfo,
 )
-from aiss.models.movies._base import BaseMovieInfo
+from aiss.models.movies._base import BaseMovieInfo, BoxOfficeInfo, CastMemberInfo
 
 # All movie model classes to test
 ALL_MOVIE_MODELS = [
@@ -134,6 +134,14 @@ def test_movie_model_json_format_instructions(model_class):
     assert "JSON" in instructions
 
 
+@pytest.mark.parametrize("model_class", ALL_MOVIE_MODELS)
+def test_movie_model_json_format_instructions_cached(model_class):
+    """Test the schema-bearing instructions are rendered once per class."""
+    first = model_class.json_format_instructions()
+    assert model_class.json_format_instructions() is first
+    assert model_class._json_schema() in first
+
+
 @pytest.mark.parametrize("model_class", ALL_MOVIE_MODELS)
 def test_movie_model_render_empty_instance(model_class, console):
     """Test that rendering an empty instance doesn't crash."""
@@ -219,6 +227,23 @@ def test_movie_model_roundtrip_dict(model_class):
     assert restored.runtime_minutes == original.runtime_minutes
 
 
+@pytest.mark.parametrize("model_class", ALL_MOVIE_MODELS)
+def test_movie_model_trusted_roundtrip(model_class, tmp_path):
+    """Test from_json_trusted rebuilds nested rows and matches the validating loader."""
+    original = model_class(
+        title="Trusted",
+        cast=[CastMemberInfo(character="Lead", actor="Someone")],
+        box_office=BoxOfficeInfo(budget=1_000_000),
+    )
+    path = tmp_path / "trusted.json"
+    original.to_json(path)
+
+    loaded = model_class.from_json_trusted(path)
+    assert isinstance(loaded.cast[0], CastMemberInfo)
+    assert isinstance(loaded.box_office, BoxOfficeInfo)
+    assert loaded == model_class.from_json(path) == original
+
+
 @pytest.mark.parametrize("model_class", ALL_MOVIE_MODELS)
 def test_movie_model_has_cast_field(model_class):
     """Verify each movie model has a cast field."""
@@ -28,6 +28,76 @@ ALL_SHOW_MODELS = [
     ThrillerShowInfo,
 ]
 
+# Pinned advertised key order per show; a change here changes the LLM prompt.
+EXPECTED_SHOW_JSON_KEYS = {
+    ActionAdventureFantasyShowInfo: (
+        "title, show_summary, tagline, world_setting, genre_mix, tone, core_themes, season_count, "
+        "episode_count, average_runtime_minutes, age_rating, visual_style, effects_approach, "
+        "release_start_year, release_end_year, creators, showrunners, stunt_coordinators, heroes, "
+        "quest_arcs, world_locations, artifacts, critical_reception, audience_metrics, "
+        "production_companies, broadcast_info, distribution_info"
+    ),
+    ComedyShowInfo: (
+        "title, premise, show_summary, format_type, humour_styles, tone, primary_setting, season_count, "
+        "episode_count, episode_length_minutes, release_start_year, release_end_year, age_rating, "
+        "live_audience, improv_elements, characters, episode_beats, running_gags, critical_reception, "
+        "audience_metrics, writers_room, directors, production_companies, broadcast_info, "
+        "distribution_info"
+    ),
+    DocumentaryFactualShowInfo: (
+        "title, show_summary, scope, narrative_style, tone, season_count, episode_count, "
+        "average_runtime_minutes, release_start_year, release_end_year, age_rating, directors, narrators, "
+        "cinematographers, production_style, episodes, interview_subjects, archive_materials, insights, "
+        "critical_reception, audience_metrics, production_companies, broadcast_info, distribution_info"
+    ),
+    DramaShowInfo: (
+        "title, logline, show_summary, tone, themes, primary_setting, season_count, episode_count, "
+        "average_runtime_minutes, age_rating, release_start_year, release_end_year, showrunners, "
+        "head_writers, directors, composers, characters, major_story_arcs, awards, critical_reception, "
+        "audience_metrics, production_companies, broadcast_info, distribution_info"
+    ),
+    FamilyAnimationKidsShowInfo: (
+        "title, show_summary, premise, format_type, target_age_range, educational_focus, core_values, "
+        "tone, season_count, episode_count, average_runtime_minutes, release_start_year, "
+        "release_end_year, age_rating, creators, showrunners, educational_advisors, characters, "
+        "educational_segments, parent_guides, music, critical_reception, audience_metrics, "
+        "production_companies, broadcast_info, distribution_info"
+    ),
+    NewsInformationalShowInfo: (
+        "title, show_summary, network, premiere_year, broadcast_schedule, runtime_minutes, "
+        "production_location, editorial_focus, tone, fact_check_philosophy, verification_sources, "
+        "digital_platforms, executive_producers, anchors, segment_blueprints, correspondent_reports, "
+        "fact_check_process, critical_reception, audience_metrics, production_companies, broadcast_info, "
+        "distribution_info"
+    ),
+    RealityCompetitionLifestyleShowInfo: (
+        "title, show_summary, format_description, subgenre, tone, prize, filming_locations, season_count, "
+        "episode_count, average_runtime_minutes, release_start_year, release_end_year, age_rating, "
+        "creators, showrunners, hosts_and_judges, participants, challenges, format_phases, "
+        "critical_reception, audience_metrics, production_companies, broadcast_info, distribution_info"
+    ),
+    ScienceFictionShowInfo: (
+        "title, show_summary, premise, world_setting, subgenre, scientific_focus, "
+        "philosophical_questions, tone, season_count, episode_count, average_runtime_minutes, age_rating, "
+        "release_start_year, release_end_year, creators, showrunners, scientific_consultants, characters, "
+        "technologies, timeline_events, themes, critical_reception, audience_metrics, "
+        "production_companies, broadcast_info, distribution_info"
+    ),
+    SportsShowInfo: (
+        "title, show_summary, network, premiere_year, broadcast_schedule, runtime_minutes, "
+        "sports_covered, flagship_elements, production_style, tone, rights_overview, digital_strategy, "
+        "monetization, executive_producers, presenters, coverage_segments, team_features, "
+        "seasonal_events, stat_highlights, critical_reception, audience_metrics, production_companies, "
+        "broadcast_info, distribution_info"
+    ),
+    ThrillerShowInfo: (
+        "title, tagline, show_summary, subgenre, narrative_structure, tone, themes, violence_level, "
+        "age_rating, season_count, episode_count, average_runtime_minutes, release_start_year, "
+        "release_end_year, creators, showrunners, consultants, investigators, major_cases, antagonists, "
+        "critical_reception, audience_metrics, production_companies, broadcast_info, distribution_info"
+    ),
+}
+
 
 @pytest.mark.parametrize("model_class", ALL_SHOW_MODELS)
 def test_show_model_has_required_attributes(model_class):
@@ -83,6 +153,15 @@ def test_show_model_table_sections_returns_list(model_class):
     assert isinstance(sections, (list, tuple))
 
 
+@pytest.mark.parametrize("model_class", ALL_SHOW_MODELS)
+def test_show_model_table_specs_name_list_fields(model_class):
+    """Test every declared table section points at a list field of its row model."""
+    assert model_class.table_specs
+    for _, attribute, row_model in model_class.table_specs:
+        assert attribute in model_class.model_fields
+        assert model_class.model_fields[attribute].annotation == list[row_model]
+
+
 @pytest.mark.parametrize("model_class", ALL_SHOW_MODELS)
 def test_show_model_extra_panels_returns_list(model_class):
     """Test that _extra_panels returns a list."""
@@ -161,6 +240,23 @@ def test_show_model_json_format_instructions(model_class):
     assert "JSON" in formatted or "json" in formatted
 
 
+@pytest.mark.parametrize("model_class", ALL_SHOW_MODELS)
+def test_show_model_json_format_keys_match_fields(model_class):
+    """Test the advertised JSON keys are generated from the model fields."""
+    text = model_class.json_format_instructions()
+    assert text.startswith(model_class.get_instructions())
+
+    advertised = text.rsplit("keys such as ", 1)[1].rstrip(".").split(", ")
+    assert advertised == [name for name, field in model_class.model_fields.items() if not field.exclude]
+
+
+@pytest.mark.parametrize("model_class", ALL_SHOW_MODELS)
+def test_show_model_json_format_keys_are_pinned(model_class):
+    """Test each show advertises exactly the pinned key list in the pinned order."""
+    text = model_class.json_format_instructions()
+    assert text.endswith(f"\nOUTPUT FORMAT:\nReturn JSON with keys such as {EXPECTED_SHOW_JSON_KEYS[model_class]}.")
+
+
 @pytest.mark.parametrize("model_class", ALL_SHOW_MODELS)
 def test_show_model_has_basic_fields(model_class):
     """Test that each show model has expected basic fields."""
@@ -108,6 +108,17 @@ class TestJsonModel:
         finally:
             Path(temp_path).unlink(missing_ok=True)
 
+    def test_json_model_table_schema_is_cached(self):
+        """Test show row schemas are built once and shared on render paths."""
+        from aiss.models.shows._base import BroadcastInfo
+
+        first = BroadcastInfo.table_schema()
+        second = BroadcastInfo.table_schema()
+        assert first == second
+        assert first is not second
+        assert all(a is b for a, b in zip(first, second))
+        assert BroadcastInfo.table_schema_shared() is BroadcastInfo.table_schema_shared()
+
 
 class TestShowFormatBase:
     """Test ShowFormatBase functionality."""
@@ -436,6 +447,19 @@ class TestShowFormatBase:
 
             os.unlink(temp_path)
 
+    def test_cast_member_info_to_json_keeps_unicode(self, tmp_path):
+        """Test to_json writes indented UTF-8 JSON matching to_dict."""
+        from aiss.models.movies._base import CastMemberInfo
+
+        instance = CastMemberInfo(character="Amélie", actor="Audrey Tautou", role="lead")
+        path = tmp_path / "cast.json"
+        instance.to_json(path)
+
+        text = path.read_text(encoding="utf-8")
+        assert "Amélie" in text
+        assert text.startswith('{\n  "character"')
+        assert json.loads(text) == instance.to_dict()
+
     def test_production_company_info_table_schema(self):
         """Test ProductionCompanyInfo table_schema."""
         from aiss.models.movies._base import ProductionCompanyInfo
@@ -750,6 +774,21 @@ class TestShowFormatBase:
         # Should be empty or minimal
         assert len(output) < 50
 
+    def test_base_movie_info_render_prints_once(self):
+        """Test render batches every section into a single console print."""
+        from aiss.models.movies._base import CastMemberInfo
+        from aiss.models.movies.drama_model import DramaMovieInfo
+
+        instance = DramaMovieInfo(
+            title="Test",
+            keywords=["grief"],
+            wikipedia_summary="Context",
+            cast=[CastMemberInfo(character="Lead", actor="Someone")],
+        )
+        console = Mock()
+        instance.render(console)
+        console.print.assert_called_once()
+
     def test_base_movie_info_render_wikipedia_summary(self, console):
         """Test BaseMovieInfo _render_wikipedia_summary with content."""
         from aiss.models.movies.drama_model import DramaMovieInfo
@@ -1399,3 +1438,279 @@ class TestGameFormatBase:
         studio3 = StudioProfile.from_json(json_path)
         assert studio3.name == "Test Studio"
         assert studio3.headquarters == "Seattle"
+
+    def test_game_format_json_round_trip(self, tmp_path):
+        """Test a nested game format survives a to_json/from_json round trip."""
+        from aiss.models.games import ActionAdventureGameInfo
+        from aiss.models.games._base import StudioProfile
+
+        game = ActionAdventureGameInfo(
+            title="Ōkami",
+            release_year=2006,
+            developers=[StudioProfile(name="Clover Studio", team_size=50)],
+            wikipedia_summary="runtime only",
+        )
+
+        json_path = tmp_path / "game.json"
+        game.to_json(json_path)
+        text = json_path.read_text(encoding="utf-8")
+        assert "Ōkami" in text
+        assert "wikipedia_summary" not in text
+
+        loaded = ActionAdventureGameInfo.from_json(json_path)
+        assert loaded.title == "Ōkami"
+        assert isinstance(loaded.developers[0], StudioProfile)
+        assert loaded.developers[0].team_size == 50
+
+    def test_game_format_trusted_load(self, tmp_path):
+        """Test from_json_trusted rebuilds nested game models without validation."""
+        from aiss.models.games import ActionAdventureGameInfo
+        from aiss.models.games._base import PlatformReleaseInfo, StudioProfile
+
+        game = ActionAdventureGameInfo(
+            title="Trusted",
+            developers=[StudioProfile(name="Studio A", team_size=10)],
+            platform_releases=[PlatformReleaseInfo(platform="PC")],
+        )
+        json_path = tmp_path / "trusted.json"
+        game.to_json(json_path)
+
+        loaded = ActionAdventureGameInfo.from_json_trusted(json_path)
+        assert loaded.title == "Trusted"
+        assert isinstance(loaded.developers[0], StudioProfile)
+        assert loaded.developers[0].team_size == 10
+        assert isinstance(loaded.platform_releases[0], PlatformReleaseInfo)
+        assert loaded == ActionAdventureGameInfo.from_json(json_path)
+
+    def test_game_row_trusted_load_drops_unknown_keys(self):
+        """Test leaf rows take the direct construct path and ignore unknown keys."""
+        from aiss.models.games._base import StudioProfile
+
+        row = StudioProfile.from_dict_trusted({"name": "Studio A", "unexpected": 1})
+        assert row == StudioProfile(name="Studio A")
+        assert row.model_fields_set == {"name"}
+        assert not hasattr(row, "unexpected")
+
+    def test_game_table_schema_is_cached(self):
+        """Test table_schema reuses cached columns but returns a fresh list."""
+        from aiss.models.games._base import StudioProfile
+
+        first = StudioProfile.table_schema()
+        second = StudioProfile.table_schema()
+        assert first == second
+        assert first is not second
+        assert all(a is b for a, b in zip(first, second))
+        assert StudioProfile.table_schema_shared() is StudioProfile.table_schema_shared()
+        assert StudioProfile.table_schema_shared() == tuple(first)
+        assert isinstance(StudioProfile.table_schema_shared(), tuple)
+
+    def test_game_nested_instances_are_not_copied(self):
+        """Test nested row instances are reused rather than revalidated."""
+        from aiss.models.games import ActionAdventureGameInfo
+        from aiss.models.games._base import StudioProfile
+
+        studio = StudioProfile(name="Shared")
+        game = ActionAdventureGameInfo(title="Reuse", developers=[studio])
+        assert game.developers[0] is studio
+
+    def test_game_format_summary_getters_precomputed(self):
+        """Test summary getters are resolved per class and skip missing attributes."""
+        from aiss.models.games._base import GameFormatBase
+
+        class _SummaryGame(GameFormatBase):
+            title: str = ""
+            core_loop: str = ""
+            game_summary: str = ""
+
+        assert len(_SummaryGame._summary_getters) == 2
+
+        instance = _SummaryGame(title="Loop", core_loop="  Explore  ", game_summary=" ")
+        title, lines, _ = instance._summary_panel()
+        assert title == "Loop"
+        assert lines == ["Explore"]
+        assert _SummaryGame()._summary_panel()[1] == ["(no summary provided)"]
+        assert _SummaryGame._summary_fallback is None
+
+    def test_game_format_summary_fallback_used_when_not_listed(self):
+        """Test game_summary is only consulted as a fallback when not already a summary attribute."""
+        from aiss.models.games._base import GameFormatBase
+
+        class _FallbackGame(GameFormatBase):
+            summary_attributes = ("core_loop",)
+            core_loop: str = ""
+            game_summary: str = ""
+
+        assert _FallbackGame._summary_fallback is not None
+        assert _FallbackGame(game_summary=" Fallback ")._summary_panel()[1] == ["Fallback"]
+
+    def test_game_row_models_are_frozen(self):
+        """Test row value objects reject mutation while formats stay mutable."""
+        from pydantic import ValidationError
+
+        from aiss.models.games import ActionAdventureGameInfo
+        from aiss.models.games._base import StudioProfile
+
+        studio = StudioProfile(name="Frozen")
+        with pytest.raises(ValidationError):
+            studio.name = "Changed"
+        assert StudioProfile.model_config["revalidate_instances"] == "never"
+
+        game = ActionAdventureGameInfo(title="Mutable")
+        game.wikipedia_summary = "ok"
+        assert game.wikipedia_summary == "ok"
+
+    def test_movie_row_models_are_frozen(self):
+        """Test movie helper rows reject mutation while movie formats stay mutable."""
+        from pydantic import ValidationError
+
+        from aiss.models.movies import DramaMovieInfo
+        from aiss.models.movies._base import CastMemberInfo
+
+        cast = CastMemberInfo(character="Lead", actor="Someone")
+        with pytest.raises(ValidationError):
+            cast.actor = "Someone else"
+
+        movie = DramaMovieInfo(title="Mutable")
+        movie.wikipedia_summary = "ok"
+        assert movie.wikipedia_summary == "ok"
+
+    def test_movie_row_table_schema_is_cached(self):
+        """Test movie row schemas are built once and shared on render paths."""
+        from aiss.models.movies._base import CastMemberInfo
+
+        first = CastMemberInfo.table_schema()
+        second = CastMemberInfo.table_schema()
+        assert first == second
+        assert first is not second
+        assert all(a is b for a, b in zip(first, second))
+        assert CastMemberInfo.table_schema_shared() is CastMemberInfo.table_schema_shared()
+
+    def test_nested_model_fields_unwraps_optional_annotations(self):
+        """Test the shared resolver finds row models behind optional list and union annotations."""
+        from pydantic import BaseModel
+
+        from aiss.models.movies._base import CastMemberInfo, MovieRowModel
+        from aiss.models.shared import nested_model_fields
+
+        class Holder(BaseModel):
+            cast: list[CastMemberInfo] | None = None
+            lead: CastMemberInfo | None = None
+            note: str | None = None
+
+        assert nested_model_fields(Holder, MovieRowModel) == (
+            ("cast", CastMemberInfo, True),
+            ("lead", CastMemberInfo, False),
+        )
+
+    def test_movie_format_trusted_load_rebuilds_optional_rows(self):
+        """Test from_dict_trusted rebuilds rows held in optional list fields."""
+        from aiss.models.movies._base import BaseMovieInfo, CastMemberInfo
+
+        class OptionalCastMovie(BaseMovieInfo):
+            cast: list[CastMemberInfo] | None = None
+
+        movie = OptionalCastMovie.from_dict_trusted({"title": "Trusted", "cast": [{"actor": "Actor"}]})
+        assert isinstance(movie.cast[0], CastMemberInfo)
+        assert movie.cast[0].actor == "Actor"
+
+    def test_game_format_render_prints_once(self, console):
+        """Test render emits all sections through a single console.print call."""
+        from unittest.mock import patch
+
+        from aiss.models.games import ActionAdventureGameInfo
+        from aiss.models.games._base import StudioProfile
+
+        game = ActionAdventureGameInfo(
+            title="Grouped",
+            developers=[StudioProfile(name="Studio G")],
+            wikipedia_summary="Context text",
+        )
+        with patch.object(console, "print", wraps=console.print) as mock_print:
+            game.render(console)
+
+        assert mock_print.call_count == 1
+        output = console.export_text()
+        assert "Grouped" in output
+        assert "Context text" in output
+        assert "Studio G" in output
+
+    def test_game_json_compact_and_pretty(self, tmp_path):
+        """Test to_json writes compact output by default and to_json_pretty indents."""
+        from aiss.models.games._base import StudioProfile
+
+        studio = StudioProfile(name="Compact", notable_credits=["One"])
+        compact_path = tmp_path / "compact.json"
+        pretty_path = tmp_path / "pretty.json"
+
+        studio.to_json(compact_path)
+        studio.to_json_pretty(pretty_path)
+
+        assert "\n" not in compact_path.read_text(encoding="utf-8")
+        assert '\n  "name": "Compact"' in pretty_path.read_text(encoding="utf-8")
+        assert StudioProfile.from_json(compact_path) == StudioProfile.from_json(pretty_path) == studio
+
+    def test_game_format_render_steps_use_overrides(self, console):
+        """Test render steps are bound per class and pick up overridden sections."""
+        from aiss.models.games._base import GameFormatBase
+
+        class _StepsGame(GameFormatBase):
+            title: str = "Steps"
+
+            def _extra_panels(self):
+                return [("Extra", "extra body", "")]
+
+        assert len(_StepsGame._render_steps) == 5
+        assert _StepsGame._render_steps[-1][1] is _StepsGame._extra_panels
+
+        _StepsGame().render(console)
+        output = console.export_text()
+        assert "Steps" in output
+        assert "extra body" in output
+
+    def test_game_format_extra_panel_specs(self):
+        """Test extra panel titles and styles come from the class-level specs."""
+        from aiss.models.games._base import GameFormatBase
+
+        class _PanelGame(GameFormatBase):
+            extra_panel_specs = (("Lore", "cyan"), ("Outlook", "magenta"))
+
+            def _extra_panel_bodies(self):
+                return ("lore body", "")
+
+        assert _PanelGame()._extra_panels() == [("Lore", "lore body", "cyan")]
+        assert GameFormatBase()._extra_panels() == []
+
+    def test_game_format_extra_panel_fields(self):
+        """Test panel bodies are built from the declared (label, attribute) lines."""
+        from aiss.models.games._base import GameFormatBase
+
+        class _FieldPanelGame(GameFormatBase):
+            extra_panel_specs = (("Pitch", "cyan"), ("Loop", "magenta"))
+            extra_panel_fields = (
+                (("Title", "title"), ("Summary", "game_summary")),
+                (("Core", "core_loop"),),
+            )
+
+            title: str = ""
+            game_summary: str = ""
+            core_loop: str = ""
+
+        game = _FieldPanelGame(title="Probe")
+        assert game._extra_panel_bodies() == ("Title: Probe", "")
+        assert game._extra_panels() == [("Pitch", "Title: Probe", "cyan")]
+
+    def test_game_format_summary_skips_non_str_attributes(self):
+        """Test summary attributes resolving to non-str values are skipped."""
+        from aiss.models.games._base import GameFormatBase
+
+        class _PropertySummaryGame(GameFormatBase):
+            summary_attributes = ("pitch_count", "game_summary")
+
+            game_summary: str = ""
+
+            @property
+            def pitch_count(self) -> int:
+                return 3
+
+        _, lines, _ = _PropertySummaryGame(game_summary="Loop")._summary_panel()
+        assert lines == ["Loop"]
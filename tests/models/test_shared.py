@@ -1,5 +1,6 @@
 """Tests for aiss.models.shared module."""
 
+from dataclasses import FrozenInstanceError
 from unittest.mock import patch
 
 import pytest
@@ -59,6 +60,13 @@ class TestComposeInstructions:
         bullet_count = result.count("\n-")
         assert bullet_count == 2
 
+    def test_compose_reuses_cached_result(self):
+        """Test repeated context lines reuse the composed string; unhashable items still work."""
+        additional = ["Cached context"]
+        first = compose_instructions("Base instructions", additional)
+        assert compose_instructions("Base instructions", tuple(additional)) is first
+        assert "- Valid" in compose_instructions("Base instructions", ["Valid", ["unhashable"]])
+
     def test_compose_strips_whitespace(self):
         """Test that additional info lines are stripped."""
         base = "Base"
@@ -241,6 +249,25 @@ class TestModelTypeResult:
         assert result.additional_info == ["Focus on action", "Include cast"]
         assert result.formatted_name == "Die Hard"
 
+    def test_model_type_result_from_find_request(self):
+        """Test from_find_request maps labels and fills minimal-schema defaults."""
+        from aiss.models.find_model import FindModelMinimalRequest, FindModelRequest
+
+        full = ModelTypeResult.from_find_request(
+            FindModelRequest(find_model="horror_movie", formatted_name="Alien", description="Space horror", additional_info=["1979"])
+        )
+        assert full.model_type is ModelType.HORROR_MOVIE
+        assert full.description == "Space horror"
+        assert full.additional_info == ["1979"]
+
+        minimal = ModelTypeResult.from_find_request(FindModelMinimalRequest(find_model="news_informational", formatted_name="PM"))
+        assert minimal.model_type is ModelType.NEWS_INFORMATIONAL
+        assert minimal.description == ""
+        assert minimal.additional_info == []
+
+        with pytest.raises(ValueError):
+            ModelTypeResult.from_find_request(FindModelMinimalRequest(find_model="not_a_label"))
+
 
 class TestTableSchema:
     """Tests for TableSchema dataclass."""
@@ -268,3 +295,10 @@ class TestTableSchema:
         assert schema.justify == "right"
         assert schema.formatter is formatter
         assert schema.formatter("hello") == "HELLO"
+
+    def test_schema_is_immutable(self):
+        """Test TableSchema rejects attribute assignment so cached layouts can be shared."""
+        schema = TableSchema(name="test", header="Test")
+
+        with pytest.raises(FrozenInstanceError):
+            schema.header = "Changed"
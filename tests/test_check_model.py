@@ -1,12 +1,13 @@
 """Tests for check_model module."""
 
-from unittest.mock import Mock, patch
+import asyncio
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 from openai import OpenAI, Timeout
 
-from aiss.check_model import find_model_from_input
-from aiss.models import FindModelRequest, ModelType, ModelTypeResult
+from aiss.check_model import find_model_from_input, find_model_from_input_async, find_models_batch
+from aiss.models import FindModelMinimalRequest, FindModelRequest, ModelType, ModelTypeResult
 
 
 def test_module_import():
@@ -225,3 +226,192 @@ class TestFindModelFromInput:
         instructions = call_args.kwargs["instructions"]
         # Should contain model type options
         assert "movie" in instructions.lower() or "show" in instructions.lower() or "game" in instructions.lower()
+
+    def test_find_model_prompt_prefix_is_stable(self, mock_client, console):
+        """Test requests share byte-identical instructions and a prompt cache key."""
+        mock_client.responses.parse.return_value = Mock(
+            output_parsed=FindModelRequest(find_model="drama", formatted_name="X", additional_info=[])
+        )
+
+        find_model_from_input("first", mock_client, console)
+        find_model_from_input("second", mock_client, console)
+
+        first, second = (call.kwargs for call in mock_client.responses.parse.call_args_list)
+        assert first["instructions"] is second["instructions"]
+        assert first["prompt_cache_key"] == second["prompt_cache_key"]
+        assert first["input"].endswith("\n\n`first`")
+        assert first["input"][: -len("first`")] == second["input"][: -len("second`")]
+
+    def test_find_model_two_stage(self, mock_client, console):
+        """Test two-stage mode formats the plain-text answer with the small model."""
+        mock_client.responses.create.return_value = Mock(output_text="shooter_game: Halo")
+        mock_client.responses.parse.return_value = Mock(
+            output_parsed=FindModelRequest(find_model="shooter_game", formatted_name="Halo", additional_info=[])
+        )
+
+        result = find_model_from_input("Halo", mock_client, console, two_stage=True)
+
+        assert result.model_type == ModelType.SHOOTER_GAME
+        create_kwargs = mock_client.responses.create.call_args.kwargs
+        assert "Halo" in create_kwargs["input"]
+        assert "text_format" not in create_kwargs
+        parse_kwargs = mock_client.responses.parse.call_args.kwargs
+        assert parse_kwargs["model"] == "gpt-4.1-mini"
+        assert parse_kwargs["input"] == "shooter_game: Halo"
+
+    def test_find_model_minimal_schema(self, mock_client, console):
+        """Test minimal mode requests the reduced schema and fills defaults."""
+        mock_client.responses.parse.return_value = Mock(
+            output_parsed=FindModelMinimalRequest(find_model="drama", formatted_name="The Wire")
+        )
+
+        result = find_model_from_input("The Wire", mock_client, console, minimal=True)
+
+        assert mock_client.responses.parse.call_args.kwargs["text_format"] is FindModelMinimalRequest
+        assert result.formatted_name == "The Wire"
+        assert result.description == ""
+        assert result.additional_info == []
+
+    def test_find_model_cache_round_trip(self, mock_client, console, tmp_path, monkeypatch):
+        """Test cached results are written to disk and reused without an API call."""
+        from aiss import check_model
+
+        monkeypatch.setattr(check_model, "_CACHE_DIR", tmp_path)
+        mock_client.responses.parse.return_value = Mock(
+            output_parsed=FindModelRequest(find_model="comedy", formatted_name="Seinfeld", additional_info=["NBC"])
+        )
+
+        first = find_model_from_input("Seinfeld", mock_client, console, cache=True)
+        assert len(list(tmp_path.glob("*.json"))) == 1
+
+        second = find_model_from_input("Seinfeld", mock_client, console, cache=True)
+
+        mock_client.responses.parse.assert_called_once()
+        assert second.model_type == first.model_type == ModelType.COMEDY
+        assert second.additional_info == ["NBC"]
+
+        second.additional_info.append("mutated")
+        assert find_model_from_input("Seinfeld", mock_client, console, cache=True).additional_info == ["NBC"]
+
+    def test_find_model_cache_sees_overwrites(self, mock_client, console, tmp_path, monkeypatch):
+        """Test a stored result replaces the previous entry for later lookups."""
+        from aiss import check_model
+
+        monkeypatch.setattr(check_model, "_CACHE_DIR", tmp_path)
+        check_model._store_result("Seinfeld", False, False, ModelTypeResult(ModelType.COMEDY, "", "Seinfeld"))
+        assert find_model_from_input("Seinfeld", mock_client, console, cache=True).model_type == ModelType.COMEDY
+
+        check_model._store_result("Seinfeld", False, False, ModelTypeResult(ModelType.DRAMA, "", "Seinfeld"))
+        assert find_model_from_input("Seinfeld", mock_client, console, cache=True).model_type == ModelType.DRAMA
+        mock_client.responses.parse.assert_not_called()
+
+    def test_find_model_cache_is_keyed_by_two_stage(self, mock_client, console, tmp_path, monkeypatch):
+        """Test single-stage and two-stage classifications are cached separately."""
+        from aiss import check_model
+
+        monkeypatch.setattr(check_model, "_CACHE_DIR", tmp_path)
+        mock_client.responses.create.return_value = Mock(output_text="drama: The Wire")
+        mock_client.responses.parse.return_value = Mock(
+            output_parsed=FindModelRequest(find_model="drama", formatted_name="The Wire")
+        )
+
+        find_model_from_input("The Wire", mock_client, console, cache=True)
+        find_model_from_input("The Wire", mock_client, console, two_stage=True, cache=True)
+
+        assert mock_client.responses.parse.call_count == 2
+        mock_client.responses.create.assert_called_once()
+        assert len(list(tmp_path.glob("*.json"))) == 2
+
+    def test_find_model_cache_skips_failed_parse(self, mock_client, console, tmp_path, monkeypatch):
+        """Test failed classifications are not cached."""
+        from aiss import check_model
+
+        monkeypatch.setattr(check_model, "_CACHE_DIR", tmp_path)
+        mock_client.responses.parse.return_value = Mock(output_parsed=None)
+
+        assert find_model_from_input("???", mock_client, console, cache=True) is None
+        assert not list(tmp_path.glob("*.json"))
+
+
+class TestClassificationClients:
+    """Test the pooled client factories."""
+
+    def test_make_classification_client(self, monkeypatch):
+        """Test the sync factory wires a pooled httpx client."""
+        from aiss.check_model import make_classification_client
+
+        monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+        client = make_classification_client()
+
+        assert isinstance(client, OpenAI)
+        assert client.timeout.connect == 6.0
+        client.close()
+
+    def test_make_async_classification_client(self, monkeypatch):
+        """Test the async factory returns an AsyncOpenAI client."""
+        from openai import AsyncOpenAI
+
+        from aiss.check_model import make_async_classification_client
+
+        monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+        client = make_async_classification_client()
+
+        assert isinstance(client, AsyncOpenAI)
+        asyncio.run(client.close())
+
+
+class TestFindModelAsync:
+    """Test the async classification helpers."""
+
+    @staticmethod
+    def _async_client(*parsed):
+        client = Mock()
+        client.responses = Mock()
+        client.responses.parse = AsyncMock(side_effect=[Mock(output_parsed=item) for item in parsed])
+        return client
+
+    def test_find_model_async_single(self, console):
+        """Test the async variant returns a ModelTypeResult."""
+        client = self._async_client(FindModelRequest(find_model="shooter_game", formatted_name="Halo", additional_info=[]))
+
+        result = asyncio.run(find_model_from_input_async("Halo", client, console, asyncio.Semaphore(1)))
+
+        assert result.model_type == ModelType.SHOOTER_GAME
+        assert result.formatted_name == "Halo"
+        call_args = client.responses.parse.call_args
+        assert "Halo" in call_args.kwargs["input"]
+        assert call_args.kwargs["text_format"] == FindModelRequest
+
+    def test_find_model_async_failed_parse(self, console):
+        """Test the async variant returns None when parsing fails."""
+        client = self._async_client(None)
+
+        result = asyncio.run(find_model_from_input_async("???", client, console, asyncio.Semaphore(1)))
+
+        assert result is None
+        assert "Failed to parse" in console.export_text()
+
+    def test_find_models_batch_preserves_order(self, console):
+        """Test batch classification returns results in input order."""
+        client = self._async_client(
+            FindModelRequest(find_model="drama_movie", formatted_name="First", additional_info=[]),
+            FindModelRequest(find_model="comedy", formatted_name="Second", additional_info=[]),
+        )
+
+        results = asyncio.run(find_models_batch(["first", "second"], client, console, concurrency=2))
+
+        assert [r.formatted_name for r in results] == ["First", "Second"]
+        assert client.responses.parse.await_count == 2
+
+    def test_find_models_batch_returns_exceptions(self, console):
+        """Test a failing request does not abort the batch."""
+        client = Mock()
+        client.responses = Mock()
+        client.responses.parse = AsyncMock(
+            side_effect=[RuntimeError("boom"), Mock(output_parsed=FindModelRequest(find_model="sports", formatted_name="MOTD", additional_info=[]))]
+        )
+
+        results = asyncio.run(find_models_batch(["bad", "good"], client, console, concurrency=1))
+
+        assert isinstance(results[0], RuntimeError)
+        assert results[1].model_type == ModelType.SPORTS
@@ -71,3 +71,57 @@ def test_drama_movie_from_dict(sample_movie):
     assert isinstance(m2.cast[0], CastMemberInfo)
     assert isinstance(m2.production_companies[0], MovieProductionCompanyInfo)
     assert isinstance(m2.box_office, BoxOfficeInfo)
+
+
+def test_lazy_exports_match_subpackages():
+    """Test the lazily exported names mirror each subpackage's __all__."""
+    from aiss import models
+    from aiss.models import games, movies, shows
+
+    assert models._games_all == games.__all__
+    assert models._movies_all == movies.__all__
+    assert models._shows_all == shows.__all__
+    assert list(games._LAZY) == games.__all__
+    assert models.ProductionCompanyInfo is shows.ProductionCompanyInfo
+    assert models.DramaMovieInfo is movies.DramaMovieInfo
+
+
+def test_models_import_does_not_load_formats():
+    """Test importing the classification types leaves format packages unloaded."""
+    import subprocess
+    import sys
+
+    code = (
+        "import sys; from aiss.models import FindModelRequest, ModelType; "
+        "print(any(m in sys.modules for m in ('aiss.models.games', 'aiss.models.movies', 'aiss.models.shows')))"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "False"
+
+
+def test_game_format_import_does_not_load_classification_models():
+    """Test importing one game format skips the classification request models."""
+    import subprocess
+    import sys
+
+    code = (
+        "import sys; import aiss.models.games.mmo_online_model; "
+        "print('aiss.models.find_model' in sys.modules, 'aiss.models.movies' in sys.modules)"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "False False"
+
+
+def test_find_model_json_schema_is_cached_copy():
+    """Test the classification schema is cached but handed out as independent copies."""
+    from pydantic import BaseModel
+
+    from aiss.models import FindModelMinimalRequest, FindModelRequest
+
+    first = FindModelRequest.model_json_schema()
+    first["properties"].clear()
+    second = FindModelRequest.model_json_schema()
+
+    assert second == BaseModel.model_json_schema.__func__(FindModelRequest)
+    assert list(FindModelMinimalRequest.model_json_schema()["properties"]) == ["find_model", "formatted_name"]
+    assert FindModelRequest.model_json_schema(mode="serialization")["title"] == "FindModelRequest"
@@ -11,13 +11,13 @@ from aiss.run_queries import run_the_query
 class TestRunTheQuery:
     """Test run_the_query function."""
 
-    @patch("aiss.run_queries.OpenAI")
+    @patch("aiss.run_queries.make_classification_client")
     @patch("aiss.run_queries.find_model_from_input")
     @patch("aiss.run_queries.get_parsed_response")
-    def test_run_query_parsed_mode(self, mock_get_parsed, mock_find_model, mock_openai_class):
+    def test_run_query_parsed_mode(self, mock_get_parsed, mock_find_model, mock_make_client):
         """Test running query in PARSED mode."""
         mock_client = Mock()
-        mock_openai_class.return_value = mock_client
+        mock_make_client.return_value = mock_client
 
         model_result = ModelTypeResult(
             model_type="movie",
@@ -35,13 +35,13 @@ class TestRunTheQuery:
         assert call_args[0] == model_result
         assert call_args[1] == mock_client
 
-    @patch("aiss.run_queries.OpenAI")
+    @patch("aiss.run_queries.make_classification_client")
     @patch("aiss.run_queries.find_model_from_input")
     @patch("aiss.run_queries.get_json_response")
-    def test_run_query_json_mode(self, mock_get_json, mock_find_model, mock_openai_class):
+    def test_run_query_json_mode(self, mock_get_json, mock_find_model, mock_make_client):
         """Test running query in JSON mode."""
         mock_client = Mock()
-        mock_openai_class.return_value = mock_client
+        mock_make_client.return_value = mock_client
 
         model_result = ModelTypeResult(
             model_type="game",
@@ -55,13 +55,13 @@ class TestRunTheQuery:
         mock_find_model.assert_called_once()
         mock_get_json.assert_called_once()
 
-    @patch("aiss.run_queries.OpenAI")
+    @patch("aiss.run_queries.make_classification_client")
     @patch("aiss.run_queries.find_model_from_input")
     @patch("aiss.run_queries.get_text_response")
-    def test_run_query_text_mode(self, mock_get_text, mock_find_model, mock_openai_class):
+    def test_run_query_text_mode(self, mock_get_text, mock_find_model, mock_make_client):
         """Test running query in TEXT mode."""
         mock_client = Mock()
-        mock_openai_class.return_value = mock_client
+        mock_make_client.return_value = mock_client
 
         model_result = ModelTypeResult(
             model_type="show",
@@ -75,13 +75,13 @@ class TestRunTheQuery:
         mock_find_model.assert_called_once()
         mock_get_text.assert_called_once()
 
-    @patch("aiss.run_queries.OpenAI")
+    @patch("aiss.run_queries.make_classification_client")
     @patch("aiss.run_queries.find_model_from_input")
     @patch("aiss.run_queries.get_parsed_response")
-    def test_run_query_string_parsed(self, mock_get_parsed, mock_find_model, mock_openai_class):
+    def test_run_query_string_parsed(self, mock_get_parsed, mock_find_model, mock_make_client):
         """Test running query with string 'parsed' mode."""
         mock_client = Mock()
-        mock_openai_class.return_value = mock_client
+        mock_make_client.return_value = mock_client
 
         model_result = ModelTypeResult(
             model_type="movie",
@@ -94,13 +94,13 @@ class TestRunTheQuery:
 
         mock_get_parsed.assert_called_once()
 
-    @patch("aiss.run_queries.OpenAI")
+    @patch("aiss.run_queries.make_classification_client")
     @patch("aiss.run_queries.find_model_from_input")
     @patch("aiss.run_queries.get_json_response")
-    def test_run_query_string_json(self, mock_get_json, mock_find_model, mock_openai_class):
+    def test_run_query_string_json(self, mock_get_json, mock_find_model, mock_make_client):
         """Test running query with string 'json' mode."""
         mock_client = Mock()
-        mock_openai_class.return_value = mock_client
+        mock_make_client.return_value = mock_client
 
         model_result = ModelTypeResult(
             model_type="game",
@@ -113,13 +113,13 @@ class TestRunTheQuery:
 
         mock_get_json.assert_called_once()
 
-    @patch("aiss.run_queries.OpenAI")
+    @patch("aiss.run_queries.make_classification_client")
     @patch("aiss.run_queries.find_model_from_input")
     @patch("aiss.run_queries.get_text_response")
-    def test_run_query_string_text(self, mock_get_text, mock_find_model, mock_openai_class):
+    def test_run_query_string_text(self, mock_get_text, mock_find_model, mock_make_client):
         """Test running query with string 'text' mode."""
         mock_client = Mock()
-        mock_openai_class.return_value = mock_client
+        mock_make_client.return_value = mock_client
 
         model_result = ModelTypeResult(
             model_type="show",
@@ -132,13 +132,13 @@ class TestRunTheQuery:
 
         mock_get_text.assert_called_once()
 
-    @patch("aiss.run_queries.OpenAI")
+    @patch("aiss.run_queries.make_classification_client")
     @patch("aiss.run_queries.find_model_from_input")
     @patch("aiss.run_queries.get_parsed_response")
-    def test_run_query_none_result_type_defaults_to_parsed(self, mock_get_parsed, mock_find_model, mock_openai_class):
+    def test_run_query_none_result_type_defaults_to_parsed(self, mock_get_parsed, mock_find_model, mock_make_client):
         """Test that None result_type defaults to PARSED."""
         mock_client = Mock()
-        mock_openai_class.return_value = mock_client
+        mock_make_client.return_value = mock_client
 
         model_result = ModelTypeResult(
             model_type="movie",
@@ -151,8 +151,8 @@ class TestRunTheQuery:
 
         mock_get_parsed.assert_called_once()
 
-    @patch("aiss.run_queries.OpenAI")
-    def test_run_query_empty_input(self, mock_openai_class):
+    @patch("aiss.run_queries.make_classification_client")
+    def test_run_query_empty_input(self, mock_make_client):
         """Test running query with empty input text."""
         # Use real console since we're not actually rendering
         with patch("aiss.run_queries.Console") as mock_console_class:
@@ -165,8 +165,8 @@ class TestRunTheQuery:
             mock_console.print.assert_called_once()
             assert "Error" in str(mock_console.print.call_args)
 
-    @patch("aiss.run_queries.OpenAI")
-    def test_run_query_whitespace_only_input(self, mock_openai_class):
+    @patch("aiss.run_queries.make_classification_client")
+    def test_run_query_whitespace_only_input(self, mock_make_client):
         """Test running query with whitespace-only input."""
         with patch("aiss.run_queries.Console") as mock_console_class:
             mock_console = Mock()
@@ -178,19 +178,19 @@ class TestRunTheQuery:
             mock_console.print.assert_called_once()
             assert "Error" in str(mock_console.print.call_args)
 
-    @patch("aiss.run_queries.OpenAI")
-    def test_run_query_invalid_result_type(self, mock_openai_class):
+    @patch("aiss.run_queries.make_classification_client")
+    def test_run_query_invalid_result_type(self, mock_make_client):
         """Test running query with invalid result type raises ValueError."""
         # This should raise ValueError when trying to convert to ResultType
         with pytest.raises(ValueError, match="is not a valid ResultType"):
             run_the_query("Test Input", "invalid_mode")
 
-    @patch("aiss.run_queries.OpenAI")
+    @patch("aiss.run_queries.make_classification_client")
     @patch("aiss.run_queries.find_model_from_input")
-    def test_run_query_model_detection_fails(self, mock_find_model, mock_openai_class):
+    def test_run_query_model_detection_fails(self, mock_find_model, mock_make_client):
         """Test running query when model detection fails."""
         mock_client = Mock()
-        mock_openai_class.return_value = mock_client
+        mock_make_client.return_value = mock_client
 
         mock_find_model.return_value = None
 
@@ -200,13 +200,13 @@ class TestRunTheQuery:
         # Should have called find_model and returned early
         mock_find_model.assert_called_once()
 
-    @patch("aiss.run_queries.OpenAI")
+    @patch("aiss.run_queries.make_classification_client")
     @patch("aiss.run_queries.find_model_from_input")
     @patch("aiss.run_queries.get_parsed_response")
-    def test_run_query_strips_input_whitespace(self, mock_get_parsed, mock_find_model, mock_openai_class):
+    def test_run_query_strips_input_whitespace(self, mock_get_parsed, mock_find_model, mock_make_client):
         """Test that input text whitespace is stripped."""
         mock_client = Mock()
-        mock_openai_class.return_value = mock_client
+        mock_make_client.return_value = mock_client
 
         model_result = ModelTypeResult(
             model_type="movie",
@@ -221,13 +221,13 @@ class TestRunTheQuery:
         call_args = mock_find_model.call_args[0]
         assert call_args[0] == "Test Input"
 
-    @patch("aiss.run_queries.OpenAI")
+    @patch("aiss.run_queries.make_classification_client")
     @patch("aiss.run_queries.find_model_from_input")
     @patch("aiss.run_queries.get_json_response")
-    def test_run_query_uppercase_string_mode(self, mock_get_json, mock_find_model, mock_openai_class):
+    def test_run_query_uppercase_string_mode(self, mock_get_json, mock_find_model, mock_make_client):
         """Test running query with uppercase string mode."""
         mock_client = Mock()
-        mock_openai_class.return_value = mock_client
+        mock_make_client.return_value = mock_client
 
         model_result = ModelTypeResult(
             model_type="movie",
@@ -240,13 +240,13 @@ class TestRunTheQuery:
 
         mock_get_json.assert_called_once()
 
-    @patch("aiss.run_queries.OpenAI")
+    @patch("aiss.run_queries.make_classification_client")
     @patch("aiss.run_queries.find_model_from_input")
     @patch("aiss.run_queries.get_text_response")
-    def test_run_query_mixed_case_string_mode(self, mock_get_text, mock_find_model, mock_openai_class):
+    def test_run_query_mixed_case_string_mode(self, mock_get_text, mock_find_model, mock_make_client):
         """Test running query with mixed case string mode."""
         mock_client = Mock()
-        mock_openai_class.return_value = mock_client
+        mock_make_client.return_value = mock_client
 
         model_result = ModelTypeResult(
             model_type="show",
@@ -259,14 +259,14 @@ class TestRunTheQuery:
 
         mock_get_text.assert_called_once()
 
-    @patch("aiss.run_queries.OpenAI")
+    @patch("aiss.run_queries.make_classification_client")
     @patch("aiss.run_queries.find_model_from_input")
     @patch("aiss.run_queries.get_parsed_response")
     @patch("aiss.run_queries.Progress")
-    def test_run_query_progress_ui_created(self, mock_progress_class, mock_get_parsed, mock_find_model, mock_openai_class):
+    def test_run_query_progress_ui_created(self, mock_progress_class, mock_get_parsed, mock_find_model, mock_make_client):
         """Test that Progress UI is created and used."""
         mock_client = Mock()
-        mock_openai_class.return_value = mock_client
+        mock_make_client.return_value = mock_client
 
         model_result = ModelTypeResult(
             model_type="movie",
@@ -285,13 +285,13 @@ class TestRunTheQuery:
         assert mock_progress.update.called
         assert mock_progress.stop.called
 
-    @patch("aiss.run_queries.OpenAI")
+    @patch("aiss.run_queries.make_classification_client")
     @patch("aiss.run_queries.find_model_from_input")
     @patch("aiss.run_queries.get_parsed_response")
-    def test_run_query_with_additional_info(self, mock_get_parsed, mock_find_model, mock_openai_class):
+    def test_run_query_with_additional_info(self, mock_get_parsed, mock_find_model, mock_make_client):
         """Test running query with model result containing additional info."""
         mock_client = Mock()
-        mock_openai_class.return_value = mock_client
+        mock_make_client.return_value = mock_client
 
         model_result = ModelTypeResult(
             model_type="movie",
@@ -13,7 +13,9 @@ from rich.console import Console
 from aiss.models.shared import TableSchema
 from aiss.utils import (
     _coerce_numeric,
+    build_table_from_schema,
     format_decimal,
+    format_list,
     format_money,
     format_number,
     format_percentage,
@@ -285,6 +287,18 @@ class TestFormatNumber:
         assert format_number(100.10) == "100.1"
         assert format_number(100.00) == "100"
 
+    def test_format_number_memoises_numeric_inputs(self):
+        """Test repeated numeric inputs hit the cache and other inputs bypass it."""
+        from aiss import utils
+
+        utils._format_number_cached.cache_clear()
+        assert format_number(35.5) == "35.5"
+        assert format_number(35.5) == "35.5"
+        assert format_number("35.5") == "35.5"
+        assert format_number(True) == "1"
+        info = utils._format_number_cached.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
+
 
 class TestFormatDecimal:
     """Tests for format_decimal formatter."""
@@ -368,6 +382,31 @@ class TestFormatRuntimeMinutes:
         """Test invalid input returns string representation."""
         assert format_runtime_minutes("invalid") == "invalid"
 
+    def test_format_runtime_minutes_memoises_numeric_inputs(self):
+        """Test repeated numeric runtimes hit the cache and strings bypass it."""
+        from aiss import utils
+
+        utils._format_runtime_minutes_cached.cache_clear()
+        assert format_runtime_minutes(95) == "95 min"
+        assert format_runtime_minutes(95) == "95 min"
+        assert format_runtime_minutes("95") == "95 min"
+        info = utils._format_runtime_minutes_cached.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
+
+
+class TestFormatList:
+    """Tests for format_list helper."""
+
+    def test_format_list_joins_values(self):
+        """Test values are joined with the separator."""
+        assert format_list(["PC", "PS5"]) == "PC, PS5"
+        assert format_list(("a", "b"), sep=" / ") == "a / b"
+
+    def test_format_list_empty(self):
+        """Test empty or missing values render as a dash."""
+        assert format_list([]) == "-"
+        assert format_list(None) == "-"
+
 
 class TestRenderTableFromSchema:
     """Tests for render_table_from_schema function."""
@@ -521,6 +560,30 @@ class TestRenderTableFromSchema:
         output = console.export_text()
         assert "test" in output
 
+    def test_build_table_returns_unprinted_table(self):
+        """Test build_table_from_schema returns a populated Table without printing."""
+        from rich.table import Table
+
+        schema = [TableSchema(name="name", header="Name")]
+
+        table = build_table_from_schema("Built", schema, [{"name": "Alice"}, {"name": "Bob"}])
+
+        assert isinstance(table, Table)
+        assert table.row_count == 2
+        assert table.title == "Built"
+
+    def test_build_table_formatter_receives_raw_list(self):
+        """Test list cells are joined only when no formatter takes over."""
+        schema = [
+            TableSchema(name="tags", header="Tags"),
+            TableSchema(name="tags", header="Count", formatter=len),
+        ]
+
+        table = build_table_from_schema("Lists", schema, [{"tags": ["a", "b"]}])
+
+        assert list(table.columns[0].cells) == ["a, b"]
+        assert list(table.columns[1].cells) == ["2"]
+
     def test_render_table_with_none_name(self):
         """Test table rendering with None as name (no attribute lookup)."""
         console = Console(record=True, width=120)